@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for configur8.
+
+Run with ``python -m benchmarks --help``.
+"""
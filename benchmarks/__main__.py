@@ -0,0 +1,158 @@
+"""
+Run the configur8 benchmarks.
+
+Example:
+
+```shell
+python -m benchmarks --size 1000 --output results.json
+python -m benchmarks --baseline results.json --threshold 0.2
+```
+
+Results are written as JSON. When ``--baseline`` is given, any case that is
+slower than its baseline by more than ``--threshold`` (a fraction) fails the
+run with exit status 1.
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import timeit
+import typing as t
+
+from configur8 import __version__
+
+from benchmarks.cases import CASES
+
+Results = t.Dict[str, t.Any]
+
+
+def run_case(
+    name: str,
+    size: int,
+    repeat: int,
+) -> t.Dict[str, t.Any]:
+    func = CASES[name](size)
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings = [x / number for x in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        "size": size,
+        "number": number,
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+    }
+
+
+def run(
+    size: int,
+    repeat: int,
+    patterns: t.List[str],
+) -> Results:
+    names = [
+        name
+        for name in CASES
+        if not patterns
+        or any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+    ]
+
+    results = {}
+
+    for name in names:
+        results[name] = run_case(name, size, repeat)
+
+        print(
+            f"{name:<32} {results[name]['min'] * 1e6:>14.2f} us",
+            file=sys.stderr,
+        )
+
+    return {
+        "configur8": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "cases": results,
+    }
+
+
+def compare(
+    results: Results,
+    baseline: Results,
+    threshold: float,
+) -> t.List[str]:
+    """
+    Returns a description of each case that regressed against ``baseline``.
+    """
+    regressions = []
+
+    for name, result in results["cases"].items():
+        try:
+            expected = baseline["cases"][name]
+        except KeyError:
+            continue
+
+        if expected["size"] != result["size"]:
+            continue
+
+        ratio = result["min"] / expected["min"]
+
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline")
+
+    return regressions
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "cases",
+        nargs="*",
+        help="glob patterns of cases to run, e.g. 'cfg.into.*'",
+    )
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed slowdown against the baseline, e.g. 0.2 for 20%%",
+    )
+    parser.add_argument("--list", action="store_true", help="list cases")
+
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+
+        return 0
+
+    results = run(args.size, args.repeat, args.cases)
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+
+    regressions = compare(results, baseline, args.threshold)
+
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
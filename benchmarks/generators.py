@@ -0,0 +1,172 @@
+"""
+Synthetic config classes and data of a configurable size.
+
+Each generator returns a ``(config_class, data)`` tuple where ``data`` is the
+decoded form that ``cfg.into`` accepts.
+"""
+
+import typing as t
+
+__all__ = (
+    "aliased",
+    "deep",
+    "list_heavy",
+    "union_heavy",
+    "wide",
+)
+
+Generated = t.Tuple[t.Type, t.Dict[str, t.Any]]
+
+SCALARS: t.Tuple[t.Tuple[t.Type, t.Any], ...] = (
+    (str, "value"),
+    (int, 42),
+    (float, 4.2),
+    (bool, True),
+)
+
+
+def make_class(
+    name: str,
+    annotations: t.Dict[str, t.Any],
+    bases: t.Tuple[t.Type, ...] = (),
+) -> t.Type:
+    return type(name, bases, {"__annotations__": annotations})
+
+
+def wide(size: int) -> Generated:
+    """
+    A single class with ``size`` scalar fields.
+    """
+    annotations = {}
+    data = {}
+
+    for i in range(size):
+        type_, value = SCALARS[i % len(SCALARS)]
+
+        annotations[f"field_{i}"] = type_
+        data[f"field_{i}"] = value
+
+    return make_class("Wide", annotations), data
+
+
+def deep(size: int) -> Generated:
+    """
+    A chain of ``size`` nested classes, each with a few scalar fields.
+    """
+    config = make_class("Leaf", {"name": str, "value": int})
+    data: t.Dict[str, t.Any] = {"name": "leaf", "value": 0}
+
+    for i in range(size):
+        config = make_class(
+            f"Level{i}",
+            {"name": str, "value": int, "child": config},
+        )
+        data = {"name": f"level{i}", "value": i, "child": data}
+
+    return config, data
+
+
+def list_heavy(size: int) -> Generated:
+    """
+    ``size`` routes, each holding nested lists and dicts of scalars.
+    """
+    upstream = make_class("Upstream", {"host": str, "port": int})
+    route = make_class(
+        "Route",
+        {
+            "path": str,
+            "weights": t.List[float],
+            "upstreams": t.List[upstream],  # type: ignore[valid-type]
+            "headers": t.Dict[str, str],
+        },
+    )
+    config = make_class(
+        "ListHeavy",
+        {"routes": t.List[route]},  # type: ignore[valid-type]
+    )
+
+    data = {
+        "routes": [
+            {
+                "path": f"/route/{i}",
+                "weights": [0.1, 0.2, 0.3, 0.4],
+                "upstreams": [
+                    {"host": f"host-{i}-{j}", "port": 8000 + j}
+                    for j in range(3)
+                ],
+                "headers": {"x-route": str(i), "x-team": "core"},
+            }
+            for i in range(size)
+        ],
+    }
+
+    return config, data
+
+
+def union_heavy(size: int) -> Generated:
+    """
+    ``size`` list entries typed as a union, all matching the last member.
+    """
+    members = [
+        make_class(f"Member{i}", {f"kind_{i}": str, "weight": int})
+        for i in range(4)
+    ]
+    union = t.Union[tuple(members)]  # type: ignore[valid-type]
+    config = make_class(
+        "UnionHeavy",
+        {"items": t.List[union]},  # type: ignore[valid-type]
+    )
+
+    data = {"items": [{"kind_3": "x", "weight": i} for i in range(size)]}
+
+    return config, data
+
+
+def aliased(size: int) -> Generated:
+    """
+    ``size`` services sharing the same ``defaults`` object, which
+    ``yaml.safe_dump`` writes as an anchor and ``size`` aliases.
+    """
+    limits = make_class("Limits", {"cpu": float, "memory": int})
+    defaults = make_class(
+        "Defaults",
+        {
+            "timeout": int,
+            "retries": int,
+            "limits": limits,
+            "tags": t.List[str],
+            "env": t.Dict[str, str],
+        },
+    )
+    service = make_class(
+        "Service",
+        {"name": str, "defaults": defaults},
+    )
+    config = make_class(
+        "Aliased",
+        {"services": t.List[service]},  # type: ignore[valid-type]
+    )
+
+    shared = {
+        "timeout": 30,
+        "retries": 3,
+        "limits": {"cpu": 0.5, "memory": 512},
+        "tags": ["team", "tier", "region"],
+        "env": {f"KEY_{i}": f"value-{i}" for i in range(20)},
+    }
+    data = {
+        "services": [
+            {"name": f"service-{i}", "defaults": shared} for i in range(size)
+        ],
+    }
+
+    return config, data
+
+
+SHAPES: t.Dict[str, t.Callable[[int], Generated]] = {
+    "wide": wide,
+    "deep": deep,
+    "list_heavy": list_heavy,
+    "union_heavy": union_heavy,
+    "aliased": aliased,
+}
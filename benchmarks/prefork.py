@@ -0,0 +1,210 @@
+"""
+Measure the memory each pre-forked worker uses for a shared config.
+
+Example:
+
+```shell
+python -m benchmarks.prefork --size 20000 --workers 8
+```
+
+A master process forks ``--workers`` workers in each of these modes:
+
+* ``reload``: every worker calls ``cfg.load`` itself.
+* ``inherit``: the master calls ``cfg.load`` and the workers inherit it.
+* ``preload``: the master calls ``cfg.preload`` and the workers inherit it.
+
+Each worker reads every value in the config and runs a garbage collection,
+then reports its ``Rss``, ``Pss`` and ``Private_Dirty`` memory from
+``/proc/self/smaps_rollup`` (Linux only). ``Private_Dirty`` is the memory a
+worker does not share with the master. Results are written as JSON.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import typing as t
+
+import yaml
+
+from configur8 import __version__, cfg
+
+from benchmarks import generators
+
+MODES = ("reload", "inherit", "preload")
+FIELDS = ("Rss", "Pss", "Private_Dirty")
+
+
+def memory() -> t.Dict[str, int]:
+    """
+    Returns the memory used by the current process, in bytes.
+    """
+    ret = {}
+
+    with open("/proc/self/smaps_rollup") as fp:
+        for line in fp:
+            key, _, value = line.partition(":")
+
+            if key in FIELDS:
+                ret[key] = int(value.split()[0]) * 1024
+
+    return ret
+
+
+def touch(value: t.Any) -> None:
+    """
+    Read every value in a config, as a worker handling requests would.
+    """
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            touch(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            touch(item)
+    elif hasattr(value, "__dict__"):
+        for item in vars(value).values():
+            touch(item)
+
+
+def worker(
+    mode: str,
+    config: t.Type,
+    source: str,
+    value: t.Any,
+) -> t.Dict[str, int]:
+    if mode == "reload":
+        value = cfg.load(config, source)
+
+    touch(value)
+    gc.collect()
+
+    return memory()
+
+
+def fork(func: t.Callable[[], t.Any]) -> t.Any:
+    """
+    Call ``func`` in a child process and return its JSON encoded result.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read_fd)
+        status = 0
+
+        try:
+            with os.fdopen(write_fd, "w") as fp:
+                json.dump(func(), fp)
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+
+    with os.fdopen(read_fd) as fp:
+        data = fp.read()
+
+    _, status = os.waitpid(pid, 0)
+
+    if status != 0:
+        raise RuntimeError(f"Child process failed with status {status}")
+
+    return json.loads(data)
+
+
+def master(
+    mode: str,
+    config: t.Type,
+    source: str,
+    workers: int,
+) -> t.Dict[str, t.Any]:
+    value = None
+
+    if mode == "inherit":
+        value = cfg.load(config, source)
+    elif mode == "preload":
+        value = cfg.preload(config, source)
+
+    results = [
+        fork(lambda: worker(mode, config, source, value))
+        for _ in range(workers)
+    ]
+
+    return {
+        "master": memory(),
+        "workers": {
+            key: statistics.median(result[key] for result in results)
+            for key in FIELDS
+        },
+    }
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.prefork")
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument(
+        "--shape",
+        choices=tuple(generators.SHAPES),
+        default="list_heavy",
+    )
+    parser.add_argument("--output", help="write JSON results to this file")
+
+    args = parser.parse_args(argv)
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("/proc/self/smaps_rollup is required", file=sys.stderr)
+
+        return 1
+
+    config, data = generators.SHAPES[args.shape](args.size)
+    source = os.path.join(tempfile.mkdtemp(), "config.yaml")
+
+    with open(source, "w") as fp:
+        yaml.safe_dump(data, fp)
+
+    results = {}
+
+    for mode in MODES:
+        # each mode runs in its own master so gc.freeze does not leak
+        results[mode] = fork(
+            lambda: master(mode, config, source, args.workers)
+        )
+        mib = {
+            key: value / 2**20
+            for key, value in results[mode]["workers"].items()
+        }
+
+        print(
+            f"{mode:<8} rss {mib['Rss']:>8.2f} MiB  pss {mib['Pss']:>8.2f} "
+            f"MiB  private {mib['Private_Dirty']:>8.2f} MiB per worker",
+            file=sys.stderr,
+        )
+
+    output = {
+        "configur8": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "shape": args.shape,
+        "size": args.size,
+        "workers": args.workers,
+        "modes": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(output, fp, indent=2, sort_keys=True)
+    else:
+        json.dump(output, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
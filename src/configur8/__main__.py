@@ -0,0 +1,216 @@
+"""
+Command line interface.
+
+Example:
+
+```shell
+configur8 compile myapp.config:Config /etc/myapp/config.yaml -o config.c8a
+configur8 validate myapp.config:Config 'services/**/*.yaml'
+```
+
+Config classes are referenced as ``module:ClassName``. The current directory is
+importable.
+"""
+
+import argparse
+import glob
+import importlib
+import os
+import sys
+import time
+import typing as t
+from concurrent import futures
+
+import yaml
+
+from configur8 import cfg
+from configur8.core import InvalidConfig
+
+__all__ = ("main",)
+
+
+def import_reference(reference: str) -> t.Type:
+    """
+    Import a config class from a ``module:ClassName`` reference.
+    """
+    module_name, _, name = reference.partition(":")
+
+    if not module_name or not name:
+        raise ValueError(
+            f"Expected a reference like 'module:ClassName', got {reference!r}"
+        )
+
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    ret: t.Any = importlib.import_module(module_name)
+
+    for part in name.split("."):
+        ret = getattr(ret, part)
+
+    return t.cast(t.Type, ret)
+
+
+def compile_command(args: argparse.Namespace) -> int:
+    config = import_reference(args.config)
+    output = args.output or f"{args.source}.c8a"
+
+    try:
+        cfg.compile(config, args.source, output, format=args.format)
+    except (cfg.ConfigError, InvalidConfig) as exc:
+        print(f"{args.source}: {exc}", file=sys.stderr)
+
+        return 1
+
+    print(output)
+
+    return 0
+
+
+def expand(patterns: t.Iterable[str]) -> t.List[str]:
+    """
+    Expand glob patterns, in the order given. Patterns that match nothing are
+    kept as is, so that they are reported as missing rather than skipped.
+    """
+    ret: t.List[str] = []
+
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            ret.extend(sorted(glob.glob(pattern, recursive=True)) or [pattern])
+        else:
+            ret.append(pattern)
+
+    return ret
+
+
+def validate_file(
+    reference: str,
+    path: str,
+    format: t.Optional[cfg.SupportedFormats],
+) -> t.Tuple[str, t.Optional[str], float]:
+    """
+    Validate a single file, returning its path, the error if it is invalid
+    and how long it took in seconds.
+    """
+    config = import_reference(reference)
+
+    if format is None:
+        format = "json" if path.endswith(".json") else "yaml"
+
+    start = time.perf_counter()
+
+    try:
+        cfg.load(config, path, format=format)
+    except (cfg.ConfigError, InvalidConfig, yaml.YAMLError, ValueError) as exc:
+        # one line per file, YAML errors span several
+        error: t.Optional[str] = " ".join(
+            line.strip() for line in str(exc).splitlines()
+        )
+    except OSError as exc:
+        error = exc.strerror or str(exc)
+    else:
+        error = None
+
+    return path, error, time.perf_counter() - start
+
+
+def validate_command(args: argparse.Namespace) -> int:
+    # fail early on a bad reference, and let forked workers inherit it
+    import_reference(args.config)
+
+    paths = expand(args.files)
+    jobs = min(args.jobs or os.cpu_count() or 1, len(paths))
+    references = [args.config] * len(paths)
+    formats = [args.format] * len(paths)
+    executor: t.Optional[futures.Executor] = None
+
+    if jobs > 1:
+        executor = futures.ProcessPoolExecutor(jobs)
+        results = executor.map(
+            validate_file,
+            references,
+            paths,
+            formats,
+            chunksize=max(1, len(paths) // (jobs * 4)),
+        )
+    else:
+        results = map(validate_file, references, paths, formats)
+
+    failed = 0
+
+    try:
+        for path, error, elapsed in results:
+            if error is None:
+                print(f"{path}: ok ({elapsed * 1000:.1f}ms)")
+            else:
+                failed += 1
+                print(
+                    f"{path}: {error} ({elapsed * 1000:.1f}ms)",
+                    file=sys.stderr,
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    print(
+        f"{len(paths) - failed} of {len(paths)} files valid",
+        file=sys.stderr,
+    )
+
+    return 1 if failed else 0
+
+
+def main(argv: t.Optional[t.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="configur8")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile",
+        help="validate a config file and write a precompiled artifact",
+    )
+    compile_parser.add_argument("config", help="module:ClassName")
+    compile_parser.add_argument("source", help="YAML/JSON config file")
+    compile_parser.add_argument(
+        "-o",
+        "--output",
+        help="where to write the artifact, defaults to SOURCE.c8a",
+    )
+    compile_parser.add_argument(
+        "-f",
+        "--format",
+        choices=("yaml", "json"),
+        default="yaml",
+    )
+    compile_parser.set_defaults(func=compile_command)
+
+    validate_parser = commands.add_parser(
+        "validate",
+        help="validate config files, reporting the result of each",
+    )
+    validate_parser.add_argument("config", help="module:ClassName")
+    validate_parser.add_argument(
+        "files",
+        nargs="+",
+        help="YAML/JSON config files or glob patterns, e.g. 'conf/**/*.yaml'",
+    )
+    validate_parser.add_argument(
+        "-f",
+        "--format",
+        choices=("yaml", "json"),
+        help="defaults to JSON for .json files and YAML otherwise",
+    )
+    validate_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="number of worker processes, defaults to the number of CPUs",
+    )
+    validate_parser.set_defaults(func=validate_command)
+
+    args = parser.parse_args(argv)
+
+    return t.cast(int, args.func(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
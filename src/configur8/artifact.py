@@ -0,0 +1,118 @@
+"""
+Precompiled config artifacts.
+
+``cfg.compile`` validates a YAML/JSON config at build time and writes the
+result in a compact binary form, which ``cfg.load`` recognises and maps into
+memory instead of parsing YAML.
+
+The layout is a fixed size header followed by the config data encoded with
+`marshal`:
+
+* magic bytes, ``b"\\x89C8A"``
+* artifact format version (uint16)
+* `marshal` format version (uint16)
+* fingerprint of the config class the data was validated against (32 bytes)
+"""
+
+import marshal
+import mmap
+import os
+import stat
+import struct
+import tempfile
+import typing as t
+
+from .core import InvalidConfig
+
+__all__ = (
+    "ArtifactError",
+    "MAGIC",
+    "read",
+    "write",
+)
+
+MAGIC = b"\x89C8A"
+VERSION = 1
+HEADER = struct.Struct("<4sHH32s")
+
+
+class ArtifactError(InvalidConfig):
+    """
+    Raised if an artifact is corrupt, from an incompatible version or was
+    compiled for a different config class.
+    """
+
+
+def file_mode(path: str) -> int:
+    """
+    Returns the permissions for a new file at ``path``: those of the file it
+    replaces, or the default for new files given the umask.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        pass
+
+    umask = os.umask(0)
+    os.umask(umask)
+
+    return 0o666 & ~umask
+
+
+def write(path: str, fingerprint: bytes, data: t.Any) -> None:
+    """
+    Write ``data`` as an artifact. The file is replaced atomically.
+    """
+    header = HEADER.pack(MAGIC, VERSION, marshal.version, fingerprint)
+    payload = marshal.dumps(data)
+    directory = os.path.dirname(os.path.abspath(path))
+    mode = file_mode(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".configur8-")
+
+    try:
+        # `mkstemp` creates the file readable by its owner only
+        os.chmod(tmp_path, mode)
+
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(header)
+            fp.write(payload)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+
+        raise
+
+
+def read(fp: t.BinaryIO, fingerprint: bytes) -> t.Any:
+    """
+    Map the artifact open at ``fp`` into memory and decode it.
+
+    :param fingerprint: The fingerprint of the config class the data is
+        about to be loaded into.
+    """
+    with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if len(mapped) < HEADER.size:
+            raise ArtifactError("Truncated config artifact")
+
+        magic, version, marshal_version, expected = HEADER.unpack_from(mapped)
+
+        if magic != MAGIC:
+            raise ArtifactError("Not a config artifact")
+
+        if version != VERSION or marshal_version > marshal.version:
+            raise ArtifactError(
+                f"Unsupported config artifact version {version} "
+                f"(marshal {marshal_version})"
+            )
+
+        if expected != fingerprint:
+            raise ArtifactError(
+                "Config artifact was compiled for a different config class"
+            )
+
+        with memoryview(mapped) as view, view[HEADER.size :] as payload:
+            try:
+                return marshal.loads(payload)
+            except (EOFError, ValueError, TypeError) as exc:
+                raise ArtifactError(f"Corrupt config artifact: {exc}") from exc
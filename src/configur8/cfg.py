@@ -36,14 +36,39 @@ def load(path: str | None = None) -> Config:
 ```
 """
 
+import array
+import asyncio
+import collections.abc
+import contextvars
+import dataclasses
+import functools
+import gc
+import hashlib
 import inspect
+import itertools
 import json
+import operator
+import os
 import re
 import typing as t
+import weakref
+from concurrent import futures
 
 import yaml
 
-from configur8 import env, types
+from configur8 import (
+    artifact,
+    env,
+    frozen,
+    metrics,
+    profiling,
+    registry,
+    types,
+)
+from configur8.core import InvalidConfig
+from configur8.profiling import Profile as Profile
+from configur8.profiling import profile as profile
+from configur8.util import Missing, MISSING
 
 
 Data = t.TypeVar("Data")
@@ -51,41 +76,84 @@ PathLike = t.List[str | int]
 DataValues = t.Dict[str, t.Any]
 SupportedFormats = t.Literal["yaml", "json"]
 
+#: Use libyaml when it is available.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class Path:
-    data: t.List[str | int]
+    """
+    An immutable location within a config, e.g. ``servers[1].port``.
+
+    Paths are hashable so they can be used as ``dict`` keys. Both the string
+    form and the hash are computed once and cached.
+    """
+
+    __slots__ = ("data", "_str", "_hash")
+
+    data: t.Tuple[str | int, ...]
+    _str: t.Optional[str]
+    _hash: t.Optional[int]
 
     match = re.compile(r"([a-zA-Z0-9_-]+)\.?|\[([0-9]+)\]\.?")
 
-    def __init__(self, path: PathLike) -> None:
-        self.data = list(path)
+    def __init__(self, path: t.Iterable[str | int]) -> None:
+        object.__setattr__(self, "data", tuple(path))
+        object.__setattr__(self, "_str", None)
+        object.__setattr__(self, "_hash", None)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        return (self.__class__, (self.data,))
 
     def __str__(self) -> str:
-        ret = ""
+        ret = self._str
 
-        first = True
+        if ret is not None:
+            return ret
+
+        parts: t.List[str] = []
 
         for count, part in enumerate(self.data):
             if isinstance(part, str):
-                if not first:
-                    ret += "."
+                if parts:
+                    parts.append(".")
 
-                ret += part
+                parts.append(part)
             elif isinstance(part, int):
-                ret += f"[{part}]"
+                parts.append(f"[{part}]")
             else:
                 raise TypeError(
                     f"Unexpected {type(part)} at {count} in {self.data!r}"
                 )
 
-            first = False
+        ret = "".join(parts)
+        object.__setattr__(self, "_str", ret)
 
         return ret
 
-    def __iter__(self):
+    def __repr__(self) -> str:
+        return f"<{__name__}.{self.__class__.__name__} {str(self)}>"
+
+    def __iter__(self) -> t.Iterator[str | int]:
         return iter(self.data)
 
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __hash__(self) -> int:
+        ret = self._hash
+
+        if ret is None:
+            ret = hash(self.data)
+            object.__setattr__(self, "_hash", ret)
+
+        return ret
+
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def decode(path: str) -> "Path":
         ret: t.List[str | int] = []
 
@@ -111,11 +179,37 @@ class Path:
             raise TypeError(f"{other!r}<{type(other)}>")
 
     def __eq__(self, __o: object) -> bool:
-        return self.data == __o
+        if isinstance(__o, Path):
+            return self.data == __o.data
+
+        if isinstance(__o, (list, tuple)):
+            return self.data == tuple(__o)
+
+        return NotImplemented
+
+
+#: A parent-linked ``(parent, name)`` chain describing where the value being
+#: validated lives. Extending it is O(1); it is only turned into a `Path` when
+#: an error needs reporting.
+Frame = t.Optional[t.Tuple[t.Any, str | int]]
+
+
+def frame_to_path(frame: Frame) -> Path:
+    """
+    Materialize a `Frame` chain into a `Path`.
+    """
+    parts: t.List[str | int] = []
+
+    while frame is not None:
+        frame, name = frame
+        parts.append(name)
+
+    return Path(reversed(parts))
 
 
 class ConfigError(Exception):
-    path: Path
+    _path: t.Optional[Path]
+    _frame: Frame
 
     def __init__(
         self,
@@ -123,196 +217,2727 @@ class ConfigError(Exception):
         message: str,
     ) -> None:
         self.message = message
+        self._frame = None
 
         if isinstance(path, Path):
-            self.path = path
+            self._path = path
         elif isinstance(path, str):
-            self.path = Path.decode(path)
+            self._path = Path.decode(path)
         else:
-            self.path = Path(path)
+            self._path = Path(path)
+
+    @classmethod
+    def at(cls, frame: Frame, message: str) -> "ConfigError":
+        """
+        Create an error for the location described by ``frame``. The `Path` is
+        only built if it is asked for.
+        """
+        ret = cls.__new__(cls)
+        ret.args = (message,)
+        ret.message = message
+        ret._path = None
+        ret._frame = frame
+
+        return ret
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = frame_to_path(self._frame)
+
+        return self._path
 
     def __str__(self) -> str:
+        if not self.path.data:
+            return self.message
+
         return f"{self.path}: {self.message}"
 
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({list(self.path)!r}, "
+            f"{self.message!r})"
+        )
 
-def into(  # noqa: C901
-    config: t.Type[Data],
-    data: t.Any,
-    _path: t.Optional[PathLike] = None,
-) -> Data:
-    data_dict = types.to_dict(data)
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        return (self.__class__, (self.path, self.message))
 
-    ret = config()
-    path = _path or []
 
-    def parse_value(  # noqa: C901
-        type_: t.Any,
-        value: t.Any,
-        name: str | int,
-    ) -> t.Any:
-        new_path = path + [name]
+def compile_getters(
+    path: Path,
+    keys: t.AbstractSet[int] = frozenset(),
+) -> t.Tuple[t.Callable[[t.Any], t.Any], ...]:
+    """
+    Returns the getters that look up ``path``. Consecutive attribute names
+    are merged into a single `operator.attrgetter`, while indexes and the
+    parts at the positions in ``keys`` become `operator.itemgetter`.
+    """
+    getters: t.List[t.Callable[[t.Any], t.Any]] = []
+    names: t.List[str] = []
 
-        if isinstance(type_, str):
-            raise ConfigError(
-                new_path,
-                "String based annotations are not currently supported. "
-                "Please use the typing module.",
-            )
+    for index, part in enumerate(path):
+        if isinstance(part, str) and index not in keys:
+            names.append(part)
 
-        if type_ is str:
-            if not isinstance(value, str):
-                raise ConfigError(
-                    new_path,
-                    f"Expected str, got {value!r}",
-                )
+            continue
 
-            return value
-        elif type_ is int:
-            if not isinstance(value, int):
-                raise ConfigError(
-                    new_path,
-                    f"Expected int, got {value!r}",
-                )
+        if names:
+            getters.append(operator.attrgetter(".".join(names)))
+            names = []
 
-            return value
-        elif type_ is bool:
-            if not isinstance(value, bool):
-                raise ConfigError(
-                    new_path,
-                    f"Expected bool, got {value!r}",
-                )
+        getters.append(operator.itemgetter(part))
 
-            return value
-        elif type_ is float:
-            if not isinstance(value, float):
+    if names:
+        getters.append(operator.attrgetter(".".join(names)))
+
+    return tuple(getters)
+
+
+class Accessor:
+    """
+    A compiled lookup of a `Path` within a config object.
+
+    Consecutive attribute names are merged into a single
+    `operator.attrgetter` and indexes become `operator.itemgetter`, so a
+    lookup costs about the same as writing the attribute access out by hand.
+    Parts that name a key in a ``dict`` field are found by walking the path
+    the first time, after which they are looked up with
+    `operator.itemgetter` too.
+    """
+
+    __slots__ = ("path", "getters")
+
+    path: Path
+    getters: t.Tuple[t.Callable[[t.Any], t.Any], ...]
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.getters = compile_getters(path)
+
+    def __repr__(self) -> str:
+        return f"<{__name__}.{self.__class__.__name__} {self.path}>"
+
+    def __call__(self, config: t.Any) -> t.Any:
+        ret = config
+
+        try:
+            for getter in self.getters:
+                ret = getter(ret)
+        except (AttributeError, LookupError, TypeError):
+            return self.walk(config)
+
+        return ret
+
+    def walk(self, config: t.Any) -> t.Any:
+        """
+        Resolve the path one part at a time, treating string parts as either
+        attribute names or mapping keys. The getters are compiled again from
+        what was found, for the next call.
+        """
+        keys = set()
+
+        for count, part in enumerate(self.path):
+            try:
+                if isinstance(part, str) and not isinstance(
+                    config, t.Mapping
+                ):
+                    config = getattr(config, part)
+                else:
+                    config = config[part]
+                    keys.add(count)
+            except (AttributeError, LookupError, TypeError):
                 raise ConfigError(
-                    new_path,
-                    f"Expected float, got {value!r}",
+                    Path(self.path.data[: count + 1]),
+                    "not found",
                 )
 
-            return value
-        elif isinstance(type_, types.NoneType):
-            if value is not None:
-                raise ConfigError(
-                    new_path,
-                    f"Expected None, got {value!r}",
+        self.getters = compile_getters(self.path, keys)
+
+        return config
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_path(path: str | Path) -> Accessor:
+    """
+    Compile ``path`` into a reusable `Accessor`. Results are cached.
+
+    :param path: A dotted path, e.g. ``routes[12].upstream``.
+    """
+    if isinstance(path, str):
+        path = Path.decode(path)
+
+    return Accessor(path)
+
+
+def get(
+    config: t.Any,
+    path: str | Path,
+    default: t.Any = MISSING,
+) -> t.Any:
+    """
+    Look up a value in a validated config by path.
+
+    :param config: The config object returned by `into`, `parse` or `load`.
+    :param path: A dotted path, e.g. ``services.api.replicas``.
+    :param default: Returned if the path does not exist. If not given, a
+        `ConfigError` is raised instead.
+    """
+    try:
+        return compile_path(path)(config)
+    except ConfigError:
+        if isinstance(default, Missing):
+            raise
+
+        return default
+
+
+def parse_value(  # noqa: C901
+    type_: t.Any,
+    value: t.Any,
+    parent: Frame,
+    name: str | int,
+    context: "Context",
+) -> t.Any:
+    """
+    Validate ``value`` against ``type_``.
+
+    ``parent`` and ``name`` describe the location of ``value``. A new frame is
+    only allocated when descending into a container or an error is raised.
+    """
+    if isinstance(type_, str):
+        raise ConfigError.at(
+            (parent, name),
+            "String based annotations are not currently supported. "
+            "Please use the typing module.",
+        )
+
+    if type_ is str:
+        if not isinstance(value, str):
+            raise ConfigError.at(
+                (parent, name),
+                f"Expected str, got {value!r}",
+            )
+
+        return value
+    elif type_ is int:
+        if not isinstance(value, int):
+            raise ConfigError.at(
+                (parent, name),
+                f"Expected int, got {value!r}",
+            )
+
+        return value
+    elif type_ is bool:
+        if not isinstance(value, bool):
+            raise ConfigError.at(
+                (parent, name),
+                f"Expected bool, got {value!r}",
+            )
+
+        return value
+    elif type_ is float:
+        if not isinstance(value, float):
+            raise ConfigError.at(
+                (parent, name),
+                f"Expected float, got {value!r}",
+            )
+
+        return value
+    elif isinstance(type_, types.NoneType):
+        if value is not None:
+            raise ConfigError.at(
+                (parent, name),
+                f"Expected None, got {value!r}",
+            )
+
+        return value
+    elif types.is_annotated_type(type_):
+        for marker in type_.__metadata__:
+            if isinstance(marker, Packed):
+                return marker.parse(value, parent, name, context)
+
+            if isinstance(marker, Lazy):
+                return marker.parse(
+                    type_.__origin__, value, parent, name, context
                 )
 
+        return parse_value(type_.__origin__, value, parent, name, context)
+    elif value is None:
+        if isinstance(type_, types.NoneType):
             return value
-        elif value is None:
-            if isinstance(type_, types.NoneType):
+
+        if types.is_union_type(type_):
+            if types.NoneType in type_.__args__:
                 return value
 
-            if types.is_union_type(type_):
-                if types.NoneType in type_.__args__:
-                    return value
+        if types.is_optional_type(type_):
+            return value
 
-            if types.is_optional_type(type_):
-                return value
+        raise ConfigError.at((parent, name), "Unexpected None")
+    elif inspect.isclass(type_):
+        handler = registry.lookup(type_)
 
-            raise ConfigError(new_path, "Unexpected None")
-        elif inspect.isclass(type_):
-            return into(type_, value, path)
-        elif types.is_union_type(type_):
-            for union_arg in type_.__args__:
-                try:
-                    return parse_value(union_arg, value, name)
-                except ConfigError:
-                    pass
-
-            raise ConfigError(new_path, "expected one of the union types")
-        elif types.is_list_type(type_):
-            if not isinstance(value, list):
-                raise ConfigError(new_path, f"Expected list, got {value!r}")
-
-            return [
-                parse_value(type_.__args__[0], item, i)
-                for i, item in enumerate(value)
-            ]
-        elif types.is_dict_type(type_):
-            if not isinstance(value, dict):
-                raise ConfigError(new_path, f"Expected dict, got {value!r}")
+        if handler is not None:
+            return parse_registered(handler, value, parent, name)
 
-            ret = {}
+        seen = context.seen
 
-            for k, v in value.items():
-                k = parse_value(type_.__args__[0], k, k)
-                v = parse_value(type_.__args__[1], v, k)
+        if seen is not None and id(value) in seen:
+            return parse_shared(
+                parse_class, type_, value, parent, name, context
+            )
 
-                ret[k] = v
+        ret = into_frame(type_, value, (parent, name), context)
 
-            return ret
-        elif types.is_new_type(type_):
-            return parse_value(type_.__supertype__, value, name)
-        elif types.is_literal_type(type_):
-            if value not in type_.__args__:
-                raise ConfigError(
-                    new_path,
-                    f"Expected one of {type_.__args__!r}, got {value!r}",
-                )
+        if seen is not None:
+            seen.add(id(value))
 
-            return value
-        else:
-            raise ConfigError(
-                path, f"Unexpected type {type_!r} for {name!r}, got {value!r}"
+        return ret
+    elif types.is_union_type(type_):
+        stats = None
+        active = profiling.ACTIVE.get()
+
+        if active is not None:
+            stats = active.union(type_)
+
+        for union_arg in type_.__args__:
+            if stats is not None:
+                stats.attempts += 1
+
+            try:
+                return parse_value(union_arg, value, parent, name, context)
+            except ConfigError:
+                if stats is not None:
+                    stats.failures += 1
+
+        if stats is not None:
+            stats.misses += 1
+
+        raise ConfigError.at(
+            (parent, name),
+            "expected one of the union types",
+        )
+    elif types.is_list_type(type_):
+        seen = context.seen
+
+        if seen is not None and id(value) in seen:
+            return parse_shared(parse_list, type_, value, parent, name, context)
+
+        ret = parse_list(type_, value, parent, name, context)
+
+        if seen is not None:
+            seen.add(id(value))
+
+        return ret
+    elif types.is_dict_type(type_):
+        seen = context.seen
+
+        if seen is not None and id(value) in seen:
+            return parse_shared(parse_dict, type_, value, parent, name, context)
+
+        ret = parse_dict(type_, value, parent, name, context)
+
+        if seen is not None:
+            seen.add(id(value))
+
+        return ret
+    elif types.is_new_type(type_):
+        return parse_value(
+            type_.__supertype__, value, parent, name, context
+        )
+    elif types.is_literal_type(type_):
+        if not is_literal_member(type_, value):
+            raise ConfigError.at(
+                (parent, name),
+                f"Expected one of {type_.__args__!r}, got {value!r}",
             )
 
-    annotations, default_values = types.get_annotation(config)
+        return value
+
+    # generic aliases of registered types
+    handler = registry.lookup(type_)
+
+    if handler is not None:
+        return parse_registered(handler, value, parent, name)
+
+    raise ConfigError.at(
+        (parent, name),
+        f"Unexpected type {type_!r} for {name!r}, got {value!r}",
+    )
+
+
+def parse_registered(
+    handler: registry.Handler,
+    value: t.Any,
+    parent: Frame,
+    name: str | int,
+) -> t.Any:
+    """
+    Parse ``value`` with the handler of a type registered with
+    `register_type`.
+    """
+    try:
+        return handler.parse(value)
+    except (ValueError, TypeError, ArithmeticError, InvalidConfig) as exc:
+        raise ConfigError.at(
+            (parent, name),
+            f"Expected {handler.type.__qualname__}, got {value!r}",
+        ) from exc
+
+
+#: The members of each `Literal` type, keyed by ``id`` as hashing a `Literal`
+#: is slower than scanning its arguments. Entries are dropped along with the
+#: type, like the other caches keyed by type.
+LITERALS: t.Dict[int, t.FrozenSet[t.Any]] = {}
+
 
-    for name, value in default_values.items():
-        if name not in data_dict:
-            data_dict[name] = value
+def is_literal_member(type_: t.Any, value: t.Any) -> bool:
+    try:
+        members = LITERALS[id(type_)]
+    except KeyError:
+        members = frozenset(type_.__args__)
 
-    for name, type_ in annotations.items():
         try:
-            data_value = data_dict[name]
-        except KeyError:
-            raise ConfigError(name, "missing")
+            weakref.finalize(type_, LITERALS.pop, id(type_), None)
+        except TypeError:
+            # cannot be weakly referenced, so the id may be reused
+            pass
+        else:
+            LITERALS[id(type_)] = members
+
+    try:
+        return value in members
+    except TypeError:
+        # unhashable, so cannot be a member
+        return False
+
+
+def parse_list(
+    type_: t.Any,
+    value: t.Any,
+    parent: Frame,
+    name: str | int,
+    context: "Context",
+) -> t.Any:
+    if not isinstance(value, list):
+        raise ConfigError.at(
+            (parent, name),
+            f"Expected list, got {value!r}",
+        )
+
+    item_type = type_.__args__[0]
+
+    if is_primitive(item_type) and all(
+        map(isinstance, value, itertools.repeat(item_type))
+    ):
+        return tuple(value) if context.frozen else value.copy()
+
+    frame = (parent, name)
+
+    if context.should_parallelize(value):
+        items = context.parallel_map(parse_items, item_type, value, frame)
+    else:
+        items = parse_items(item_type, value, frame, 0, context)
+
+    return tuple(items) if context.frozen else items
+
+
+def parse_dict(
+    type_: t.Any,
+    value: t.Any,
+    parent: Frame,
+    name: str | int,
+    context: "Context",
+) -> t.Any:
+    if not isinstance(value, dict):
+        raise ConfigError.at(
+            (parent, name),
+            f"Expected dict, got {value!r}",
+        )
+
+    frame = (parent, name)
+
+    if context.should_parallelize(value):
+        pairs = context.parallel_map(
+            parse_pairs,
+            type_.__args__,
+            list(value.items()),
+            frame,
+        )
+
+        if context.frozen:
+            return frozen.FrozenDict(pairs)
+
+        return dict(pairs)
+
+    key_type, value_type = type_.__args__
+    ret = {}
 
-        parsed_value = parse_value(type_, data_value, name)
+    for k, v in value.items():
+        k = parse_value(key_type, k, frame, k, context)
+        v = parse_value(value_type, v, frame, k, context)
 
-        setattr(ret, name, parsed_value)
+        ret[k] = v
+
+    if context.frozen:
+        return frozen.FrozenDict(ret)
 
     return ret
 
 
-def parse(
-    config: t.Type[Data],
-    data: str,
-    format: SupportedFormats = "yaml",
-) -> Data:
+def parse_class(
+    type_: t.Any,
+    value: t.Any,
+    parent: Frame,
+    name: str | int,
+    context: "Context",
+) -> t.Any:
+    return into_frame(type_, value, (parent, name), context)
+
+
+def parse_shared(
+    func: t.Callable[[t.Any, t.Any, Frame, str | int, "Context"], t.Any],
+    type_: t.Any,
+    value: t.Any,
+    parent: Frame,
+    name: str | int,
+    context: "Context",
+) -> t.Any:
     """
-    Parse config from a string.
+    Call ``func`` unless the same ``value`` object has already been validated
+    against ``type_`` in this `into` call, in which case that result is
+    returned. YAML aliases decode to the same object, so each anchor is only
+    validated once.
+
+    Only called for values in `Context.seen`. Containers are added to it once
+    they have been validated, so that data without aliases pays for a `set`
+    entry rather than a memo entry per container, and a failed `Union` member
+    does not count as a sighting.
+    """
+    memo = context.memo
+    assert memo is not None
+    # hashing the id is much cheaper than hashing a generic alias
+    key = (id(value), id(type_))
+    entry = memo.get(key)
 
-    :param config: The annotated config class to load into.
-    :param data: The encoded config data.
+    if entry is not None:
+        return entry[2]
+
+    ret = func(type_, value, parent, name, context)
+    # keep both alive so that their ids cannot be reused
+    memo[key] = (value, type_, ret)
+
+    return ret
+
+
+#: Types that can be validated with a single `isinstance` check.
+PRIMITIVES = frozenset((str, int, float, bool))
+
+
+def is_primitive(type_: t.Any) -> bool:
+    # not `type_ in PRIMITIVES`, which hashes the annotation and fails for
+    # e.g. `Annotated[int, {...}]`
+    return type_ is str or type_ is int or type_ is float or type_ is bool
+
+
+class Packed:
     """
-    if format == "yaml":
-        parsed_data = yaml.safe_load(data)
-    elif format == "json":
-        parsed_data = json.loads(data)
-    else:
-        raise ValueError(f"Unknown format {format!r}")
+    Marks a list field to be returned as a compact `array.array`:
 
-    return into(config, parsed_data)
+    ```python
+    class Config:
+        weights: t.Annotated[array.array, cfg.Packed("d")]
+    ```
 
+    Float typecodes (``f`` and ``d``) expect a list of ``float`` and all
+    others a list of ``int``. Frozen configs get a ``tuple`` instead, as
+    arrays are mutable.
 
-def load(
-    config: t.Type[Data],
-    path: t.Optional[str] = None,
-    format: SupportedFormats = "yaml",
-) -> Data:
+    :param typecode: See the `array` module.
     """
-    Load a config from a file.
 
-    :param config: The annotated config class to load into.
-    :param path: The path to the config file. If not given, the
-        ``CONFIGUR8_PATH`` environment variable is used.
+    __slots__ = ("typecode", "item_type")
+
+    typecode: str
+    item_type: t.Type
+
+    def __init__(self, typecode: str) -> None:
+        if typecode not in array.typecodes or typecode in "uw":
+            raise ValueError(f"Unsupported typecode {typecode!r}")
+
+        self.typecode = typecode
+        self.item_type = float if typecode in "fd" else int
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.typecode!r})"
+
+    def parse(
+        self,
+        value: t.Any,
+        parent: Frame,
+        name: str | int,
+        context: "Context",
+    ) -> array.array | t.Tuple[t.Any, ...]:
+        items = parse_value(
+            t.List[self.item_type],  # type: ignore[name-defined]
+            value,
+            parent,
+            name,
+            context,
+        )
+
+        try:
+            ret = array.array(self.typecode, items)
+        except OverflowError as exc:
+            raise ConfigError.at((parent, name), str(exc)) from exc
+
+        if context.frozen:
+            return t.cast(t.Tuple[t.Any, ...], items)
+
+        return ret
+
+
+class Lazy:
+    """
+    Marks a large dict or list field to be validated as it is read rather than
+    up front:
+
+    ```python
+    class Config:
+        flags: t.Annotated[t.Mapping[str, FeatureFlag], cfg.Lazy()]
+    ```
+
+    The field becomes a read-only `LazyMapping` (for ``Dict``/``Mapping``) or
+    `LazySequence` (for ``List``/``Sequence``) over the decoded data. Only
+    the container type and the keys are checked by `into`. Each value is
+    validated the first time it is read and the result is cached, so an
+    invalid value raises `ConfigError` on access instead.
     """
-    if path is None:
-        path = env.str("CONFIGUR8_PATH")
 
-    with open(path, "rb") as fp:
-        raw_config = fp.read().decode("utf-8")
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def parse(
+        self,
+        type_: t.Any,
+        value: t.Any,
+        parent: Frame,
+        name: str | int,
+        context: "Context",
+    ) -> "LazyMapping | LazySequence":
+        type_ = lazy_container(type_)
+        frame = (parent, name)
+
+        if types.is_dict_type(type_):
+            if not isinstance(value, dict):
+                raise ConfigError.at(frame, f"Expected dict, got {value!r}")
+
+            key_type, value_type = type_.__args__
+
+            if not (
+                is_primitive(key_type)
+                and all(map(isinstance, value, itertools.repeat(key_type)))
+            ):
+                value = {
+                    parse_value(key_type, k, frame, k, context): v
+                    for k, v in value.items()
+                }
+
+            return LazyMapping(
+                value_type, value, frame, context.frozen, context.environ
+            )
+
+        if not isinstance(value, list):
+            raise ConfigError.at(frame, f"Expected list, got {value!r}")
+
+        return LazySequence(
+            type_.__args__[0],
+            value,
+            frame,
+            context.frozen,
+            context.environ,
+        )
+
+
+def lazy_container(type_: t.Any) -> t.Any:
+    """
+    Returns the ``Dict`` or ``List`` equivalent of the `Lazy` field type
+    ``type_``.
+    """
+    origin = t.get_origin(type_)
+
+    if origin in (dict, collections.abc.Mapping):
+        key_type, value_type = type_.__args__
+
+        return t.Dict[key_type, value_type]  # type: ignore[valid-type]
+
+    if origin in (list, collections.abc.Sequence):
+        return t.List[type_.__args__[0]]
+
+    raise TypeError(f"{Lazy()!r} cannot be used with {type_!r}")
+
+
+class LazyMapping(collections.abc.Mapping):
+    """
+    A read-only mapping that validates each value when it is first read. See
+    `Lazy`.
+    """
+
+    __slots__ = ("type", "data", "frame", "context", "cache")
+
+    type: t.Any
+    data: t.Dict[t.Any, t.Any]
+    frame: Frame
+    context: "Context"
+    cache: t.Dict[t.Any, t.Any]
+
+    def __init__(
+        self,
+        type_: t.Any,
+        data: t.Dict[t.Any, t.Any],
+        frame: Frame,
+        frozen: bool = False,
+        environ: t.Optional[env.Environ] = None,
+    ) -> None:
+        self.type = type_
+        self.data = data
+        self.frame = frame
+        self.context = Context(frozen=frozen)
+        self.context.environ = environ
+        self.cache = {}
+
+    def __getitem__(self, key: t.Any) -> t.Any:
+        try:
+            return self.cache[key]
+        except KeyError:
+            pass
+
+        ret = self.cache[key] = parse_value(
+            self.type, self.data[key], self.frame, key, self.context
+        )
+
+        return ret
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.data
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {len(self.cache)} of "
+            f"{len(self.data)} validated>"
+        )
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        return (
+            self.__class__,
+            (
+                self.type,
+                self.data,
+                self.frame,
+                self.context.frozen,
+                self.context.environ,
+            ),
+        )
+
+    def __copy__(self) -> "LazyMapping":
+        return self
+
+    def __deepcopy__(self, memo: t.Any) -> "LazyMapping":
+        return self
+
+
+class LazySequence(collections.abc.Sequence):
+    """
+    A read-only sequence that validates each item when it is first read. See
+    `Lazy`.
+    """
+
+    __slots__ = ("type", "data", "frame", "context", "cache")
+
+    type: t.Any
+    data: t.List[t.Any]
+    frame: Frame
+    context: "Context"
+    cache: t.List[t.Any]
+
+    def __init__(
+        self,
+        type_: t.Any,
+        data: t.List[t.Any],
+        frame: Frame,
+        frozen: bool = False,
+        environ: t.Optional[env.Environ] = None,
+    ) -> None:
+        self.type = type_
+        self.data = data
+        self.frame = frame
+        self.context = Context(frozen=frozen)
+        self.context.environ = environ
+        self.cache = [MISSING] * len(data)
+
+    @t.overload
+    def __getitem__(self, index: int) -> t.Any: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.Sequence[t.Any]: ...
+
+    def __getitem__(self, index: int | slice) -> t.Any:
+        if isinstance(index, slice):
+            items = [self[i] for i in range(*index.indices(len(self.data)))]
+
+            return tuple(items) if self.context.frozen else items
+
+        ret = self.cache[index]
+
+        if ret is MISSING:
+            if index < 0:
+                index += len(self.data)
+
+            ret = self.cache[index] = parse_value(
+                self.type, self.data[index], self.frame, index, self.context
+            )
+
+        return ret
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, LazySequence)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(map(operator.eq, self, other))
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        validated = len(self.cache) - self.cache.count(MISSING)
+
+        return (
+            f"<{self.__class__.__name__} {validated} of "
+            f"{len(self.data)} validated>"
+        )
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        return (
+            self.__class__,
+            (
+                self.type,
+                self.data,
+                self.frame,
+                self.context.frozen,
+                self.context.environ,
+            ),
+        )
+
+    def __copy__(self) -> "LazySequence":
+        return self
+
+    def __deepcopy__(self, memo: t.Any) -> "LazySequence":
+        return self
+
+
+def parse_items(
+    item_type: t.Any,
+    items: t.List[t.Any],
+    frame: Frame,
+    start: int,
+    context: "Context",
+) -> t.List[t.Any]:
+    """
+    Validate the list ``items``, the first of which is at index ``start``.
+    """
+    return [
+        parse_value(item_type, item, frame, i, context)
+        for i, item in enumerate(items, start)
+    ]
+
+
+def parse_pairs(
+    types_: t.Tuple[t.Any, t.Any],
+    items: t.Iterable[t.Tuple[t.Any, t.Any]],
+    frame: Frame,
+    start: int,
+    context: "Context",
+) -> t.List[t.Tuple[t.Any, t.Any]]:
+    """
+    Validate ``(key, value)`` pairs from a ``dict``.
+    """
+    key_type, value_type = types_
+    ret = []
+
+    for k, v in items:
+        k = parse_value(key_type, k, frame, k, context)
+        v = parse_value(value_type, v, frame, k, context)
+
+        ret.append((k, v))
+
+    return ret
+
+
+def parse_chunk(
+    func: t.Callable[..., t.List[t.Any]],
+    type_: t.Any,
+    items: t.List[t.Any],
+    frame: Frame,
+    start: int,
+    environ: t.Optional[env.Environ],
+    frozen: bool,
+) -> t.List[t.Any]:
+    """
+    Entry point for validating part of a list or dict in a worker.
+    """
+    context = Context(frozen=frozen)
+    context.environ = environ
+
+    return func(type_, items, frame, start, context)
+
+
+class Parallel:
+    """
+    Validate large list and dict sections of a config in parallel.
+
+    Any ``list`` or ``dict`` with at least ``threshold`` entries is split into
+    chunks which are validated on an executor. Element order is kept and the
+    error raised is the same as when validating serially.
+
+    Using processes requires the config classes to be importable (i.e. not
+    defined inside a function) so that they can be pickled. Threads only help
+    where the GIL is not a bottleneck, e.g. free-threaded builds.
+
+    :param threshold: The minimum size of a list or dict to split up.
+    :param workers: The number of workers, defaults to the number of CPUs.
+    :param chunk_size: The number of entries per chunk. Defaults to spreading
+        each section over four chunks per worker.
+    :param executor: ``"process"``, ``"thread"`` or an existing
+        `concurrent.futures.Executor`. Executors created by configur8 are
+        shut down when the `into` call returns.
+    """
+
+    threshold: int
+    workers: int
+    chunk_size: t.Optional[int]
+    executor: t.Literal["process", "thread"] | futures.Executor
+
+    def __init__(
+        self,
+        threshold: int = 10_000,
+        workers: t.Optional[int] = None,
+        chunk_size: t.Optional[int] = None,
+        executor: t.Literal["process", "thread"] | futures.Executor = (
+            "process"
+        ),
+    ) -> None:
+        self.threshold = threshold
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.executor = executor
+
+    def create_executor(self) -> futures.Executor:
+        if self.executor == "process":
+            return futures.ProcessPoolExecutor(self.workers)
+        elif self.executor == "thread":
+            return futures.ThreadPoolExecutor(self.workers)
+        elif isinstance(self.executor, futures.Executor):
+            return self.executor
+        else:
+            raise ValueError(f"Unknown executor {self.executor!r}")
+
+    def get_chunk_size(self, size: int) -> int:
+        if self.chunk_size is not None:
+            return self.chunk_size
+
+        return max(1, -(-size // (self.workers * 4)))
+
+
+class Context:
+    """
+    State shared by everything validated during a single `into` call.
+    """
+
+    __slots__ = ("environ", "parallel", "executor", "frozen", "seen", "memo")
+
+    #: Snapshot of the environment that lazy defaults are resolved against.
+    #: Taken when the first lazy default is needed.
+    environ: t.Optional[env.Environ]
+    parallel: t.Optional[Parallel]
+    executor: t.Optional[futures.Executor]
+    frozen: bool
+    #: Ids of the containers validated so far and results by
+    #: ``(id(value), id(type))``, see `parse_shared`. Only kept for frozen
+    #: configs, whose parts can safely be shared.
+    seen: t.Optional[t.Set[int]]
+    memo: t.Optional[t.Dict[t.Tuple[int, int], t.Tuple[t.Any, t.Any, t.Any]]]
+
+    def __init__(
+        self,
+        parallel: t.Optional[Parallel] = None,
+        frozen: bool = False,
+    ) -> None:
+        self.environ = None
+        self.parallel = parallel
+        self.executor = None
+        self.frozen = frozen
+        self.seen = set() if frozen else None
+        self.memo = {} if frozen else None
+
+    def close(self) -> None:
+        if self.executor is None or self.parallel is None:
+            return
+
+        if self.executor is not self.parallel.executor:
+            self.executor.shutdown()
+
+        self.executor = None
+
+    def should_parallelize(self, value: t.Sized) -> bool:
+        return (
+            self.parallel is not None
+            and len(value) >= self.parallel.threshold
+        )
+
+    def parallel_map(
+        self,
+        func: t.Callable[..., t.List[t.Any]],
+        type_: t.Any,
+        items: t.List[t.Any],
+        frame: Frame,
+    ) -> t.List[t.Any]:
+        """
+        Call ``func`` on chunks of ``items`` in parallel, concatenating the
+        results in order. If any chunk fails, the error from the first failed
+        chunk is raised.
+        """
+        assert self.parallel is not None
+
+        if self.executor is None:
+            self.executor = self.parallel.create_executor()
+
+        if self.environ is None:
+            # workers must resolve lazy defaults against the same snapshot
+            self.environ = dict(env.get_environ())
+
+        chunk_size = self.parallel.get_chunk_size(len(items))
+        pending = [
+            self.executor.submit(
+                parse_chunk,
+                func,
+                type_,
+                items[start : start + chunk_size],
+                frame,
+                start,
+                self.environ,
+                self.frozen,
+            )
+            for start in range(0, len(items), chunk_size)
+        ]
+
+        ret: t.List[t.Any] = []
+
+        try:
+            for future in pending:
+                ret.extend(future.result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+        return ret
+
+    def resolve_default(
+        self,
+        default: env.LazyDefault,
+        frame: Frame,
+    ) -> t.Any:
+        if self.environ is None:
+            self.environ = dict(env.get_environ())
+
+        try:
+            return default.resolve(self.environ)
+        except InvalidConfig as exc:
+            raise ConfigError.at(frame, str(exc)) from exc
+
+
+def into_frame(
+    config: t.Type[Data],
+    data: t.Any,
+    frame: Frame,
+    context: Context,
+) -> Data:
+    """
+    Same as `into`, but for a config nested at ``frame``.
+    """
+    active = profiling.ACTIVE.get()
+
+    if active is not None:
+        return active.measure(
+            config,
+            frame,
+            lambda: construct(config, data, frame, context),
+        )
+
+    return construct(config, data, frame, context)
+
+
+def is_slotted(config: t.Type) -> bool:
+    return types.DEFAULTS_ATTR in config.__dict__
+
+
+def slotted(config: t.Type[Data]) -> t.Type[Data]:
+    """
+    Class decorator that gives a config class ``__slots__`` instead of a
+    per instance ``__dict__``, and a generated ``__init__`` taking every field
+    in declaration order (base classes first). `into` creates instances with
+    a single call to it.
+
+    ```python
+    @cfg.slotted
+    class Route:
+        path: str
+        timeout: float = 1.0
+    ```
+
+    Default values are moved off the class so that they do not clash with
+    the slots, and become defaults of ``__init__``. As with `dataclasses`,
+    fields with defaults that come before fields without are keyword-only.
+    `env.lazy` defaults are resolved when ``__init__`` is called without them.
+
+    Every base class must also be decorated (or be `object`), otherwise
+    instances would still get a ``__dict__``. The class must not define its
+    own ``__init__``.
+    """
+    if "__init__" in config.__dict__:
+        raise TypeError(
+            f"{config.__qualname__} must not define __init__ to be "
+            "decorated with cfg.slotted"
+        )
+
+    for base in config.__mro__[1:-1]:
+        if "__slots__" not in base.__dict__:
+            raise TypeError(
+                f"{base.__qualname__} must be decorated with cfg.slotted "
+                f"to be a base of slotted {config.__qualname__}"
+            )
+
+    own = config.__dict__.get("__annotations__", {})
+    namespace = {
+        key: value
+        for key, value in config.__dict__.items()
+        if key not in own and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = tuple(own)
+    namespace[types.DEFAULTS_ATTR] = {
+        name: config.__dict__[name] for name in own if name in config.__dict__
+    }
+
+    namespace["__qualname__"] = config.__qualname__
+    metaclass: t.Any = type(config)
+    ret = metaclass(config.__name__, config.__bases__, namespace)
+    annotations, defaults = types.get_annotation(ret)
+    init = slotted_init(list(annotations), defaults)
+    init.__qualname__ = f"{ret.__qualname__}.__init__"
+    ret.__init__ = init
+
+    return t.cast(t.Type[Data], ret)
+
+
+def slotted_init(
+    names: t.List[str],
+    defaults: t.Dict[str, t.Any],
+) -> t.Callable[..., None]:
+    """
+    Generates the ``__init__`` of a `slotted` class.
+    """
+    required = [
+        index for index, name in enumerate(names) if name not in defaults
+    ]
+    args = ["self"]
+    body = []
+
+    for index, name in enumerate(names):
+        if name not in defaults:
+            args.append(name)
+            continue
+
+        if "*" not in args and required and required[-1] > index:
+            args.append("*")
+
+        if isinstance(defaults[name], env.LazyDefault):
+            args.append(f"{name}=_configur8_missing")
+            body.append(
+                f"    if {name} is _configur8_missing:\n"
+                f"        {name} = _configur8_defaults[{name!r}].resolve()\n"
+            )
+        else:
+            args.append(f"{name}=_configur8_defaults[{name!r}]")
+
+    body.extend(f"    self.{name} = {name}\n" for name in names)
+    code = f"def __init__({', '.join(args)}):\n{''.join(body) or '    pass'}"
+    scope: t.Dict[str, t.Any] = {
+        "_configur8_defaults": defaults,
+        "_configur8_missing": MISSING,
+    }
+
+    exec(code, scope)
+
+    return t.cast(t.Callable[..., None], scope["__init__"])
+
+
+class DefaultFactory:
+    """
+    A default that is created per instance, e.g. from
+    ``dataclasses.field(default_factory=...)``.
+    """
+
+    __slots__ = ("func",)
+
+    func: t.Callable[[], t.Any]
+
+    def __init__(self, func: t.Callable[[], t.Any]) -> None:
+        self.func = func
+
+
+#: Stands in for a missing, optional `typing.TypedDict` key.
+OMITTED = Missing.token
+
+
+class Schema:
+    """
+    The fields and defaults of a config class, worked out once per class.
+
+    Besides plain annotated classes, dataclasses, `typing.NamedTuple` and
+    `typing.TypedDict` are supported. Each is created with a single call
+    once all of its values have been validated.
+
+    Classes are assumed not to change once they have been used.
+    """
+
+    __slots__ = (
+        "fields",
+        "names",
+        "defaults",
+        "optional",
+        "create",
+        "create_frozen",
+        "frozen_names",
+    )
+
+    fields: t.Tuple[t.Tuple[str, t.Any], ...]
+    names: t.Tuple[str, ...]
+    defaults: t.Dict[str, t.Any]
+    #: Fields that are left out of the instance if they are missing.
+    optional: t.FrozenSet[str]
+    #: Creates an instance of the config class from the validated values, in
+    #: field order. The class is passed in rather than kept, so that cached
+    #: schemas do not keep it alive.
+    create: t.Callable[[t.Type, t.List[t.Any]], t.Any]
+    #: Same as `create`, for frozen configs.
+    create_frozen: t.Callable[[t.Type, t.List[t.Any]], t.Any]
+    #: Attributes copied to a frozen instance of a dataclass, including
+    #: ``init=False`` fields.
+    frozen_names: t.Tuple[str, ...]
+
+    def __init__(self, config: t.Type) -> None:
+        self.optional = frozenset()
+        self.create_frozen = self.create_frozen_subclass
+
+        if dataclasses.is_dataclass(config):
+            self.init_dataclass(config)
+        elif types.is_named_tuple(config):
+            self.init_named_tuple(config)
+        elif types.is_typed_dict(config):
+            self.init_typed_dict(config)
+        else:
+            annotations, self.defaults = types.get_annotation(config)
+            self.fields = tuple(annotations.items())
+
+            if is_slotted(config) and not has_keyword_only(config):
+                self.create = self.create_positional
+            elif is_slotted(config):
+                self.create = self.create_keywords
+            else:
+                self.create = self.create_plain
+
+        self.names = tuple(name for name, _ in self.fields)
+
+    def init_dataclass(self, config: t.Type) -> None:
+        fields = [
+            field
+            for field in dataclasses.fields(config)
+            if field.init
+        ]
+
+        self.fields = tuple((field.name, field.type) for field in fields)
+        self.defaults = {}
+
+        for field in fields:
+            if field.default is not dataclasses.MISSING:
+                self.defaults[field.name] = field.default
+            elif field.default_factory is not dataclasses.MISSING:
+                self.defaults[field.name] = DefaultFactory(
+                    field.default_factory
+                )
+
+        self.create = self.create_keywords
+
+        if config.__dataclass_params__.frozen:
+            self.create_frozen = self.create
+        else:
+            self.create_frozen = self.create_frozen_dataclass
+            self.frozen_names = tuple(
+                field.name for field in dataclasses.fields(config)
+            )
+
+    def init_named_tuple(self, config: t.Type) -> None:
+        self.fields = tuple(config.__annotations__.items())
+        self.defaults = dict(config._field_defaults)
+        self.create = self.create_positional
+        self.create_frozen = self.create
+
+    def init_typed_dict(self, config: t.Type) -> None:
+        self.fields = tuple(types.get_typed_dict_fields(config).items())
+        self.defaults = {}
+        self.optional = frozenset(config.__optional_keys__)
+        self.create = self.create_dict
+        self.create_frozen = self.create_frozen_dict
+
+    def create_plain(self, config: t.Type, values: t.List[t.Any]) -> t.Any:
+        ret = config()
+
+        for name, value in zip(self.names, values):
+            setattr(ret, name, value)
+
+        return ret
+
+    def create_positional(
+        self,
+        config: t.Type,
+        values: t.List[t.Any],
+    ) -> t.Any:
+        return config(*values)
+
+    def create_keywords(self, config: t.Type, values: t.List[t.Any]) -> t.Any:
+        return config(**dict(zip(self.names, values)))
+
+    def create_dict(self, config: t.Type, values: t.List[t.Any]) -> t.Any:
+        return {
+            name: value
+            for name, value in zip(self.names, values)
+            if value is not OMITTED
+        }
+
+    def create_frozen_dict(
+        self,
+        config: t.Type,
+        values: t.List[t.Any],
+    ) -> t.Any:
+        return frozen.FrozenDict(self.create_dict(config, values))
+
+    def create_frozen_subclass(
+        self,
+        config: t.Type,
+        values: t.List[t.Any],
+    ) -> t.Any:
+        return frozen.create(config, self.names, values)
+
+    def create_frozen_dataclass(
+        self,
+        config: t.Type,
+        values: t.List[t.Any],
+    ) -> t.Any:
+        # created with `__init__` first so that `__post_init__` runs and
+        # ``init=False`` fields are set
+        instance = self.create_keywords(config, values)
+
+        return frozen.create(
+            config,
+            self.frozen_names,
+            [getattr(instance, name) for name in self.frozen_names],
+        )
+
+
+def has_keyword_only(config: t.Type) -> bool:
+    return bool(config.__init__.__code__.co_kwonlyargcount)
+
+
+SCHEMAS: "weakref.WeakKeyDictionary[t.Type, Schema]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_schema(config: t.Type) -> Schema:
+    try:
+        return SCHEMAS[config]
+    except KeyError:
+        ret = SCHEMAS[config] = Schema(config)
+
+        return ret
+
+
+def construct(
+    config: t.Type[Data],
+    data: t.Any,
+    frame: Frame,
+    context: Context,
+) -> Data:
+    try:
+        data_dict = types.to_dict(data)
+    except TypeError as exc:
+        raise ConfigError.at(frame, str(exc)) from exc
+
+    schema = get_schema(config)
+    values = []
+
+    for name, type_ in schema.fields:
+        try:
+            data_value = data_dict[name]
+        except KeyError:
+            try:
+                data_value = schema.defaults[name]
+            except KeyError:
+                if name in schema.optional:
+                    values.append(OMITTED)
+
+                    continue
+
+                raise ConfigError.at((frame, name), "missing")
+
+            if isinstance(data_value, env.LazyDefault):
+                data_value = context.resolve_default(
+                    data_value,
+                    (frame, name),
+                )
+            elif isinstance(data_value, DefaultFactory):
+                data_value = data_value.func()
+
+        values.append(parse_value(type_, data_value, frame, name, context))
+
+    if context.frozen:
+        return t.cast(Data, schema.create_frozen(config, values))
+
+    return t.cast(Data, schema.create(config, values))
+
+
+@metrics.timed("validate")
+def into(
+    config: t.Type[Data],
+    data: t.Any,
+    parallel: t.Optional[Parallel] = None,
+    frozen: bool = False,
+) -> Data:
+    """
+    Construct and validate a config object.
+
+    :param config: The annotated config class to load into.
+    :param data: The decoded config data, typically a ``dict``.
+    :param parallel: Validate large list and dict sections in parallel, see
+        `Parallel`.
+    :param frozen: Return an immutable, hashable config. Lists become tuples,
+        dicts become `configur8.frozen.FrozenDict` and config classes are
+        swapped for an immutable subclass. See `replace` for making changes.
+    """
+    context = Context(parallel, frozen)
+    active = profiling.ACTIVE.get()
+
+    try:
+        if active is None:
+            return into_frame(config, data, None, context)
+
+        with active.phase("validate"):
+            return into_frame(config, data, None, context)
+    finally:
+        context.close()
+
+
+class Result(t.Generic[Data]):
+    """
+    The outcome of validating one item passed to `into_many`.
+    """
+
+    __slots__ = ("index", "value", "error")
+
+    #: The position of the item in the input.
+    index: int
+    value: t.Optional[Data]
+    error: t.Optional[ConfigError]
+
+    def __init__(
+        self,
+        index: int,
+        value: t.Optional[Data] = None,
+        error: t.Optional[ConfigError] = None,
+    ) -> None:
+        self.index = index
+        self.value = value
+        self.error = error
+
+    def __repr__(self) -> str:
+        outcome = self.value if self.error is None else self.error
+
+        return (
+            f"<{__name__}.{self.__class__.__name__} {self.index} {outcome!r}>"
+        )
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        return (self.__class__, (self.index, self.value, self.error))
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> Data:
+        """
+        Returns the config, or raises the error.
+        """
+        if self.error is not None:
+            raise self.error
+
+        return t.cast(Data, self.value)
+
+
+def into_chunk(
+    config: t.Type[Data],
+    items: t.List[t.Any],
+    start: int,
+    frozen: bool = False,
+) -> t.List[Result[Data]]:
+    ret: t.List[Result[Data]] = []
+
+    for index, data in enumerate(items, start):
+        try:
+            ret.append(Result(index, value=into(config, data, frozen=frozen)))
+        except ConfigError as exc:
+            ret.append(Result(index, error=exc))
+
+    return ret
+
+
+def into_many(
+    config: t.Type[Data],
+    items: t.Iterable[t.Any],
+    parallel: t.Optional[Parallel] = None,
+    frozen: bool = False,
+) -> t.Iterator[Result[Data]]:
+    """
+    Validate many items against the same config class, e.g. per tenant
+    configs.
+
+    Results are yielded in input order as they are ready. A `ConfigError`
+    for one item is captured in its `Result` rather than stopping the others.
+
+    :param config: The annotated config class to load into.
+    :param items: The decoded config data for each item.
+    :param parallel: Validate chunks of items on an executor, see `Parallel`.
+        Only ``workers``, ``chunk_size`` and ``executor`` are used, with
+        ``chunk_size`` defaulting to 64 items.
+    :param frozen: See `into`.
+    """
+    if parallel is None:
+        for index, data in enumerate(items):
+            try:
+                yield Result(index, value=into(config, data, frozen=frozen))
+            except ConfigError as exc:
+                yield Result(index, error=exc)
+
+        return
+
+    executor = parallel.create_executor()
+    chunk_size = parallel.chunk_size or 64
+    iterator = iter(items)
+    pending: t.Deque[futures.Future[t.List[Result[Data]]]]
+    pending = collections.deque()
+    start = 0
+
+    def submit() -> bool:
+        nonlocal start
+
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+        if not chunk:
+            return False
+
+        pending.append(
+            executor.submit(into_chunk, config, chunk, start, frozen)
+        )
+        start += len(chunk)
+
+        return True
+
+    try:
+        # keep a couple of chunks per worker in flight
+        while len(pending) < parallel.workers * 2 and submit():
+            pass
+
+        while pending:
+            results = pending.popleft().result()
+            submit()
+
+            yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+
+        if executor is not parallel.executor:
+            executor.shutdown()
+
+
+class Replacement:
+    """
+    A new value at the end of a path given to `replace`.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: t.Any) -> None:
+        self.value = value
+
+
+Changes = t.Dict[str | int, t.Any]
+
+
+def container_args(type_: t.Any, value: t.Any) -> t.Tuple[t.Any, ...]:
+    """
+    Returns the type arguments of the list or dict type in ``type_`` that
+    ``value`` was validated against.
+    """
+    if types.is_annotated_type(type_):
+        if isinstance(value, (LazyMapping, LazySequence)):
+            return container_args(lazy_container(type_.__origin__), value)
+
+        return container_args(type_.__origin__, value)
+
+    if types.is_new_type(type_):
+        return container_args(type_.__supertype__, value)
+
+    if types.is_union_type(type_):
+        for union_arg in type_.__args__:
+            try:
+                return container_args(union_arg, value)
+            except TypeError:
+                pass
+    elif isinstance(value, (tuple, LazySequence)) and types.is_list_type(
+        type_
+    ):
+        return t.cast(t.Tuple[t.Any, ...], type_.__args__)
+    elif isinstance(value, (dict, LazyMapping)) and types.is_dict_type(type_):
+        return t.cast(t.Tuple[t.Any, ...], type_.__args__)
+
+    raise TypeError(f"{value!r} is not a {type_!r}")
+
+
+def replace_value(
+    current: t.Any,
+    type_: t.Any,
+    change: t.Any,
+    parent: Frame,
+    name: str | int,
+    context: Context,
+) -> t.Any:
+    if isinstance(change, Replacement):
+        return parse_value(type_, change.value, parent, name, context)
+
+    frame = (parent, name)
+
+    schema = schema_of(current)
+
+    if schema is not None:
+        return replace_fields(current, schema, change, frame, context)
+
+    try:
+        args = container_args(type_, current)
+    except TypeError:
+        raise ConfigError.at(frame, "cannot replace values inside")
+
+    if isinstance(current, (tuple, LazySequence)):
+        return replace_items(current, args[0], change, frame, context)
+
+    return replace_pairs(current, args, change, frame, context)
+
+
+def config_of(value: t.Any) -> t.Type:
+    """
+    Returns the config class that ``value`` was created from.
+    """
+    if frozen.is_frozen(value):
+        return type(value).__bases__[1]
+
+    return type(value)
+
+
+def schema_of(value: t.Any) -> t.Optional[Schema]:
+    """
+    Returns the `Schema` that ``value`` was created from, if any.
+    """
+    return SCHEMAS.get(config_of(value))
+
+
+def replace_fields(
+    current: t.Any,
+    schema: Schema,
+    change: Changes,
+    frame: Frame,
+    context: Context,
+) -> t.Any:
+    values = []
+
+    for field, field_type in schema.fields:
+        value = getattr(current, field)
+
+        if field in change:
+            value = replace_value(
+                value,
+                field_type,
+                change.pop(field),
+                frame,
+                field,
+                context,
+            )
+
+        values.append(value)
+
+    for unknown in change:
+        raise ConfigError.at((frame, unknown), "not found")
+
+    return schema.create_frozen(config_of(current), values)
+
+
+def replace_items(
+    current: t.Sequence[t.Any],
+    item_type: t.Any,
+    change: Changes,
+    frame: Frame,
+    context: Context,
+) -> t.Tuple[t.Any, ...]:
+    items = list(current)
+
+    for index, item_change in change.items():
+        if not isinstance(index, int) or not 0 <= index < len(items):
+            raise ConfigError.at((frame, index), "not found")
+
+        items[index] = replace_value(
+            items[index],
+            item_type,
+            item_change,
+            frame,
+            index,
+            context,
+        )
+
+    return tuple(items)
+
+
+def replace_pairs(
+    current: t.Mapping[t.Any, t.Any],
+    types_: t.Tuple[t.Any, ...],
+    change: Changes,
+    frame: Frame,
+    context: Context,
+) -> t.Dict[t.Any, t.Any]:
+    key_type, value_type = types_
+    ret = dict(current)
+
+    for key, item_change in change.items():
+        if key in ret:
+            ret[key] = replace_value(
+                ret[key],
+                value_type,
+                item_change,
+                frame,
+                key,
+                context,
+            )
+        elif isinstance(item_change, Replacement):
+            key = parse_value(key_type, key, frame, key, context)
+            ret[key] = parse_value(
+                value_type,
+                item_change.value,
+                frame,
+                key,
+                context,
+            )
+        else:
+            raise ConfigError.at((frame, key), "not found")
+
+    return frozen.FrozenDict(ret)
+
+
+def replace(
+    config: Data,
+    changes: t.Mapping[str | Path, t.Any],
+) -> Data:
+    """
+    Returns a copy of a frozen config with the values at ``changes`` replaced.
+
+    New values are validated. Only the objects along each changed path are
+    copied, everything else is shared with ``config``.
+
+    ```python
+    config = cfg.load(Config, frozen=True)
+    updated = cfg.replace(config, {"mysql.port": 3307})
+
+    assert updated.routes is config.routes
+    ```
+
+    :param config: A config created with ``frozen=True``.
+    :param changes: New values, keyed by path.
+    """
+    schema = schema_of(config)
+
+    # named tuples and frozen dataclasses are immutable without frozen=True
+    if schema is None or not (
+        frozen.is_frozen(config) or schema.create_frozen == schema.create
+    ):
+        raise TypeError("replace only supports frozen configs")
+
+    tree: Changes = {}
+
+    for path, value in changes.items():
+        if isinstance(path, str):
+            path = Path.decode(path)
+
+        *head, last = path.data
+        node = tree
+
+        for part in head:
+            node = node.setdefault(part, {})
+
+            if isinstance(node, Replacement):
+                raise ValueError(f"Conflicting changes at {path}")
+
+        if last in node:
+            raise ValueError(f"Conflicting changes at {path}")
+
+        node[last] = Replacement(value)
+
+    return t.cast(
+        Data,
+        replace_fields(config, schema, tree, None, Context(frozen=True)),
+    )
+
+
+Encoder = t.Callable[[t.Any], t.Any]
+
+#: Compiled encoders, keyed by type. See `get_encoder`.
+ENCODERS: "weakref.WeakKeyDictionary[t.Any, Encoder]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def identity(value: t.Any) -> t.Any:
+    return value
+
+
+class ClassEncoder:
+    """
+    Encodes an instance of a config class as a ``dict``, in field order.
+    """
+
+    __slots__ = ("fields", "optional")
+
+    fields: t.Tuple[t.Tuple[str, Encoder], ...]
+    optional: bool
+
+    def __init__(self, config: t.Type) -> None:
+        # registered first so that recursive classes find this encoder
+        ENCODERS[config] = self
+
+        schema = get_schema(config)
+
+        self.optional = types.is_typed_dict(config)
+        self.fields = tuple(
+            (name, get_encoder(type_)) for name, type_ in schema.fields
+        )
+
+    def __call__(self, value: t.Any) -> t.Dict[str, t.Any]:
+        if self.optional:
+            return {
+                name: encoder(value[name])
+                for name, encoder in self.fields
+                if name in value
+            }
+
+        return {
+            name: encoder(getattr(value, name)) for name, encoder in self.fields
+        }
+
+
+def compile_encoder(type_: t.Any) -> Encoder:  # noqa: C901
+    if is_primitive(type_) or type_ is None or type_ is types.NoneType:
+        return identity
+
+    handler = registry.lookup(type_)
+
+    if handler is not None:
+        return handler.encode
+
+    if types.is_literal_type(type_):
+        return identity
+
+    if types.is_annotated_type(type_):
+        for marker in type_.__metadata__:
+            if isinstance(marker, Packed):
+                return list
+
+            if isinstance(marker, Lazy):
+                return get_encoder(lazy_container(type_.__origin__))
+
+        return get_encoder(type_.__origin__)
+
+    if types.is_new_type(type_):
+        return get_encoder(type_.__supertype__)
+
+    if types.is_list_type(type_):
+        item = get_encoder(type_.__args__[0])
+
+        if item is identity:
+            return list
+
+        return lambda value: [item(x) for x in value]
+
+    if types.is_dict_type(type_):
+        key = get_encoder(type_.__args__[0])
+        item = get_encoder(type_.__args__[1])
+
+        if key is identity and item is identity:
+            return dict
+
+        return lambda value: {key(k): item(v) for k, v in value.items()}
+
+    if inspect.isclass(type_):
+        return ClassEncoder(type_)
+
+    return encode_any
+
+
+def get_encoder(type_: t.Any) -> Encoder:
+    """
+    Returns a function that encodes values of ``type_`` as plain data. It is
+    compiled once per type from the same annotations used by `into`.
+    """
+    try:
+        return ENCODERS[type_]
+    except KeyError:
+        ret = ENCODERS[type_] = compile_encoder(type_)
+
+        return ret
+    except TypeError:
+        # e.g. `int | None` cannot be weakly referenced; only compiled when an
+        # enclosing type is
+        return compile_encoder(type_)
+
+
+def register_type(
+    type_: t.Type[Data],
+    parse: t.Callable[[t.Any], Data],
+    encode: t.Callable[[Data], t.Any] = str,
+) -> None:
+    """
+    Support fields of ``type_`` in `into` and `to_data`, and ``type_`` in
+    ``env.typed``. Subclasses of ``type_`` are handled the same way unless
+    registered themselves. See `configur8.registry`.
+
+    ```python
+    cfg.register_type(Money, Money.parse, encode=str)
+    ```
+
+    :param parse: Called with the raw value. Raises `ValueError`, `TypeError`,
+        `ArithmeticError` or `configur8.InvalidConfig` if it is not valid.
+    :param encode: Turns a parsed value back into plain data.
+    """
+    registry.register(type_, parse, encode)
+    # compiled encoders and fingerprints may depend on the previous handler
+    ENCODERS.clear()
+    FINGERPRINTS.clear()
+
+
+def encode_any(value: t.Any) -> t.Any:
+    """
+    Encode ``value`` based on its runtime type, e.g. for union fields.
+    """
+    if value is None or type(value) in PRIMITIVES:
+        return value
+
+    config = type(value)
+    handler = registry.lookup(config)
+
+    if handler is not None:
+        return handler.encode(value)
+
+    if frozen.is_frozen(value):
+        config = config.__bases__[1]
+
+    if config in SCHEMAS or (
+        inspect.isclass(config)
+        and (
+            dataclasses.is_dataclass(config)
+            or types.is_named_tuple(config)
+            or config.__dict__.get("__annotations__")
+        )
+    ):
+        return get_encoder(config)(value)
+
+    if isinstance(value, (list, tuple, array.array, LazySequence)):
+        return [encode_any(item) for item in value]
+
+    if isinstance(value, (dict, LazyMapping)):
+        return {encode_any(k): encode_any(v) for k, v in value.items()}
+
+    raise TypeError(f"Cannot encode {value!r}")
+
+
+def to_data(config: t.Any) -> t.Any:
+    """
+    Convert a config object back into plain data (``dict``, ``list``,
+    ``str``, etc), the reverse of `into`. Keys follow the order in which fields
+    are declared. Values of types registered with `register_type` are
+    encoded by their handler, e.g. `Url` values become strings.
+
+    :param config: The config object returned by `into`, `parse` or `load`.
+    """
+    return encode_any(config)
+
+
+def dump(
+    config: t.Any,
+    format: SupportedFormats = "yaml",
+    stream: t.Optional[t.IO[str]] = None,
+) -> t.Optional[str]:
+    """
+    Serialize a config object, the reverse of `parse`.
+
+    :param config: The config object returned by `into`, `parse` or `load`.
+    :param format: The format to write.
+    :param stream: If given, the output is written here and ``None`` is
+        returned. Otherwise the output is returned as a string.
+    """
+    data = to_data(config)
+
+    if format == "yaml":
+        return yaml.dump(
+            data,
+            stream,
+            Dumper=YamlDumper,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+    elif format == "json":
+        if stream is None:
+            return json.dumps(data, indent=2, ensure_ascii=False)
+
+        json.dump(data, stream, indent=2, ensure_ascii=False)
+
+        return None
+    else:
+        raise ValueError(f"Unknown format {format!r}")
+
+
+@metrics.timed("parse")
+def parse(
+    config: t.Type[Data],
+    data: str,
+    format: SupportedFormats = "yaml",
+    parallel: t.Optional[Parallel] = None,
+    frozen: bool = False,
+) -> Data:
+    """
+    Parse config from a string.
+
+    :param config: The annotated config class to load into.
+    :param data: The encoded config data.
+    :param parallel: See `into`.
+    :param frozen: See `into`.
+    """
+    active = profiling.ACTIVE.get()
+
+    if active is None:
+        parsed_data = decode(data, format)
+    else:
+        with active.phase("decode"):
+            parsed_data = decode(data, format)
+
+    return into(config, parsed_data, parallel=parallel, frozen=frozen)
+
+
+def decode(data: str, format: SupportedFormats = "yaml") -> t.Any:
+    """
+    Decode raw config data without validating it.
+    """
+    if format == "yaml":
+        return yaml.load(data, Loader=YamlLoader)
+    elif format == "json":
+        return json.loads(data)
+    else:
+        raise ValueError(f"Unknown format {format!r}")
+
+
+@metrics.timed("load")
+def load(
+    config: t.Type[Data],
+    path: t.Optional[str] = None,
+    format: SupportedFormats = "yaml",
+    parallel: t.Optional[Parallel] = None,
+    frozen: bool = False,
+) -> Data:
+    """
+    Load a config from a file.
+
+    :param config: The annotated config class to load into.
+    :param path: The path to the config file. If not given, the
+        ``CONFIGUR8_PATH`` environment variable is used.
+    :param parallel: See `into`.
+    :param frozen: See `into`.
+
+    Artifacts written by `compile` are detected and loaded without parsing,
+    whatever ``format`` is.
+    """
+    if path is None:
+        path = env.str("CONFIGUR8_PATH")
+
+    active = profiling.ACTIVE.get()
+
+    if active is None:
+        raw_config = read(path, config)
+    else:
+        with active.phase("read"):
+            raw_config = read(path, config)
+
+    if isinstance(raw_config, Compiled):
+        return into(
+            config,
+            raw_config.data,
+            parallel=parallel,
+            frozen=frozen,
+        )
+
+    return parse(
+        config,
+        raw_config,
+        format=format,
+        parallel=parallel,
+        frozen=frozen,
+    )
+
+
+#: File name suffixes of the fragments `load_dir` reads, per format.
+FRAGMENT_SUFFIXES: t.Dict[str, t.Tuple[str, ...]] = {
+    "yaml": (".yaml", ".yml"),
+    "json": (".json",),
+}
+
+#: Decoded fragments by path, along with the ``(inode, size, mtime)`` they
+#: were read at.
+FRAGMENTS: t.Dict[str, t.Tuple[t.Tuple[int, int, int], DataValues]] = {}
+FRAGMENT_HITS = metrics.CACHE_REQUESTS.labels("fragments", "hit")
+FRAGMENT_MISSES = metrics.CACHE_REQUESTS.labels("fragments", "miss")
+
+
+def find_fragments(path: str, format: SupportedFormats) -> t.List[os.DirEntry]:
+    """
+    Returns the fragments in the directory ``path``, sorted by name. Hidden
+    files are skipped.
+    """
+    suffixes = FRAGMENT_SUFFIXES[format]
+
+    with os.scandir(path) as entries:
+        ret = [
+            entry
+            for entry in entries
+            if not entry.name.startswith(".")
+            and entry.name.endswith(suffixes)
+            and entry.is_file()
+        ]
+
+    ret.sort(key=operator.attrgetter("name"))
+
+    return ret
+
+
+def read_fragment(path: str, format: SupportedFormats) -> DataValues:
+    ret = decode(t.cast(str, read(path)), format)
+
+    if ret is None:
+        return {}
+
+    if not isinstance(ret, dict):
+        raise ConfigError.at(
+            None,
+            f"Expected a mapping in {path}, got {type(ret).__name__}",
+        )
+
+    return ret
+
+
+def read_fragments(
+    path: str,
+    format: SupportedFormats,
+    executor: t.Optional[futures.Executor],
+) -> t.List[DataValues]:
+    """
+    Returns the decoded fragments in the directory ``path`` in order. Only
+    fragments that changed since they were last read are read again.
+    """
+    entries = find_fragments(path, format)
+    ret: t.List[DataValues] = []
+    pending: t.Dict[int, t.Tuple[str, t.Tuple[int, int, int]]] = {}
+
+    for entry in entries:
+        stat = entry.stat()
+        key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        cached = FRAGMENTS.get(entry.path)
+
+        if cached is not None and cached[0] == key:
+            FRAGMENT_HITS.inc()
+            ret.append(cached[1])
+        else:
+            FRAGMENT_MISSES.inc()
+            pending[len(ret)] = (entry.path, key)
+            ret.append({})
+
+    if len(pending) == 1:
+        for index, (fragment, key) in pending.items():
+            ret[index] = read_fragment(fragment, format)
+            FRAGMENTS[fragment] = (key, ret[index])
+    elif pending:
+        pool = executor or futures.ThreadPoolExecutor(
+            max_workers=min(len(pending), 8)
+        )
+
+        try:
+            results = {
+                index: pool.submit(read_fragment, fragment, format)
+                for index, (fragment, _) in pending.items()
+            }
+
+            for index, result in results.items():
+                fragment, key = pending[index]
+                ret[index] = result.result()
+                FRAGMENTS[fragment] = (key, ret[index])
+        finally:
+            if executor is None:
+                pool.shutdown(cancel_futures=True)
+
+    return ret
+
+
+def merge(base: DataValues, other: DataValues) -> DataValues:
+    """
+    Returns ``base`` updated with ``other``. Mappings present in both are
+    merged, anything else in ``other`` replaces the value in ``base``. Neither
+    is changed.
+    """
+    ret = dict(base)
+
+    for key, value in other.items():
+        current = ret.get(key)
+
+        if isinstance(current, dict) and isinstance(value, dict):
+            value = merge(current, value)
+
+        ret[key] = value
+
+    return ret
+
+
+@metrics.timed("load_dir")
+def load_dir(
+    config: t.Type[Data],
+    path: str,
+    format: SupportedFormats = "yaml",
+    parallel: t.Optional[Parallel] = None,
+    frozen: bool = False,
+    executor: t.Optional[futures.Executor] = None,
+) -> Data:
+    """
+    Load a config split into fragments in a ``conf.d`` style directory.
+
+    Files ending in ``.yaml`` or ``.yml`` (``.json`` for JSON) are read in
+    name order, concurrently, and merged: mappings are merged key by key and
+    anything else is replaced by later fragments. The result is validated
+    once.
+
+    Decoded fragments are cached, a fragment is only read again when its
+    inode, size or modification time changes.
+
+    :param config: The annotated config class to load into.
+    :param path: The directory holding the fragments.
+    :param parallel: See `into`.
+    :param frozen: See `into`.
+    :param executor: Reads and decodes the fragments. Defaults to a thread
+        pool created for the call.
+    """
+    active = profiling.ACTIVE.get()
+
+    if active is None:
+        fragments = read_fragments(path, format, executor)
+    else:
+        with active.phase("read"):
+            fragments = read_fragments(path, format, executor)
+
+    data: DataValues = {}
+
+    for fragment in fragments:
+        data = merge(data, fragment)
+
+    return into(config, data, parallel=parallel, frozen=frozen)
+
+
+#: The symlink Kubernetes swaps to update a mounted ConfigMap or Secret.
+DATA_LINK = "..data"
+
+#: Parse the contents of a file in `load_volume`, per field type. Files for
+#: fields of any other type are decoded as YAML.
+VOLUME_PARSERS: t.Dict[t.Any, t.Callable[[str], t.Any]] = {
+    str: env.parse_str,
+    bool: env.parse_bool,
+    int: env.parse_int,
+    float: env.parse_float,
+}
+
+#: File contents by volume directory, along with the version of the volume
+#: they were read at.
+VOLUMES: t.Dict[str, t.Tuple[t.Hashable, t.Dict[str, str]]] = {}
+VOLUME_HITS = metrics.CACHE_REQUESTS.labels("volumes", "hit")
+VOLUME_MISSES = metrics.CACHE_REQUESTS.labels("volumes", "miss")
+
+
+def scan_volume(path: str) -> t.List[os.DirEntry]:
+    with os.scandir(path) as entries:
+        return [
+            entry
+            for entry in entries
+            if not entry.name.startswith(".") and entry.is_file()
+        ]
+
+
+def volume_version(path: str) -> t.Tuple[str, t.Hashable]:
+    """
+    Returns the directory holding the files of the volume at ``path`` and a
+    value that changes whenever they do.
+
+    For a Kubernetes volume that is the target of the ``..data`` symlink, so
+    all files are read from the same version even if it is swapped mid-read.
+    Otherwise it is the inode, size and modification time of each file.
+    """
+    try:
+        target = os.readlink(os.path.join(path, DATA_LINK))
+    except OSError:
+        return path, tuple(
+            (entry.name, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            for entry in scan_volume(path)
+            for stat in (entry.stat(),)
+        )
+
+    directory = os.path.join(path, target)
+
+    return directory, directory
+
+
+def read_volume(path: str) -> t.Dict[str, str]:
+    """
+    Returns the contents of each file in the volume at ``path`` by name.
+    Files are only read again when the volume changes.
+    """
+    while True:
+        directory, version = volume_version(path)
+        cached = VOLUMES.get(path)
+
+        if cached is not None and cached[0] == version:
+            VOLUME_HITS.inc()
+
+            return cached[1]
+
+        VOLUME_MISSES.inc()
+        ret = {}
+
+        try:
+            for entry in scan_volume(directory):
+                with open(entry.path, "rb") as fp:
+                    ret[entry.name] = fp.read().decode("utf-8")
+        except FileNotFoundError:
+            # retry if the ``..data`` symlink was swapped and the version
+            # being read was removed
+            if directory == path or volume_version(path)[0] == directory:
+                raise
+
+            continue
+
+        VOLUMES[path] = (version, ret)
+
+        return ret
+
+
+def parse_volume_file(type_: t.Any, contents: str, name: str) -> t.Any:
+    """
+    Coerce the contents of the file for the field ``name``.
+    """
+    if types.is_union_type(type_) or types.is_optional_type(type_):
+        args = [arg for arg in t.get_args(type_) if arg is not types.NoneType]
+
+        if len(args) == 1:
+            type_ = args[0]
+
+    while types.is_new_type(type_):
+        type_ = type_.__supertype__
+
+    try:
+        parser = VOLUME_PARSERS[type_]
+    except (KeyError, TypeError):
+        if registry.lookup(type_) is not None:
+            # parsed by `into`
+            return contents.rstrip("\r\n")
+
+        return decode(contents, "yaml")
+
+    try:
+        return parser(contents.rstrip("\r\n"))
+    except InvalidConfig as exc:
+        raise ConfigError.at((None, name), str(exc)) from exc
+
+
+@metrics.timed("load_volume")
+def load_volume(
+    config: t.Type[Data],
+    path: str,
+    parallel: t.Optional[Parallel] = None,
+    frozen: bool = False,
+) -> Data:
+    """
+    Load a config from a directory holding one file per field, such as a
+    mounted Kubernetes ConfigMap or Secret.
+
+    Each file is named after a field (``-`` standing in for ``_``). Files for
+    ``str``, ``bool``, ``int`` and ``float`` fields are parsed like
+    environment variables, trailing newlines removed, as are types registered
+    with `register_type`. Any other field is decoded as YAML. Hidden files
+    and files that match no field are ignored.
+
+    The volume is read again only once it changes. Kubernetes volumes are
+    updated by swapping the ``..data`` symlink, and every file is read from
+    the same version.
+
+    :param config: The annotated config class to load into.
+    :param path: The directory the volume is mounted at.
+    :param parallel: See `into`.
+    :param frozen: See `into`.
+    """
+    active = profiling.ACTIVE.get()
+
+    if active is None:
+        files = read_volume(path)
+    else:
+        with active.phase("read"):
+            files = read_volume(path)
+
+    fields = dict(get_schema(config).fields)
+    data: DataValues = {}
+
+    for name, contents in files.items():
+        name = name.replace("-", "_")
+
+        try:
+            type_ = fields[name]
+        except KeyError:
+            continue
+
+        data[name] = parse_volume_file(type_, contents, name)
+
+    return into(config, data, parallel=parallel, frozen=frozen)
+
+
+def preload(
+    config: t.Type[Data],
+    path: t.Optional[str] = None,
+    format: SupportedFormats = "yaml",
+    parallel: t.Optional[Parallel] = None,
+) -> Data:
+    """
+    Load a config once in the master process of a pre-forking server, e.g.
+    gunicorn with ``--preload`` or uWSGI without ``lazy-apps``, so that every
+    forked worker shares it instead of loading its own copy.
+
+    The config is loaded frozen and its hashes are computed up front. Every
+    object that exists is then moved out of reach of the garbage collector
+    with `gc.freeze`, so collections in the workers no longer write to, and
+    so copy, the memory pages holding the config.
+
+    Call it as late as possible before the workers are forked. Arguments are
+    the same as for `load`.
+    """
+    ret = load(config, path, format=format, parallel=parallel, frozen=True)
+
+    try:
+        hash(ret)
+    except TypeError:
+        pass
+
+    gc.collect()
+    gc.freeze()
+
+    return ret
+
+
+async def run_in_executor(
+    executor: t.Optional[futures.Executor],
+    func: t.Callable[[], Data],
+) -> Data:
+    """
+    Run ``func`` in ``executor`` (or the default executor of the running
+    loop). Thread pools see the current `contextvars` context, so an active
+    `profile` applies.
+    """
+    loop = asyncio.get_running_loop()
+
+    if not isinstance(executor, futures.ProcessPoolExecutor):
+        func = functools.partial(contextvars.copy_context().run, func)
+
+    return await loop.run_in_executor(executor, func)
+
+
+async def parse_async(
+    config: t.Type[Data],
+    data: str,
+    format: SupportedFormats = "yaml",
+    parallel: t.Optional[Parallel] = None,
+    frozen: bool = False,
+    executor: t.Optional[futures.Executor] = None,
+) -> Data:
+    """
+    Like `parse`, but decodes and validates in ``executor`` so the event loop
+    is not blocked.
+
+    :param executor: Defaults to the default executor of the running loop. With
+        a thread pool the event loop still runs at least every
+        `sys.getswitchinterval` seconds. With a process pool the config
+        classes must be importable by the workers.
+    """
+    return await run_in_executor(
+        executor,
+        functools.partial(
+            parse,
+            config,
+            data,
+            format=format,
+            parallel=parallel,
+            frozen=frozen,
+        ),
+    )
+
+
+async def load_async(
+    config: t.Type[Data],
+    path: t.Optional[str] = None,
+    format: SupportedFormats = "yaml",
+    parallel: t.Optional[Parallel] = None,
+    frozen: bool = False,
+    executor: t.Optional[futures.Executor] = None,
+) -> Data:
+    """
+    Like `load`, but reads, decodes and validates in ``executor`` so the
+    event loop is not blocked. Several configs can be loaded at once with
+    `asyncio.gather`.
+
+    :param executor: See `parse_async`.
+    """
+    return await run_in_executor(
+        executor,
+        functools.partial(
+            load,
+            config,
+            path,
+            format=format,
+            parallel=parallel,
+            frozen=frozen,
+        ),
+    )
+
+
+class Compiled:
+    """
+    Data read from an artifact written by `compile`.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: t.Any) -> None:
+        self.data = data
+
+
+def read(path: str, config: t.Optional[t.Type] = None) -> str | Compiled:
+    """
+    Read a config file. If ``config`` is given, artifacts written by
+    `compile` for it are recognised and decoded.
+    """
+    with open(path, "rb") as fp:
+        head = fp.read(len(artifact.MAGIC))
+
+        if config is not None and head == artifact.MAGIC:
+            return Compiled(artifact.read(fp, fingerprint(config)))
+
+        return (head + fp.read()).decode("utf-8")
+
+
+def describe(type_: t.Any, seen: t.Set[t.Type]) -> str:
+    """
+    Returns a description of ``type_`` including the fields of every config
+    class it refers to. See `fingerprint`.
+    """
+    if inspect.isclass(type_) and type_ not in PRIMITIVES:
+        name = f"{type_.__module__}.{type_.__qualname__}"
+
+        if type_ in seen or registry.lookup(type_) is not None:
+            return name
+
+        seen.add(type_)
+        fields = ",".join(
+            f"{k}:{describe(v, seen)}" for k, v in get_schema(type_).fields
+        )
+
+        return f"{name}{{{fields}}}"
+
+    if types.is_new_type(type_):
+        return f"{type_.__name__}({describe(type_.__supertype__, seen)})"
+
+    if types.is_annotated_type(type_):
+        return (
+            f"Annotated[{describe(type_.__origin__, seen)},"
+            f"{','.join(describe_marker(m) for m in type_.__metadata__)}]"
+        )
+
+    if types.is_literal_type(type_):
+        return repr(type_)
+
+    args = t.get_args(type_)
+
+    if args:
+        origin = t.get_origin(type_)
+
+        return (
+            f"{getattr(origin, '__name__', repr(origin))}"
+            f"[{','.join(describe(arg, seen) for arg in args)}]"
+        )
+
+    return getattr(type_, "__qualname__", repr(type_))
+
+
+def describe_marker(marker: t.Any) -> str:
+    """
+    Returns a description of ``Annotated`` metadata that is the same in every
+    process. Other objects are described by their class, as their ``repr``
+    may include a memory address.
+    """
+    if isinstance(marker, (Packed, Lazy, str, bytes, int, float, type(None))):
+        return repr(marker)
+
+    return f"{type(marker).__module__}.{type(marker).__qualname__}"
+
+
+FINGERPRINTS: "weakref.WeakKeyDictionary[t.Type, bytes]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def fingerprint(config: t.Type) -> bytes:
+    """
+    Returns a digest of the structure of ``config``: the names and types of
+    its fields and those of every config class it refers to.
+    """
+    try:
+        return FINGERPRINTS[config]
+    except KeyError:
+        description = describe(config, set()).encode("utf-8")
+        ret = FINGERPRINTS[config] = hashlib.sha256(description).digest()
+
+        return ret
+
+
+def compile(
+    config: t.Type,
+    source: str,
+    destination: str,
+    format: SupportedFormats = "yaml",
+) -> None:
+    """
+    Validate the config file at ``source`` and write it to ``destination`` as
+    a precompiled artifact, which `load` reads without parsing YAML/JSON.
+    Only the values set in ``source`` are written, so defaults (including
+    `env.lazy` ones) are still resolved when the artifact is loaded.
+
+    The artifact records a fingerprint of ``config`` and is rejected with
+    `configur8.artifact.ArtifactError` if loaded into a different structure.
+    Artifacts are specific to the major Python version that wrote them.
+
+    :param config: The annotated config class to validate against.
+    :param source: The path to the YAML/JSON config file.
+    :param destination: Where to write the artifact.
+    """
+    with open(source, "rb") as fp:
+        raw = decode(fp.read().decode("utf-8"), format)
+
+    data = only_present(config, to_data(into(config, raw)), raw)
+
+    artifact.write(destination, fingerprint(config), data)
+
+
+def only_present(type_: t.Any, data: t.Any, raw: t.Any) -> t.Any:
+    """
+    Returns the parts of the encoded config ``data`` that are set in the
+    decoded source ``raw``, so that defaults are resolved when the artifact is
+    loaded rather than when it was compiled. ``type_`` is the type ``data``
+    was validated as.
+    """
+    while types.is_annotated_type(type_) or types.is_new_type(type_):
+        if types.is_new_type(type_):
+            type_ = type_.__supertype__
+        else:
+            type_ = type_.__origin__
+
+    origin = t.get_origin(type_) or type_
+
+    if isinstance(raw, dict) and isinstance(data, dict):
+        if origin in (dict, collections.abc.Mapping):
+            # every key is from the source, but may have been converted, e.g.
+            # by a `Dict[int, ...]` field, so values are paired by order
+            if len(raw) != len(data):
+                return data
+
+            args = t.get_args(type_)
+            item_type = args[1] if len(args) == 2 else t.Any
+
+            return {
+                key: only_present(item_type, value, raw_value)
+                for (key, value), raw_value in zip(data.items(), raw.values())
+            }
+
+        # a config class, or a union: keys that are not fields were ignored
+        if inspect.isclass(type_) and registry.lookup(type_) is None:
+            fields = dict(get_schema(type_).fields)
+        else:
+            fields = {}
+
+        return {
+            key: only_present(fields.get(key, t.Any), data[key], raw[key])
+            for key in raw
+            if key in data
+        }
+
+    if isinstance(raw, list) and isinstance(data, list):
+        if len(raw) != len(data):
+            return data
+
+        args = t.get_args(type_)
+        item_type = args[0] if len(args) == 1 else t.Any
+
+        return [only_present(item_type, d, r) for d, r in zip(data, raw)]
 
-    return parse(config, raw_config, format=format)
+    return data
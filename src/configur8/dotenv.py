@@ -0,0 +1,221 @@
+"""
+Parser for ``.env`` files, used by `configur8.env.load_dotenv` and
+`configur8.env.use_dotenv`.
+
+```shell
+# comments and blank lines are ignored
+export DATABASE_HOST=localhost
+DATABASE_URL="postgres://${DATABASE_USER:-app}@$DATABASE_HOST/app"
+GREETING='single quotes are taken literally, $HOME included'
+MOTD="double quotes allow escapes\\nand span lines"
+```
+
+Each file is tokenized in a single pass by one regular expression. Values
+are kept as templates, so files are only read and tokenized again when their
+``(inode, size, mtime)`` changes, while variable references are resolved
+against the environment every time the file is loaded.
+"""
+
+import os
+import re
+import types
+import typing as t
+
+from . import metrics
+from .core import InvalidConfig
+
+__all__ = (
+    "DotenvError",
+    "Ref",
+    "load",
+    "read",
+    "tokenize",
+)
+
+
+class DotenvError(InvalidConfig):
+    """
+    Raised if a ``.env`` file cannot be parsed.
+    """
+
+
+class Ref(t.NamedTuple):
+    """
+    A ``$NAME``, ``${NAME}`` or ``${NAME:-default}`` reference in a value.
+    """
+
+    name: str
+    default: str = ""
+
+
+#: A value, either plain or made of literal parts and references.
+Template = str | t.Tuple[str | Ref, ...]
+
+ENTRY = re.compile(
+    r"""
+    [ \t]*(?:\#[^\r\n]*)?(?:\r?\n|\Z)
+    |
+    [ \t]*(?:export[ \t]+)?
+    (?P<key>[A-Za-z_][A-Za-z0-9_.]*)[ \t]*=[ \t]*
+    (?:
+        '(?P<single>[^']*)'
+        |
+        "(?P<double>(?:\\.|[^"\\])*)"
+        |
+        (?P<bare>[^\r\n]*?)
+    )
+    (?:[ \t]+\#[^\r\n]*)?[ \t]*(?:\r?\n|\Z)
+    """,
+    re.VERBOSE,
+)
+NAME = r"[A-Za-z_][A-Za-z0-9_]*"
+DOUBLE_PART = re.compile(
+    rf"\\(.)|\$\{{({NAME})(?::-([^}}]*))?\}}|\$({NAME})",
+    re.DOTALL,
+)
+BARE_PART = re.compile(rf"\$\{{({NAME})(?::-([^}}]*))?\}}|\$({NAME})")
+ESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+
+
+def compile_value(value: str, pattern: t.Pattern[str]) -> Template:
+    """
+    Split ``value`` into literal parts and references, unescaping as it goes.
+    Returns a plain ``str`` if there are no references.
+    """
+    parts: t.List[str | Ref] = []
+    literal: t.List[str] = []
+    start = 0
+
+    for match in pattern.finditer(value):
+        literal.append(value[start : match.start()])
+        start = match.end()
+        # the escape group is only in `DOUBLE_PART`
+        *escape, name, default, bare_name = match.groups()
+
+        if escape and escape[0] is not None:
+            literal.append(ESCAPES.get(escape[0], escape[0]))
+            continue
+
+        parts.append("".join(literal))
+        parts.append(Ref(name or bare_name, default or ""))
+        literal = []
+
+    literal.append(value[start:])
+
+    if not parts:
+        return "".join(literal)
+
+    parts.append("".join(literal))
+
+    return tuple(part for part in parts if part != "")
+
+
+def tokenize(
+    text: str,
+    path: str = "<string>",
+) -> t.List[t.Tuple[str, Template]]:
+    """
+    Returns the ``(name, template)`` entries of a ``.env`` file, in order.
+
+    :raises DotenvError: If a line is not a comment, blank or an assignment.
+    """
+    ret: t.List[t.Tuple[str, Template]] = []
+    pos = 0
+    end = len(text)
+
+    while pos < end:
+        match = ENTRY.match(text, pos)
+
+        if match is None or match.end() == pos:
+            line = text.count("\n", 0, pos) + 1
+
+            raise DotenvError(f"{path}:{line}: Expected NAME=value")
+
+        pos = match.end()
+        key = match.group("key")
+
+        if key is None:
+            continue
+
+        single, double, bare = match.group("single", "double", "bare")
+
+        if single is not None:
+            ret.append((key, single))
+        elif double is not None:
+            ret.append((key, compile_value(double, DOUBLE_PART)))
+        else:
+            ret.append((key, compile_value(bare, BARE_PART)))
+
+    return ret
+
+
+#: Tokenized files by path, along with the ``(inode, size, mtime)`` they were
+#: read at.
+FILES: t.Dict[
+    str,
+    t.Tuple[t.Tuple[int, int, int], t.List[t.Tuple[str, Template]]],
+] = {}
+HITS = metrics.CACHE_REQUESTS.labels("dotenv", "hit")
+MISSES = metrics.CACHE_REQUESTS.labels("dotenv", "miss")
+
+
+def read(path: str) -> t.List[t.Tuple[str, Template]]:
+    """
+    Returns the tokenized entries of the file at ``path``, which is only read
+    again once it has changed.
+    """
+    with open(path, "rb") as fp:
+        stat = os.fstat(fp.fileno())
+        key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        cached = FILES.get(path)
+
+        if cached is not None and cached[0] == key:
+            HITS.inc()
+
+            return cached[1]
+
+        MISSES.inc()
+        ret = tokenize(fp.read().decode("utf-8"), path)
+
+    FILES[path] = (key, ret)
+
+    return ret
+
+
+def load(
+    path: str,
+    environ: t.Mapping[str, str],
+    override: bool = False,
+) -> t.Mapping[str, str]:
+    """
+    Returns the values in the ``.env`` file at ``path`` as a read-only
+    mapping.
+
+    References are resolved against the values defined earlier in the file
+    and ``environ``. Values from ``environ`` take precedence unless
+    ``override`` is true, the same as when the values are looked up.
+    """
+    ret: t.Dict[str, str] = {}
+
+    for key, template in read(path):
+        if isinstance(template, str):
+            ret[key] = template
+            continue
+
+        parts = []
+
+        for part in template:
+            if isinstance(part, str):
+                parts.append(part)
+                continue
+
+            if override:
+                value = ret.get(part.name) or environ.get(part.name)
+            else:
+                value = environ.get(part.name) or ret.get(part.name)
+
+            parts.append(value or part.default)
+
+        ret[key] = "".join(parts)
+
+    return types.MappingProxyType(ret)
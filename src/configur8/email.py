@@ -1,10 +1,12 @@
 from email_validator import EmailNotValidError, validate_email
 
+from . import metrics
 from .core import InvalidConfig
 
 __all__ = ("parse",)
 
 
+@metrics.timed("email")
 def parse(email: str) -> str:
     try:
         result = validate_email(email, check_deliverability=False)
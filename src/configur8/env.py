@@ -25,13 +25,18 @@ Everything is designed to be type safe.
 """
 
 import builtins
+import contextlib
+import contextvars
 import os
+import threading
 import typing as t
 
+from . import dotenv, metrics
 from .core import InvalidConfig
 from .email import parse as parse_email
 from .path import parse as parse_path
 from .path import Path
+from .registry import get_parser
 from .url import parse as parse_url
 from .url import Url
 from .util import Missing
@@ -39,13 +44,19 @@ from .util import MISSING
 
 __all__ = (
     "MissingFromEnv",
+    "LazyDefault",
     "bool",
     "email",
     "float",
     "int",
+    "lazy",
+    "load_dotenv",
     "path",
     "str",
+    "typed",
+    "unload_dotenv",
     "url",
+    "use_dotenv",
 )
 
 T = t.TypeVar("T")
@@ -56,6 +67,23 @@ BOOLEAN_TRUTHY_VALUES = ["true", "1", "y", "yes", "ok"]
 LIST_SEPARATOR = ","
 
 ParseFunc = t.Callable[[builtins.str | T], T]
+Environ = t.Mapping[builtins.str, builtins.str]
+
+#: Overrides the environment that values are read from within a
+#: `use_dotenv` block. ``None`` means the process wide environment.
+ENVIRON: contextvars.ContextVar[t.Optional[Environ]] = contextvars.ContextVar(
+    "configur8_environ",
+    default=None,
+)
+#: The values read by `load_dotenv` by absolute path, in the order the files
+#: were loaded, with whether they override the environment.
+LOADED: t.Dict[builtins.str, t.Tuple[Environ, builtins.bool]] = {}
+#: The environment built from `LOADED`, used by every thread. ``None`` means
+#: `os.environ`.
+LOADED_ENVIRON: t.Optional[Environ] = None
+LOADED_LOCK = threading.Lock()
+FOUND = metrics.ENV_LOOKUPS.labels("found")
+NOT_FOUND = metrics.ENV_LOOKUPS.labels("missing")
 
 
 class MissingFromEnv(InvalidConfig):
@@ -64,15 +92,204 @@ class MissingFromEnv(InvalidConfig):
     """
 
 
+def get_environ() -> Environ:
+    """
+    Returns the environment that values are currently read from.
+    """
+    ret = ENVIRON.get()
+
+    if ret is not None:
+        return ret
+
+    return get_loaded()
+
+
+def get_loaded() -> Environ:
+    """
+    Returns the environment set up by `load_dotenv`, ignoring `use_dotenv`.
+    """
+    ret = LOADED_ENVIRON
+
+    if ret is not None:
+        return ret
+
+    return os.environ
+
+
+class Layered(t.Mapping[builtins.str, builtins.str]):
+    """
+    A read-only view of several environments, the first of which to define
+    a variable wins.
+    """
+
+    __slots__ = ("layers",)
+
+    layers: t.Tuple[Environ, ...]
+
+    def __init__(self, *layers: Environ) -> None:
+        self.layers = layers
+
+    def __getitem__(self, key: builtins.str) -> builtins.str:
+        for layer in self.layers:
+            ret = layer.get(key)
+
+            if ret is not None:
+                return ret
+
+        raise KeyError(key)
+
+    def get(self, key: builtins.str, default: t.Any = None) -> t.Any:
+        # avoid raising a `KeyError` for every miss
+        for layer in self.layers:
+            ret = layer.get(key)
+
+            if ret is not None:
+                return ret
+
+        return default
+
+    def __iter__(self) -> t.Iterator[builtins.str]:
+        return iter({key: None for layer in self.layers for key in layer})
+
+    def __len__(self) -> builtins.int:
+        return len(set().union(*self.layers))
+
+    def __repr__(self) -> builtins.str:
+        return f"<{__name__}.{self.__class__.__name__} {self.layers!r}>"
+
+
+def dotenv_environ(
+    environ: Environ,
+    path: builtins.str,
+    override: builtins.bool,
+    required: builtins.bool,
+) -> Environ:
+    try:
+        values = dotenv.load(path, environ, override)
+    except FileNotFoundError:
+        if required:
+            raise
+
+        return environ
+
+    if override:
+        return Layered(values, environ)
+
+    return Layered(environ, values)
+
+
+def load_dotenv(
+    path: builtins.str = ".env",
+    override: builtins.bool = False,
+    required: builtins.bool = False,
+) -> Environ:
+    """
+    Read values from the ``.env`` file at ``path`` as well as the environment,
+    in every thread from now on. `os.environ` is not changed.
+
+    :param override: Prefer values from the file over the environment.
+    :param required: Raise `FileNotFoundError` if the file does not exist
+        rather than ignoring it.
+    :raises configur8.dotenv.DotenvError: If the file cannot be parsed.
+
+    Loading the same path again replaces its values rather than adding
+    another layer.
+    """
+    global LOADED_ENVIRON
+
+    key = os.path.abspath(path)
+
+    with LOADED_LOCK:
+        others = {k: v for k, v in LOADED.items() if k != key}
+
+        try:
+            values = dotenv.load(path, layer_loaded(others), override)
+        except FileNotFoundError:
+            if required:
+                raise
+
+            return get_loaded()
+
+        LOADED.pop(key, None)
+        LOADED[key] = (values, override)
+        LOADED_ENVIRON = layer_loaded(LOADED)
+
+        return LOADED_ENVIRON
+
+
+def unload_dotenv(path: t.Optional[builtins.str] = None) -> Environ:
+    """
+    Stop reading values from the ``.env`` file at ``path`` loaded by
+    `load_dotenv`, or from every loaded file if ``path`` is ``None``.
+    Returns the environment values are read from afterwards.
+    """
+    global LOADED_ENVIRON
+
+    with LOADED_LOCK:
+        if path is None:
+            LOADED.clear()
+        else:
+            LOADED.pop(os.path.abspath(path), None)
+
+        LOADED_ENVIRON = layer_loaded(LOADED) if LOADED else None
+
+        return get_loaded()
+
+
+def layer_loaded(
+    loaded: t.Mapping[builtins.str, t.Tuple[Environ, builtins.bool]],
+) -> Environ:
+    """
+    Returns one flat `Layered` of ``loaded`` and `os.environ`. Later files
+    win among those that override the environment, earlier ones among those
+    that don't.
+    """
+    if not loaded:
+        return os.environ
+
+    overrides = [values for values, over in loaded.values() if over]
+    others = [values for values, over in loaded.values() if not over]
+
+    return Layered(*reversed(overrides), os.environ, *others)
+
+
+@contextlib.contextmanager
+def use_dotenv(
+    path: builtins.str = ".env",
+    override: builtins.bool = False,
+    required: builtins.bool = False,
+) -> t.Iterator[Environ]:
+    """
+    Like `load_dotenv`, but only within the ``with`` block and the current
+    context:
+
+    ```python
+    with env.use_dotenv("tests/.env"):
+        config = cfg.load(Config)
+    ```
+    """
+    environ = dotenv_environ(get_environ(), path, override, required)
+    token = ENVIRON.set(environ)
+
+    try:
+        yield get_environ()
+    finally:
+        ENVIRON.reset(token)
+
+
 def get_raw(env_var_name: builtins.str) -> builtins.str:
     """
     Returns the value of the environment variable, or raises an error.
     """
-    ret = os.getenv(env_var_name, None)
+    ret = get_environ().get(env_var_name, None)
 
     if ret is not None:
+        FOUND.inc()
+
         return ret
 
+    NOT_FOUND.inc()
+
     raise MissingFromEnv(f"Missing env var {env_var_name!r}")
 
 
@@ -81,7 +298,14 @@ def get_raw_optional(env_var: builtins.str) -> builtins.str | None:
     Returns the value of the environment variable, or `None` if it doesn't
     exist.
     """
-    return os.getenv(env_var, None)
+    ret = get_environ().get(env_var, None)
+
+    if ret is None:
+        NOT_FOUND.inc()
+    else:
+        FOUND.inc()
+
+    return ret
 
 
 class EnvVar(t.Generic[T]):
@@ -186,6 +410,93 @@ class EnvVar(t.Generic[T]):
         return [self.parse_func(item) for item in raw_value.split(separator)]
 
 
+class LazyDefault(t.Generic[T]):
+    """
+    A default value that is read from the environment when the config is
+    validated rather than when the config class is defined.
+
+    See `lazy`.
+    """
+
+    __slots__ = ("func", "args")
+
+    func: t.Callable[..., T]
+    args: t.Tuple[t.Any, ...]
+
+    def __init__(self, func: t.Callable[..., T], *args: t.Any) -> None:
+        self.func = func
+        self.args = args
+
+    def __repr__(self) -> builtins.str:
+        args = ", ".join(repr(arg) for arg in self.args)
+
+        return f"<{__name__}.{self.__class__.__name__} {args}>"
+
+    def resolve(
+        self,
+        environ: t.Optional[Environ] = None,
+    ) -> T:
+        """
+        Read the value, from ``environ`` if given.
+        """
+        if environ is None:
+            return self.func(*self.args)
+
+        token = ENVIRON.set(environ)
+
+        try:
+            return self.func(*self.args)
+        finally:
+            ENVIRON.reset(token)
+
+
+class LazyEnvVar(t.Generic[T]):
+    """
+    The same API as `EnvVar`, but returns a `LazyDefault` instead of reading
+    the environment. The return types match `EnvVar` so that these can be used
+    as defaults on annotated config classes.
+    """
+
+    env_var: EnvVar[T]
+
+    def __init__(self, env_var: EnvVar[T]):
+        self.env_var = env_var
+
+    def __call__(
+        self,
+        env_var_name: builtins.str,
+        default: Missing | builtins.str | T = MISSING,
+    ) -> T:
+        return t.cast(T, LazyDefault(self.env_var, env_var_name, default))
+
+    def optional(self, env_var_name: builtins.str) -> t.Optional[T]:
+        return t.cast(
+            t.Optional[T],
+            LazyDefault(self.env_var.optional, env_var_name),
+        )
+
+    def list(
+        self,
+        env_var_name: builtins.str,
+        default: Missing | t.List[T] = MISSING,
+        separator: builtins.str = LIST_SEPARATOR,
+    ) -> t.List[T]:
+        return t.cast(
+            t.List[T],
+            LazyDefault(self.env_var.list, env_var_name, default, separator),
+        )
+
+    def list_optional(
+        self,
+        env_var_name: builtins.str,
+        separator: builtins.str = LIST_SEPARATOR,
+    ) -> t.List[T] | None:
+        return t.cast(
+            t.Optional[t.List[T]],
+            LazyDefault(self.env_var.list_optional, env_var_name, separator),
+        )
+
+
 def parse_str(raw_value: builtins.str) -> builtins.str:
     """
     Parse an environment variable value as a string.
@@ -226,6 +537,18 @@ def parse_float(raw_value: builtins.str | builtins.float) -> builtins.float:
         raise InvalidConfig(f"{raw_value!r} is not a valid number")
 
 
+def typed(type_: t.Type[T]) -> EnvVar[T]:
+    """
+    Returns a helper for any type registered with ``cfg.register_type``,
+    including `decimal.Decimal`, `datetime` and `ipaddress` types:
+
+    ```python
+    TIMEOUT = env.typed(datetime.timedelta)("TIMEOUT", "30s")
+    ```
+    """
+    return EnvVar[T](get_parser(type_))
+
+
 str = EnvVar[builtins.str](parse_str)
 bool = EnvVar[builtins.bool](parse_bool)
 int = EnvVar[builtins.int](parse_int)
@@ -233,3 +556,35 @@ float = EnvVar[builtins.float](parse_float)
 url = EnvVar[Url](parse_url)
 path = EnvVar[Path](parse_path)
 email = EnvVar[builtins.str](parse_email)
+
+
+class Lazy:
+    """
+    Lazy versions of the env helpers, for use as config class defaults:
+
+    ```python
+    class MySQL:
+        user: str = env.lazy.str("MYSQL_USER", "definitely_not_root")
+    ```
+
+    The environment is only read when ``cfg.into`` fills in the default, and
+    every lazy default in a single ``cfg.into`` call sees the same snapshot of
+    the environment.
+    """
+
+    str = LazyEnvVar[builtins.str](str)
+    bool = LazyEnvVar[builtins.bool](bool)
+    int = LazyEnvVar[builtins.int](int)
+    float = LazyEnvVar[builtins.float](float)
+    url = LazyEnvVar[Url](url)
+    path = LazyEnvVar[Path](path)
+    email = LazyEnvVar[builtins.str](email)
+
+    def typed(self, type_: t.Type[T]) -> LazyEnvVar[T]:
+        """
+        Lazy version of `typed`.
+        """
+        return LazyEnvVar[T](typed(type_))
+
+
+lazy = Lazy()
@@ -0,0 +1,181 @@
+"""
+Immutable building blocks for configs created with ``cfg.into(...,
+frozen=True)``.
+"""
+
+import typing as t
+import weakref
+
+__all__ = (
+    "Frozen",
+    "FrozenDict",
+    "create",
+    "frozen_class",
+    "is_frozen",
+)
+
+K = t.TypeVar("K")
+V = t.TypeVar("V")
+
+#: Name of the class attribute holding the field names of a frozen class.
+FIELDS_ATTR = "__configur8_fields__"
+#: Name of the slot caching the hash of a frozen instance.
+HASH_ATTR = "__configur8_hash__"
+
+
+def readonly(self: t.Any, *args: t.Any, **kwargs: t.Any) -> t.NoReturn:
+    raise TypeError(f"{self.__class__.__name__} is immutable")
+
+
+class FrozenDict(t.Dict[K, V]):
+    """
+    A read-only, hashable ``dict``. Lookups are as fast as a plain ``dict``.
+    """
+
+    __slots__ = ("_hash",)
+
+    _hash: t.Optional[int]
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._hash = None
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        ret = self._hash
+
+        if ret is None:
+            ret = self._hash = hash(frozenset(self.items()))
+
+        return ret
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict.__repr__(self)})"
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        return (self.__class__, (dict(self),))
+
+    def __copy__(self) -> "FrozenDict[K, V]":
+        return self
+
+    def __deepcopy__(self, memo: t.Any) -> "FrozenDict[K, V]":
+        return self
+
+    __setitem__ = readonly
+    __delitem__ = readonly
+    __ior__ = readonly
+    clear = readonly
+    pop = readonly
+    popitem = readonly
+    setdefault = readonly
+    update = readonly  # type: ignore[assignment]
+
+
+class Frozen:
+    """
+    Mixed into a config class by `frozen_class`. Instances cannot be changed,
+    compare and hash by value, and copying returns the same instance.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise AttributeError(f"{self.__class__.__qualname__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__qualname__} is immutable")
+
+    def __values(self) -> t.Tuple[t.Any, ...]:
+        return tuple(getattr(self, name) for name in getattr(self, FIELDS_ATTR))
+
+    def __eq__(self, other: t.Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return bool(self.__values() == other.__values())
+
+    def __hash__(self) -> int:
+        try:
+            return t.cast(int, object.__getattribute__(self, HASH_ATTR))
+        except AttributeError:
+            ret = hash((self.__class__, self.__values()))
+            object.__setattr__(self, HASH_ATTR, ret)
+
+            return ret
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in getattr(self, FIELDS_ATTR)
+        )
+
+        return f"{self.__class__.__qualname__}({fields})"
+
+    def __copy__(self) -> t.Any:
+        return self
+
+    def __deepcopy__(self, memo: t.Any) -> t.Any:
+        return self
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        return (
+            create,
+            (
+                self.__class__.__bases__[1],
+                getattr(self, FIELDS_ATTR),
+                self.__values(),
+            ),
+        )
+
+
+#: Frozen subclasses by config class. The subclass is only weakly referenced,
+#: as it refers to the config class, and is created again if it was collected.
+FROZEN_CLASSES: "weakref.WeakKeyDictionary[t.Type, weakref.ref[t.Type]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def frozen_class(config: t.Type, names: t.Iterable[str]) -> t.Type:
+    """
+    Returns a subclass of ``config`` whose instances are immutable. Created
+    once per class.
+    """
+    cached = FROZEN_CLASSES.get(config)
+    existing = None if cached is None else cached()
+
+    if existing is not None:
+        return existing
+
+    metaclass: t.Any = type(config)
+    ret: t.Type = metaclass(
+        config.__name__,
+        (Frozen, config),
+        {
+            "__slots__": (HASH_ATTR,),
+            "__qualname__": config.__qualname__,
+            "__module__": config.__module__,
+            FIELDS_ATTR: tuple(names),
+        },
+    )
+    FROZEN_CLASSES[config] = weakref.ref(ret)
+
+    return ret
+
+
+def create(
+    config: t.Type,
+    names: t.Sequence[str],
+    values: t.Sequence[t.Any],
+) -> t.Any:
+    """
+    Create a frozen instance of ``config`` without calling ``__init__``.
+    """
+    ret = object.__new__(frozen_class(config, names))
+
+    for name, value in zip(names, values):
+        object.__setattr__(ret, name, value)
+
+    return ret
+
+
+def is_frozen(value: t.Any) -> bool:
+    return isinstance(value, Frozen)
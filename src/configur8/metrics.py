@@ -0,0 +1,452 @@
+"""
+Counters and latency histograms for config loading, for scraping alongside
+an application's own metrics.
+
+Example:
+
+```python
+from configur8 import metrics
+
+metrics.snapshot()  # plain data
+metrics.render()  # OpenMetrics text exposition
+```
+
+The following are recorded in every process, there is nothing to enable:
+
+* ``configur8_operations_total`` and ``configur8_operation_duration_seconds``
+  per ``operation``: ``load``, ``parse``, ``validate`` (``cfg.into``),
+  ``load_dir``, ``load_volume`` and ``email``, with a ``result`` of ``ok`` or
+  ``error``.
+* ``configur8_env_lookups_total`` per ``result``: ``found`` or ``missing``.
+* ``configur8_cache_requests_total`` per ``cache`` (``fragments``,
+  ``volumes`` and ``dotenv``) and ``result``: ``hit`` or ``miss``.
+
+Values are kept per process, so work done in a process pool (e.g. with
+``cfg.Parallel``) is not included.
+"""
+
+import abc
+import bisect
+import functools
+import itertools
+import math
+import threading
+import time
+import typing as t
+
+__all__ = (
+    "Counter",
+    "Histogram",
+    "Registry",
+    "render",
+    "reset",
+    "snapshot",
+    "timed",
+)
+
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
+#: Upper bounds of the default latency buckets, in seconds.
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    math.inf,
+)
+
+
+def format_labels(names: t.Sequence[str], values: t.Sequence[str]) -> str:
+    if not names:
+        return ""
+
+    pairs = ",".join(
+        f'{name}="{escape(value)}"' for name, value in zip(names, values)
+    )
+
+    return f"{{{pairs}}}"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+
+    return repr(float(value))
+
+
+class CounterChild:
+    """
+    A `Counter` for one set of label values.
+
+    Counters are incremented on hot paths such as env lookups, so increments
+    advance an `itertools.count` without taking a lock. Reading the value
+    advances it too, which is accounted for by ``reads``.
+    """
+
+    __slots__ = ("counter", "reads", "lock")
+
+    counter: t.Iterator[int]
+    reads: int
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.reset()
+
+    def inc(self, amount: int = 1) -> None:
+        if amount == 1:
+            next(self.counter)
+            return
+
+        for _ in range(amount):
+            next(self.counter)
+
+    @property
+    def value(self) -> int:
+        with self.lock:
+            ret = next(self.counter) - self.reads
+            self.reads += 1
+
+        return ret
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counter = itertools.count()
+            self.reads = 0
+
+
+class HistogramChild:
+    """
+    A `Histogram` for one set of label values.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "lock")
+
+    buckets: t.Tuple[float, ...]
+    #: Observations per bucket, not cumulative.
+    counts: t.List[int]
+    count: int
+    sum: float
+
+    def __init__(self, buckets: t.Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self.lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counts = [0] * len(self.buckets)
+            self.count = 0
+            self.sum = 0.0
+
+    def cumulative(self) -> t.List[t.Tuple[float, int]]:
+        total = 0
+        ret = []
+
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            ret.append((bound, total))
+
+        return ret
+
+
+Child = t.TypeVar("Child", CounterChild, HistogramChild)
+M = t.TypeVar("M", "Counter", "Histogram")
+
+
+class Metric(abc.ABC, t.Generic[Child]):
+    """
+    A metric family. Values are held per set of label values by a child,
+    which callers on hot paths look up once with `labels` and keep.
+    """
+
+    type: t.ClassVar[str]
+
+    name: str
+    help: str
+    label_names: t.Tuple[str, ...]
+    children: t.Dict[t.Tuple[str, ...], Child]
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: t.Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.children = {}
+        self.lock = threading.Lock()
+
+    @abc.abstractmethod
+    def create_child(self) -> Child:
+        """
+        Returns a new child holding the values for one set of labels.
+        """
+
+    def labels(self, *values: str) -> Child:
+        if len(values) != len(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {self.label_names!r}, got "
+                f"{values!r}"
+            )
+
+        try:
+            return self.children[values]
+        except KeyError:
+            pass
+
+        with self.lock:
+            ret = self.children.get(values)
+
+            if ret is None:
+                ret = self.children[values] = self.create_child()
+
+            return ret
+
+    def reset(self) -> None:
+        # children are kept, as callers hold on to them
+        for child in list(self.children.values()):
+            child.reset()
+
+    def items(self) -> t.List[t.Tuple[t.Tuple[str, ...], Child]]:
+        with self.lock:
+            return sorted(self.children.items())
+
+
+class Counter(Metric[CounterChild]):
+    type = "counter"
+
+    def create_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, *values: str) -> None:
+        self.labels(*values).inc()
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return {
+            "type": self.type,
+            "help": self.help,
+            "samples": [
+                {
+                    "labels": dict(zip(self.label_names, values)),
+                    "value": child.value,
+                }
+                for values, child in self.items()
+            ],
+        }
+
+    def render(self) -> t.List[str]:
+        return [
+            f"{self.name}_total{format_labels(self.label_names, values)} "
+            f"{child.value}"
+            for values, child in self.items()
+        ]
+
+
+class Histogram(Metric[HistogramChild]):
+    type = "histogram"
+
+    buckets: t.Tuple[float, ...]
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        label_names: t.Sequence[str] = (),
+        buckets: t.Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+        if self.buckets[-1] != math.inf:
+            self.buckets += (math.inf,)
+
+    def create_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return {
+            "type": self.type,
+            "help": self.help,
+            "samples": [
+                {
+                    "labels": dict(zip(self.label_names, values)),
+                    "count": child.count,
+                    "sum": child.sum,
+                    "buckets": {
+                        format_value(bound): count
+                        for bound, count in child.cumulative()
+                    },
+                }
+                for values, child in self.items()
+            ],
+        }
+
+    def render(self) -> t.List[str]:
+        lines = []
+        names = self.label_names + ("le",)
+
+        for values, child in self.items():
+            for bound, count in child.cumulative():
+                labels = format_labels(names, values + (format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {count}")
+
+            labels = format_labels(self.label_names, values)
+            lines.append(f"{self.name}_count{labels} {child.count}")
+            lines.append(f"{self.name}_sum{labels} {child.sum!r}")
+
+        return lines
+
+
+class Registry:
+    """
+    A set of metrics that are exported together.
+    """
+
+    metrics: t.Dict[str, Counter | Histogram]
+
+    def __init__(self) -> None:
+        self.metrics = {}
+
+    def register(self, metric: M) -> M:
+        if metric.name in self.metrics:
+            raise ValueError(f"{metric.name} is already registered")
+
+        self.metrics[metric.name] = metric
+
+        return metric
+
+    def snapshot(self) -> t.Dict[str, t.Any]:
+        """
+        Returns the current values as plain data, keyed by metric name.
+        """
+        return {
+            name: metric.to_dict() for name, metric in self.metrics.items()
+        }
+
+    def render(self) -> str:
+        """
+        Returns the current values in the OpenMetrics text format.
+        """
+        lines = []
+
+        for name, metric in self.metrics.items():
+            lines.append(f"# TYPE {name} {metric.type}")
+            lines.append(f"# HELP {name} {escape(metric.help)}")
+            lines.extend(metric.render())
+
+        lines.append("# EOF")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """
+        Set every value back to zero.
+        """
+        for metric in self.metrics.values():
+            metric.reset()
+
+
+#: The registry configur8 records to.
+REGISTRY = Registry()
+
+OPERATIONS = REGISTRY.register(
+    Counter(
+        "configur8_operations",
+        "Config operations by outcome.",
+        ("operation", "result"),
+    )
+)
+DURATIONS = REGISTRY.register(
+    Histogram(
+        "configur8_operation_duration_seconds",
+        "Time taken by config operations.",
+        ("operation",),
+    )
+)
+ENV_LOOKUPS = REGISTRY.register(
+    Counter(
+        "configur8_env_lookups",
+        "Environment variable lookups by whether the variable was set.",
+        ("result",),
+    )
+)
+CACHE_REQUESTS = REGISTRY.register(
+    Counter(
+        "configur8_cache_requests",
+        "Lookups in configur8's file caches.",
+        ("cache", "result"),
+    )
+)
+
+
+def timed(operation: str) -> t.Callable[[F], F]:
+    """
+    Decorate a function to count its calls and record their duration as
+    ``operation``.
+    """
+    ok = OPERATIONS.labels(operation, "ok")
+    error = OPERATIONS.labels(operation, "error")
+    duration = DURATIONS.labels(operation)
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            start = time.perf_counter()
+
+            try:
+                ret = func(*args, **kwargs)
+            except BaseException:
+                error.inc()
+                raise
+            else:
+                ok.inc()
+            finally:
+                duration.observe(time.perf_counter() - start)
+
+            return ret
+
+        return t.cast(F, wrapper)
+
+    return decorator
+
+
+def snapshot() -> t.Dict[str, t.Any]:
+    """
+    Returns the current values of configur8's metrics as plain data.
+    """
+    return REGISTRY.snapshot()
+
+
+def render() -> str:
+    """
+    Returns configur8's metrics in the OpenMetrics text format.
+    """
+    return REGISTRY.render()
+
+
+def reset() -> None:
+    """
+    Set all of configur8's metrics back to zero.
+    """
+    REGISTRY.reset()
@@ -27,6 +27,10 @@ class Path:
 
         raise TypeError(f"Cannot compare {other!r} with <Url>")
 
+    def __hash__(self) -> int:
+        # equal to its string form, so hashes the same
+        return hash(str(self))
+
     def open(
         self,
         mode: str = "r",
@@ -0,0 +1,261 @@
+"""
+Find out where time goes while loading a config.
+
+Example:
+
+```python
+from configur8 import cfg
+
+with cfg.profile() as profile:
+    config = cfg.load(Config, "/path/to/config.yaml")
+
+print(profile.report())
+```
+
+Time is recorded per config class and per path within the config (list indexes
+are collapsed to ``[*]``), along with union attempts and the split between
+reading, decoding and validating. When no profile is active the only cost is a
+single `contextvars.ContextVar.get` per config class.
+"""
+
+import contextlib
+import contextvars
+import time
+import typing as t
+
+__all__ = (
+    "Profile",
+    "profile",
+)
+
+T = t.TypeVar("T")
+
+#: The profile currently collecting, if any.
+ACTIVE: contextvars.ContextVar[t.Optional["Profile"]] = contextvars.ContextVar(
+    "configur8_profile",
+    default=None,
+)
+
+
+class Timing:
+    """
+    Accumulated time for a class or path. ``own`` excludes time spent in
+    nested config classes.
+    """
+
+    __slots__ = ("count", "total", "own")
+
+    count: int
+    total: float
+    own: float
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.own = 0.0
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return {"count": self.count, "total": self.total, "own": self.own}
+
+
+class UnionStats:
+    """
+    ``attempts`` counts each member tried, ``failures`` each member that did
+    not match and ``misses`` each value that matched no member at all.
+    """
+
+    __slots__ = ("attempts", "failures", "misses")
+
+    attempts: int
+    failures: int
+    misses: int
+
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.failures = 0
+        self.misses = 0
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        return {
+            "attempts": self.attempts,
+            "failures": self.failures,
+            "misses": self.misses,
+        }
+
+
+def frame_key(frame: t.Any) -> str:
+    """
+    Render a ``cfg.Frame`` chain as a path with list indexes collapsed.
+    """
+    parts: t.List[str | int] = []
+
+    while frame is not None:
+        frame, name = frame
+        parts.append(name)
+
+    ret = ""
+
+    for part in reversed(parts):
+        if isinstance(part, int):
+            ret += "[*]"
+        elif ret:
+            ret += "." + part
+        else:
+            ret = part
+
+    return ret
+
+
+class Profile:
+    #: Seconds spent per phase, i.e. ``read``, ``decode`` and ``validate``.
+    phases: t.Dict[str, float]
+    classes: t.Dict[str, Timing]
+    paths: t.Dict[str, Timing]
+    unions: t.Dict[str, UnionStats]
+
+    def __init__(self) -> None:
+        self.phases = {}
+        self.classes = {}
+        self.paths = {}
+        self.unions = {}
+        # time spent in nested classes, per level of the current traversal
+        self._children: t.List[float] = []
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> t.Iterator[None]:
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def measure(
+        self,
+        config: t.Type,
+        frame: t.Any,
+        func: t.Callable[[], T],
+    ) -> T:
+        """
+        Call ``func``, recording the time against ``config`` and ``frame``.
+        """
+        children = self._children
+        children.append(0.0)
+        start = time.perf_counter()
+
+        try:
+            return func()
+        finally:
+            elapsed = time.perf_counter() - start
+            own = elapsed - children.pop()
+
+            if children:
+                children[-1] += elapsed
+
+            for key, timings in (
+                (config.__qualname__, self.classes),
+                (frame_key(frame), self.paths),
+            ):
+                try:
+                    timing = timings[key]
+                except KeyError:
+                    timing = timings[key] = Timing()
+
+                timing.count += 1
+                timing.total += elapsed
+                timing.own += own
+
+    def union(self, type_: t.Any) -> UnionStats:
+        key = repr(type_)
+
+        try:
+            return self.unions[key]
+        except KeyError:
+            ret = self.unions[key] = UnionStats()
+
+            return ret
+
+    def to_dict(self, sort: str = "total") -> t.Dict[str, t.Any]:
+        """
+        Export the profile as plain data, slowest first.
+
+        :param sort: Either ``total`` or ``own``.
+        """
+
+        def timings(items: t.Dict[str, Timing]) -> t.List[t.Dict[str, t.Any]]:
+            return [
+                {"name": name, **timing.to_dict()}
+                for name, timing in sorted(
+                    items.items(),
+                    key=lambda item: getattr(item[1], sort),
+                    reverse=True,
+                )
+            ]
+
+        return {
+            "phases": dict(self.phases),
+            "classes": timings(self.classes),
+            "paths": timings(self.paths),
+            "unions": [
+                {"name": name, **stats.to_dict()}
+                for name, stats in sorted(
+                    self.unions.items(),
+                    key=lambda item: item[1].failures,
+                    reverse=True,
+                )
+            ],
+        }
+
+    def report(self, sort: str = "total", limit: int = 20) -> str:
+        """
+        Render the profile as a text table, slowest first.
+        """
+        data = self.to_dict(sort=sort)
+        lines = []
+
+        for name, elapsed in data["phases"].items():
+            lines.append(f"{name:<48} {elapsed * 1000:>12.3f}ms")
+
+        for section in ("classes", "paths"):
+            lines.append("")
+            lines.append(
+                f"{section:<48} {'count':>8} {'total':>14} {'own':>14}"
+            )
+
+            for row in data[section][:limit]:
+                lines.append(
+                    f"{row['name']:<48} {row['count']:>8} "
+                    f"{row['total'] * 1000:>12.3f}ms "
+                    f"{row['own'] * 1000:>12.3f}ms"
+                )
+
+        if data["unions"]:
+            lines.append("")
+            lines.append(
+                f"{'unions':<48} {'attempts':>8} {'failures':>14} "
+                f"{'misses':>14}"
+            )
+
+            for row in data["unions"][:limit]:
+                lines.append(
+                    f"{row['name']:<48} {row['attempts']:>8} "
+                    f"{row['failures']:>14} {row['misses']:>14}"
+                )
+
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def profile() -> t.Iterator[Profile]:
+    """
+    Collect a `Profile` of all ``cfg.into``, ``cfg.parse`` and ``cfg.load``
+    calls made within the block.
+    """
+    ret = Profile()
+    token = ACTIVE.set(ret)
+
+    try:
+        yield ret
+    finally:
+        ACTIVE.reset(token)
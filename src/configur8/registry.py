@@ -0,0 +1,330 @@
+"""
+Parsers for value types that are not config classes, shared by ``cfg`` and
+``env``.
+
+Example:
+
+```python
+from configur8 import cfg, env
+
+
+class Money:
+    ...
+
+
+cfg.register_type(Money, Money.parse, encode=str)
+
+LIMIT = env.typed(Money)("LIMIT")
+```
+
+Handlers are found with a ``dict`` lookup on the exact type, or the origin of
+a generic alias. Subclasses of a registered class fall back to the nearest
+registered class in their MRO, which is worked out once per type.
+
+`decimal.Decimal`, `datetime.datetime`, `datetime.date`, `datetime.time`,
+`datetime.timedelta`, the `ipaddress` types, `configur8.url.Url` and
+`configur8.path.Path` are registered by default. Subclasses of `enum.Enum`
+without a registered handler get one from `enum_handler`.
+"""
+
+import datetime
+import decimal
+import enum
+import inspect
+import ipaddress
+import re
+import typing as t
+import weakref
+
+from .path import Path
+from .path import parse as parse_path
+from .url import Url
+from .url import parse as parse_url
+
+__all__ = (
+    "Handler",
+    "get_parser",
+    "lookup",
+    "register",
+)
+
+T = t.TypeVar("T")
+
+Parser = t.Callable[[t.Any], t.Any]
+Encoder = t.Callable[[t.Any], t.Any]
+
+
+class Handler:
+    """
+    How to parse values of a registered type and encode them back into plain
+    data.
+    """
+
+    __slots__ = ("type", "parse", "encode")
+
+    type: t.Type
+    parse: Parser
+    encode: Encoder
+
+    def __init__(self, type_: t.Type, parse: Parser, encode: Encoder) -> None:
+        self.type = type_
+        self.parse = parse
+        self.encode = encode
+
+    def __repr__(self) -> str:
+        return f"<{__name__}.{self.__class__.__name__} {self.type!r}>"
+
+
+#: Registered handlers, keyed by type.
+HANDLERS: t.Dict[t.Type, Handler] = {}
+#: Results of `lookup`, including MRO fallbacks and misses. Types are weakly
+#: referenced so that classes created at runtime can be collected.
+RESOLVED: "weakref.WeakKeyDictionary[t.Any, t.Optional[Handler]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def register(
+    type_: t.Type[T],
+    parse: t.Callable[[t.Any], T],
+    encode: Encoder = str,
+) -> None:
+    """
+    Register how to parse values of ``type_``, replacing any existing
+    handler.
+
+    :param parse: Called with the raw value, e.g. a ``str`` from YAML or the
+        environment. Raises `ValueError`, `TypeError`, `ArithmeticError` or
+        `configur8.InvalidConfig` if the value is not valid.
+    :param encode: Turns a parsed value back into plain data.
+    """
+    HANDLERS[type_] = Handler(type_, parse, encode)
+    RESOLVED.clear()
+
+
+def resolve(type_: t.Any) -> t.Optional[Handler]:
+    try:
+        return HANDLERS[type_]
+    except KeyError:
+        pass
+
+    origin = t.get_origin(type_)
+
+    if origin is not None:
+        try:
+            return HANDLERS[origin]
+        except (KeyError, TypeError):
+            return None
+
+    if not inspect.isclass(type_):
+        return None
+
+    for base in type_.__mro__[1:]:
+        try:
+            return HANDLERS[base]
+        except KeyError:
+            pass
+
+    if issubclass(type_, enum.Enum):
+        return enum_handler(type_)
+
+    return None
+
+
+def lookup(type_: t.Any) -> t.Optional[Handler]:
+    """
+    Returns the handler for ``type_``, or ``None`` if it has none.
+    """
+    try:
+        return RESOLVED[type_]
+    except KeyError:
+        ret = RESOLVED[type_] = resolve(type_)
+
+        return ret
+    except TypeError:
+        pass
+
+    # e.g. `int | None`, which cannot be weakly referenced
+    try:
+        return resolve(type_)
+    except TypeError:
+        # unhashable annotation
+        return None
+
+
+def get_parser(type_: t.Type[T]) -> t.Callable[[t.Any], T]:
+    """
+    Returns the parser for ``type_``.
+
+    :raises TypeError: If ``type_`` is not registered.
+    """
+    handler = lookup(type_)
+
+    if handler is None:
+        raise TypeError(f"No parser registered for {type_!r}")
+
+    return handler.parse
+
+
+def parse_decimal(value: t.Any) -> decimal.Decimal:
+    if isinstance(value, decimal.Decimal):
+        return value
+
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"Expected a number, got {value!r}")
+
+    # ``str`` avoids the binary representation error of floats
+    return decimal.Decimal(str(value))
+
+
+def parse_datetime(value: t.Any) -> datetime.datetime:
+    if isinstance(value, datetime.datetime):
+        return value
+
+    if not isinstance(value, str):
+        raise TypeError(f"Expected an ISO 8601 datetime, got {value!r}")
+
+    return datetime.datetime.fromisoformat(value)
+
+
+def parse_date(value: t.Any) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        raise TypeError(f"Expected a date, got datetime {value!r}")
+
+    if isinstance(value, datetime.date):
+        return value
+
+    if not isinstance(value, str):
+        raise TypeError(f"Expected an ISO 8601 date, got {value!r}")
+
+    return datetime.date.fromisoformat(value)
+
+
+def parse_time(value: t.Any) -> datetime.time:
+    if isinstance(value, datetime.time):
+        return value
+
+    if not isinstance(value, str):
+        raise TypeError(f"Expected an ISO 8601 time, got {value!r}")
+
+    return datetime.time.fromisoformat(value)
+
+
+#: Units accepted by `parse_timedelta`, in seconds.
+DURATION_UNITS = {
+    "d": 86400.0,
+    "h": 3600.0,
+    "m": 60.0,
+    "s": 1.0,
+    "ms": 0.001,
+    "us": 0.000001,
+}
+DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|us|d|h|m|s)")
+DURATIONS = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|us|d|h|m|s))+")
+
+
+def parse_timedelta(value: t.Any) -> datetime.timedelta:
+    """
+    Accepts a number of seconds or a string such as ``1h30m`` or ``250ms``.
+    """
+    if isinstance(value, datetime.timedelta):
+        return value
+
+    if isinstance(value, bool):
+        raise TypeError(f"Expected a duration, got {value!r}")
+
+    if isinstance(value, (int, float)):
+        return datetime.timedelta(seconds=value)
+
+    if not isinstance(value, str):
+        raise TypeError(f"Expected a duration, got {value!r}")
+
+    value = value.strip()
+
+    if not DURATIONS.fullmatch(value):
+        return datetime.timedelta(seconds=float(value))
+
+    return datetime.timedelta(
+        seconds=sum(
+            float(amount) * DURATION_UNITS[unit]
+            for amount, unit in DURATION.findall(value)
+        )
+    )
+
+
+def encode_timedelta(value: datetime.timedelta) -> float:
+    return value.total_seconds()
+
+
+def enum_handler(type_: t.Type[enum.Enum]) -> Handler:
+    """
+    Returns a handler that resolves members of ``type_`` by value, then by
+    name, using a ``dict`` built once. Members are encoded as their value.
+    """
+    members: t.Dict[t.Any, enum.Enum] = dict(type_.__members__)
+
+    for member in type_:
+        try:
+            members[member.value] = member
+        except TypeError:
+            # unhashable values are left to ``type_(value)``
+            pass
+
+    def parse(value: t.Any) -> enum.Enum:
+        if isinstance(value, type_):
+            return value
+
+        try:
+            return members[value]
+        except (KeyError, TypeError):
+            pass
+
+        # e.g. combinations of `enum.Flag` members
+        return type_(value)
+
+    return Handler(type_, parse, encode_enum)
+
+
+def encode_enum(value: enum.Enum) -> t.Any:
+    return value.value
+
+
+def from_str(
+    type_: t.Type[T],
+    parse: t.Callable[[str], T],
+) -> t.Callable[[t.Any], T]:
+    """
+    Returns a parser that passes instances of ``type_`` through, parses
+    strings with ``parse`` and rejects anything else.
+    """
+
+    def ret(value: t.Any) -> T:
+        if isinstance(value, type_):
+            return value
+
+        if not isinstance(value, str):
+            raise TypeError(f"Expected str, got {value!r}")
+
+        return parse(value)
+
+    return ret
+
+
+register(decimal.Decimal, parse_decimal)
+register(datetime.datetime, parse_datetime, datetime.datetime.isoformat)
+register(datetime.date, parse_date, datetime.date.isoformat)
+register(datetime.time, parse_time, datetime.time.isoformat)
+register(datetime.timedelta, parse_timedelta, encode_timedelta)
+
+for ip_type in (
+    ipaddress.IPv4Address,
+    ipaddress.IPv6Address,
+    ipaddress.IPv4Network,
+    ipaddress.IPv6Network,
+    ipaddress.IPv4Interface,
+    ipaddress.IPv6Interface,
+):
+    register(ip_type, from_str(ip_type, ip_type))
+
+register(Url, from_str(Url, parse_url))
+register(Path, from_str(Path, parse_path))
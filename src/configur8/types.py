@@ -6,6 +6,10 @@ __all__ = ("is_union_type",)
 
 NoneType = types.NoneType  # type: ignore
 
+#: Where ``cfg.slotted`` keeps the default values of a class, as they cannot
+#: be class attributes alongside ``__slots__``.
+DEFAULTS_ATTR = "__configur8_defaults__"
+
 
 def is_union_type(type_: t.Any) -> bool:
     if hasattr(types, "UnionType") and isinstance(type_, types.UnionType):
@@ -70,6 +74,54 @@ def is_literal_type(type_: t.Any) -> bool:
     return False
 
 
+def is_named_tuple(type_: t.Any) -> bool:
+    return (
+        inspect.isclass(type_)
+        and issubclass(type_, tuple)
+        and hasattr(type_, "_fields")
+    )
+
+
+def is_typed_dict(type_: t.Any) -> bool:
+    return (
+        inspect.isclass(type_)
+        and issubclass(type_, dict)
+        and hasattr(type_, "__required_keys__")
+    )
+
+
+#: Wrappers of `typing.TypedDict` keys that do not change their type.
+TYPED_DICT_QUALIFIERS = tuple(
+    getattr(t, name)
+    for name in ("Required", "NotRequired", "ReadOnly")
+    if hasattr(t, name)
+)
+
+
+def get_typed_dict_fields(config: t.Type) -> t.Dict[str, t.Any]:
+    """
+    Returns the types of the keys of a `typing.TypedDict`, without
+    ``Required``/``NotRequired`` wrappers. ``Annotated`` metadata is kept.
+    """
+    try:
+        hints = t.get_type_hints(config, include_extras=True)
+    except NameError:
+        # forward references that cannot be resolved from the module
+        hints = dict(config.__annotations__)
+
+    for name, type_ in hints.items():
+        while t.get_origin(type_) in TYPED_DICT_QUALIFIERS:
+            type_ = t.get_args(type_)[0]
+
+        hints[name] = type_
+
+    return hints
+
+
+def is_annotated_type(type_: t.Any) -> bool:
+    return hasattr(type_, "__metadata__") and hasattr(type_, "__origin__")
+
+
 def get_annotation(
     config: t.Type,
 ) -> t.Tuple[
@@ -87,10 +139,15 @@ def get_annotation(
         if not hasattr(cls, "__annotations__"):
             continue
 
+        defaults = cls.__dict__.get(DEFAULTS_ATTR)
+
         for name, type_ in cls.__annotations__.items():
             annotations[name] = type_
 
-            if hasattr(cls, name):
+            if defaults is not None:
+                if name in defaults:
+                    default_values[name] = defaults[name]
+            elif hasattr(cls, name):
                 default_values[name] = getattr(cls, name)
 
     return annotations, default_values
@@ -28,6 +28,10 @@ class Url:
 
         raise TypeError(f"Cannot compare {other!r} with <Url>")
 
+    def __hash__(self) -> int:
+        # equal to its string form, so hashes the same
+        return hash(str(self))
+
     @property
     def protocol(self) -> str | None:
         if self.result.scheme == "":
@@ -0,0 +1,213 @@
+import os
+import threading
+from concurrent import futures
+
+import pytest
+
+from configur8 import cfg, dotenv, env
+
+DOTENV = """
+# database
+export DB_HOST=localhost
+DB_PORT = 5432  # default port
+DB_USER=
+DB_URL="postgres://${DB_USER:-app}@$DB_HOST:${DB_PORT}/app"
+GREETING='hello $DB_HOST # not a comment'
+MOTD="line one\\nline \\"two\\" \\$DB_HOST"
+MULTI="first
+second"
+FRAGMENT=a#b
+"""
+
+
+@pytest.fixture
+def path(tmp_path):
+    ret = tmp_path / ".env"
+    ret.write_text(DOTENV)
+
+    return str(ret)
+
+
+@pytest.fixture
+def unload():
+    env.unload_dotenv()
+
+    yield
+
+    env.unload_dotenv()
+
+
+def test_tokenize():
+    assert dict(dotenv.tokenize("A=1\nB=$A\n")) == {
+        "A": "1",
+        "B": (dotenv.Ref("A"),),
+    }
+
+
+def test_tokenize_crlf():
+    assert dotenv.tokenize(
+        "# comment\r\n\r\nA=\"x\"\r\nB=y\r\nC='z' # note\r\n"
+    ) == [("A", "x"), ("B", "y"), ("C", "z")]
+
+
+def test_load(path, monkeypatch):
+    monkeypatch.delenv("DB_HOST", raising=False)
+
+    with env.use_dotenv(path):
+        assert env.str("DB_HOST") == "localhost"
+        assert env.int("DB_PORT") == 5432
+        assert env.str("DB_USER") == ""
+        assert env.str("DB_URL") == "postgres://app@localhost:5432/app"
+        assert env.str("GREETING") == "hello $DB_HOST # not a comment"
+        assert env.str("MOTD") == 'line one\nline "two" $DB_HOST'
+        assert env.str("MULTI") == "first\nsecond"
+        assert env.str("FRAGMENT") == "a#b"
+
+    assert "DB_HOST" not in os.environ
+    assert env.str.optional("DB_HOST") is None
+
+
+def test_precedence(path, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "db.internal")
+
+    with env.use_dotenv(path):
+        assert env.str("DB_HOST") == "db.internal"
+        assert env.str("DB_URL") == "postgres://app@db.internal:5432/app"
+
+    with env.use_dotenv(path, override=True):
+        assert env.str("DB_HOST") == "localhost"
+        assert env.str("DB_URL") == "postgres://app@localhost:5432/app"
+
+
+def test_lazy_defaults(path):
+    class Database:
+        host: str = env.lazy.str("DB_HOST")
+        port: int = env.lazy.int("DB_PORT")
+
+    with env.use_dotenv(path, override=True):
+        config = cfg.into(Database, {})
+
+    assert (config.host, config.port) == ("localhost", 5432)
+
+
+def test_cached(path, mocker):
+    with env.use_dotenv(path):
+        pass
+
+    tokenize = mocker.spy(dotenv, "tokenize")
+
+    with env.use_dotenv(path):
+        pass
+
+    assert tokenize.call_count == 0
+
+    with open(path, "a") as fp:
+        fp.write("EXTRA=1\n")
+
+    with env.use_dotenv(path):
+        assert env.int("EXTRA") == 1
+
+    assert tokenize.call_count == 1
+
+
+def test_missing(tmp_path):
+    missing = str(tmp_path / "missing.env")
+
+    with env.use_dotenv(missing) as environ:
+        assert environ is os.environ
+
+    with pytest.raises(FileNotFoundError):
+        with env.use_dotenv(missing, required=True):
+            pass
+
+
+def test_invalid(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("A=1\nnot an assignment\n")
+
+    with pytest.raises(dotenv.DotenvError) as err:
+        with env.use_dotenv(str(path)):
+            pass
+
+    assert str(err.value) == f"{path}:2: Expected NAME=value"
+
+
+def test_load_dotenv(path, unload, monkeypatch):
+    monkeypatch.delenv("DB_HOST", raising=False)
+
+    environ = env.load_dotenv(path, override=True)
+
+    assert env.str("DB_HOST") == "localhost"
+    assert len(environ) >= 9
+    assert "DB_PORT" in list(environ)
+    assert env.get_environ() is environ
+
+    # the file is not read again when it is missing
+    assert env.load_dotenv(path + ".missing") is environ
+    assert list(env.LOADED) == [path]
+
+
+def test_load_dotenv_again(path, tmp_path, unload, monkeypatch):
+    other = tmp_path / "other.env"
+    other.write_text("DB_HOST=other\nDB_NAME=app\n")
+    monkeypatch.delenv("DB_HOST", raising=False)
+    monkeypatch.delenv("DB_NAME", raising=False)
+
+    env.load_dotenv(path)
+    env.load_dotenv(str(other))
+
+    # the first file to not override wins
+    assert env.str("DB_HOST") == "localhost"
+    assert env.str("DB_NAME") == "app"
+
+    environ = env.load_dotenv(str(other), override=True)
+
+    # loading a file again replaces its layer
+    assert env.str("DB_HOST") == "other"
+    assert isinstance(environ, env.Layered)
+    assert len(environ.layers) == 3
+
+    assert env.unload_dotenv(str(other)) is env.get_environ()
+    assert env.str("DB_HOST") == "localhost"
+    assert env.str("DB_NAME", "missing") == "missing"
+
+    assert env.unload_dotenv() is os.environ
+    assert env.str("DB_HOST", "missing") == "missing"
+
+
+def test_load_dotenv_threads(path, unload, monkeypatch):
+    class Database:
+        host: str = env.lazy.str("DB_HOST")
+
+    monkeypatch.delenv("DB_HOST", raising=False)
+    env.load_dotenv(path)
+
+    with futures.ThreadPoolExecutor(1) as executor:
+        host = executor.submit(env.str, "DB_HOST", "missing")
+        config = executor.submit(cfg.into, Database, {})
+
+        assert host.result() == "localhost"
+        assert config.result().host == "localhost"
+
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(env.str("DB_HOST", "missing"))
+    )
+    thread.start()
+    thread.join()
+
+    assert results == ["localhost"]
+
+
+def test_use_dotenv_scoped(path, tmp_path, unload, monkeypatch):
+    other = tmp_path / "other.env"
+    other.write_text("DB_HOST=other\n")
+
+    monkeypatch.delenv("DB_HOST", raising=False)
+    env.load_dotenv(path)
+
+    with env.use_dotenv(str(other), override=True):
+        assert env.str("DB_HOST") == "other"
+        assert env.int("DB_PORT") == 5432
+
+    assert env.str("DB_HOST") == "localhost"
@@ -0,0 +1,82 @@
+import os
+import typing as t
+
+import pytest
+from configur8 import cfg, env
+
+
+def test_sanity(my_env):
+    """
+    Lazy defaults are only read from the environment when resolved
+    """
+    default = env.lazy.int("INT")
+
+    assert isinstance(default, env.LazyDefault)
+    assert default.resolve() == 1234
+
+
+def test_resolve_environ():
+    """
+    A supplied environment is used instead of os.environ
+    """
+    assert "INT" not in os.environ
+
+    default = t.cast(
+        env.LazyDefault,
+        env.lazy.int.list("INT_LIST", separator="|"),
+    )
+
+    assert default.resolve({"INT_LIST": "1|2"}) == [1, 2]
+
+
+def test_into(my_env):
+    """
+    cfg.into resolves lazy defaults at validation time
+    """
+
+    class TestConfig:
+        name: str = env.lazy.str("MY_STR", "default")
+        count: int = env.lazy.int("INT")
+        optional: int | None = env.lazy.int.optional("MISSING")
+
+    assert isinstance(TestConfig.name, env.LazyDefault)
+
+    ret = cfg.into(TestConfig, {})
+
+    assert ret.name == "default"
+    assert ret.count == 1234
+    assert ret.optional is None
+
+    os.environ["MY_STR"] = "changed"
+
+    assert cfg.into(TestConfig, {}).name == "changed"
+    assert cfg.into(TestConfig, {"name": "given"}).name == "given"
+
+
+def test_into_snapshot(my_env):
+    """
+    All lazy defaults in a cfg.into call see the same environment
+    """
+    context = cfg.Context()
+    default = t.cast(env.LazyDefault, env.lazy.str("STR"))
+
+    assert context.resolve_default(default, None) == "foo bar"
+
+    os.environ["STR"] = "changed"
+
+    assert context.resolve_default(default, None) == "foo bar"
+    assert cfg.Context().resolve_default(default, None) == "changed"
+
+
+def test_into_missing():
+    """
+    Missing required env vars are reported as config errors
+    """
+
+    class TestConfig:
+        int: int = env.lazy.int("INT")
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(TestConfig, {})
+
+    assert str(err.value) == "int: Missing env var 'INT'"
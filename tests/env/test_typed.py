@@ -0,0 +1,53 @@
+import datetime
+import decimal
+import enum
+
+import pytest
+
+from configur8 import env
+
+
+def test_sanity(monkeypatch):
+    monkeypatch.setenv("TIMEOUT", "1m")
+
+    assert env.typed(datetime.timedelta)("TIMEOUT") == datetime.timedelta(
+        minutes=1
+    )
+
+
+def test_default():
+    assert env.typed(datetime.date)("DAY", "2024-01-02") == datetime.date(
+        2024, 1, 2
+    )
+
+
+def test_list(monkeypatch):
+    monkeypatch.setenv("PRICES", "1.1,2.2")
+
+    assert env.typed(decimal.Decimal).list("PRICES") == [
+        decimal.Decimal("1.1"),
+        decimal.Decimal("2.2"),
+    ]
+
+
+def test_lazy(monkeypatch):
+    default = env.lazy.typed(decimal.Decimal)("PRICE")
+
+    monkeypatch.setenv("PRICE", "9.99")
+
+    assert default.resolve() == decimal.Decimal("9.99")  # type: ignore
+
+
+def test_enum(monkeypatch):
+    class Mode(enum.Enum):
+        FAST = "fast"
+        SAFE = "safe"
+
+    monkeypatch.setenv("MODE", "safe")
+
+    assert env.typed(Mode)("MODE") is Mode.SAFE
+
+
+def test_unregistered():
+    with pytest.raises(TypeError):
+        env.typed(object)
@@ -0,0 +1,245 @@
+import datetime
+import marshal
+import os
+import stat
+import typing as t
+
+import pytest
+
+from configur8 import artifact, cfg, env
+from configur8.__main__ import main
+
+
+class Upstream:
+    host: str
+    port: int = 80
+
+
+class Route:
+    path: str
+    upstream: Upstream
+    tags: t.List[str]
+
+
+class Config:
+    name: str
+    debug: bool = False
+    routes: t.List[Route]
+
+
+class Other:
+    name: str
+
+
+SOURCE = """
+name: test
+routes:
+  - path: /
+    upstream:
+      host: localhost
+    tags: [a, b]
+"""
+
+
+@pytest.fixture
+def source(tmp_path):
+    ret = tmp_path / "config.yaml"
+    ret.write_text(SOURCE)
+
+    return str(ret)
+
+
+def test_round_trip(source, tmp_path):
+    destination = str(tmp_path / "config.c8a")
+
+    cfg.compile(Config, source, destination)
+
+    with open(destination, "rb") as fp:
+        assert fp.read(4) == artifact.MAGIC
+
+    config = cfg.load(Config, destination)
+
+    assert cfg.to_data(config) == cfg.to_data(cfg.load(Config, source))
+    assert config.routes[0].upstream.port == 80
+
+
+def test_frozen(source, tmp_path):
+    destination = str(tmp_path / "config.c8a")
+
+    cfg.compile(Config, source, destination)
+    config = cfg.load(Config, destination, frozen=True)
+
+    assert config == cfg.load(Config, source, frozen=True)
+
+
+def test_invalid_source(tmp_path):
+    source = tmp_path / "config.yaml"
+    source.write_text("name: 1\n")
+    destination = tmp_path / "config.c8a"
+
+    with pytest.raises(cfg.ConfigError):
+        cfg.compile(Config, str(source), str(destination))
+
+    assert not destination.exists()
+
+
+def test_fingerprint():
+    assert cfg.fingerprint(Config) == cfg.fingerprint(Config)
+    assert cfg.fingerprint(Config) != cfg.fingerprint(Other)
+    assert len(cfg.fingerprint(Config)) == 32
+
+
+def test_different_config(source, tmp_path):
+    destination = str(tmp_path / "config.c8a")
+
+    cfg.compile(Config, source, destination)
+
+    with pytest.raises(artifact.ArtifactError) as exc:
+        cfg.load(Other, destination)
+
+    assert "different config class" in str(exc.value)
+
+
+def test_truncated(source, tmp_path):
+    destination = tmp_path / "config.c8a"
+
+    cfg.compile(Config, source, str(destination))
+    data = destination.read_bytes()
+
+    destination.write_bytes(data[:10])
+
+    with pytest.raises(artifact.ArtifactError, match="Truncated"):
+        cfg.load(Config, str(destination))
+
+    destination.write_bytes(data[:-10])
+
+    with pytest.raises(artifact.ArtifactError, match="Corrupt"):
+        cfg.load(Config, str(destination))
+
+
+def test_unsupported_version(source, tmp_path):
+    destination = tmp_path / "config.c8a"
+
+    cfg.compile(Config, source, str(destination))
+    data = bytearray(destination.read_bytes())
+    data[4] = 99
+    destination.write_bytes(bytes(data))
+
+    with pytest.raises(artifact.ArtifactError, match="Unsupported"):
+        cfg.load(Config, str(destination))
+
+
+def test_cli(source, tmp_path, capsys):
+    destination = str(tmp_path / "config.c8a")
+
+    assert main(
+        ["compile", f"{__name__}:Config", source, "-o", destination]
+    ) == 0
+    assert capsys.readouterr().out.strip() == destination
+
+    assert cfg.load(Config, destination).name == "test"
+
+
+def test_cli_default_output(source):
+    assert main(["compile", f"{__name__}:Config", source]) == 0
+
+    assert cfg.load(Config, f"{source}.c8a").name == "test"
+
+
+def test_cli_invalid(tmp_path, capsys):
+    source = tmp_path / "config.yaml"
+    source.write_text("name: 1\n")
+
+    assert main(["compile", f"{__name__}:Config", str(source)]) == 1
+    assert "name" in capsys.readouterr().err
+
+
+def test_cli_bad_reference(source):
+    with pytest.raises(ValueError):
+        main(["compile", __name__, source])
+
+
+def test_defaults_resolved_on_load(source, tmp_path, monkeypatch):
+    class Service:
+        name: str
+        user: str = env.lazy.str("RV_USER", "nobody")
+        routes: t.List[Route]
+
+    destination = str(tmp_path / "config.c8a")
+
+    monkeypatch.setenv("RV_USER", "build")
+    cfg.compile(Service, source, destination)
+    monkeypatch.setenv("RV_USER", "runtime")
+
+    config = cfg.load(Service, destination)
+
+    assert config.user == "runtime"
+    assert config.routes[0].upstream.port == 80
+
+
+def test_fingerprint_markers():
+    class Marker:
+        pass
+
+    class Annotated:
+        values: t.Annotated[t.List[int], Marker(), cfg.Packed("i")]
+
+    description = cfg.describe(Annotated, set())
+
+    assert "Packed('i')" in description
+    assert f"{__name__}.test_fingerprint_markers.<locals>.Marker" in (
+        description
+    )
+    assert " at 0x" not in description
+
+
+def test_defaults_with_extra_keys(tmp_path, monkeypatch):
+    class Worker:
+        name: str
+        user: str = env.lazy.str("RV_USER", "nobody")
+
+    class Service:
+        name: str
+        port: int = 80
+        workers: t.Dict[datetime.date, Worker] = {}
+
+    source = tmp_path / "config.yaml"
+    source.write_text(
+        "name: x\nextra: 1\nworkers:\n  2024-01-02: {name: a, extra: 2}\n"
+    )
+    destination = str(tmp_path / "config.c8a")
+
+    monkeypatch.setenv("RV_USER", "build")
+    cfg.compile(Service, str(source), destination)
+
+    with open(destination, "rb") as fp:
+        fp.read(artifact.HEADER.size)
+        data = marshal.loads(fp.read())
+
+    # YAML decodes the key as a date, which is encoded as a string
+    assert data == {"name": "x", "workers": {"2024-01-02": {"name": "a"}}}
+
+    monkeypatch.setenv("RV_USER", "runtime")
+
+    config = cfg.load(Service, destination)
+
+    assert config.workers[datetime.date(2024, 1, 2)].user == "runtime"
+    assert config.port == 80
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_permissions(source, tmp_path):
+    destination = tmp_path / "config.c8a"
+    umask = os.umask(0o022)
+
+    try:
+        cfg.compile(Config, source, str(destination))
+
+        assert stat.S_IMODE(destination.stat().st_mode) == 0o644
+
+        destination.chmod(0o640)
+        cfg.compile(Config, source, str(destination))
+
+        assert stat.S_IMODE(destination.stat().st_mode) == 0o640
+    finally:
+        os.umask(umask)
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import typing as t
+from concurrent import futures
+
+import pytest
+
+from configur8 import cfg
+
+
+class Upstream:
+    host: str
+    port: int = 80
+
+
+class Config:
+    name: str
+    upstreams: t.List[Upstream]
+
+
+class Secret:
+    token: str
+
+
+DATA = """
+name: app
+upstreams:
+    - host: foo
+    - host: bar
+      port: 8080
+"""
+
+
+def test_parse_async():
+    config = asyncio.run(cfg.parse_async(Config, DATA))
+
+    assert config.name == "app"
+    assert [u.port for u in config.upstreams] == [80, 8080]
+
+
+def test_parse_async_error():
+    with pytest.raises(cfg.ConfigError) as exc:
+        asyncio.run(cfg.parse_async(Config, "name: 1"))
+
+    assert exc.value.path == ["name"]
+
+
+def test_load_async_gather(tmp_path):
+    source = tmp_path / "config.yaml"
+    source.write_text(DATA)
+    secret = tmp_path / "secret.json"
+    secret.write_text('{"token": "abc"}')
+
+    async def main() -> t.Tuple[Config, Secret]:
+        return await asyncio.gather(
+            cfg.load_async(Config, str(source), frozen=True),
+            cfg.load_async(Secret, str(secret), format="json"),
+        )
+
+    config, token = asyncio.run(main())
+
+    assert config == cfg.load(Config, str(source), frozen=True)
+    assert token.token == "abc"
+
+
+def test_off_loop(tmp_path, monkeypatch):
+    source = tmp_path / "config.yaml"
+    source.write_text(DATA)
+    threads = []
+    read = cfg.read
+
+    def recording_read(*args: t.Any) -> t.Any:
+        threads.append(threading.current_thread().name)
+
+        return read(*args)
+
+    monkeypatch.setattr(cfg, "read", recording_read)
+
+    with futures.ThreadPoolExecutor(thread_name_prefix="loader") as executor:
+        config = asyncio.run(
+            cfg.load_async(Config, str(source), executor=executor)
+        )
+
+    assert config.name == "app"
+    assert threads == ["loader_0"]
+
+
+def test_process_pool(tmp_path):
+    source = tmp_path / "config.yaml"
+    source.write_text(DATA)
+
+    with futures.ProcessPoolExecutor(max_workers=1) as executor:
+        config = asyncio.run(
+            cfg.load_async(Config, str(source), executor=executor)
+        )
+
+    assert config.upstreams[1].host == "bar"
+
+
+def test_profile():
+    async def main() -> Config:
+        return await cfg.parse_async(Config, DATA)
+
+    with cfg.profile() as profile:
+        asyncio.run(main())
+
+    assert set(profile.phases) == {"decode", "validate"}
@@ -1,8 +1,9 @@
+import array
 import typing as t
 
 import pytest
 
-from configur8 import cfg
+from configur8 import cfg, env
 
 
 class BaseMySQL:
@@ -31,6 +32,22 @@ def parse(data: str) -> Config:
     return cfg.parse(Config, data)
 
 
+class Upstream:
+    host: str
+    port: int
+
+
+class RoutesConfig:
+    routes: t.List[Upstream]
+    tenants: t.Dict[str, Upstream]
+
+
+ROUTES = {
+    "routes": [{"host": f"host-{i}", "port": i} for i in range(100)],
+    "tenants": {f"t{i}": {"host": "localhost", "port": i} for i in range(100)},
+}
+
+
 def test_optional_str():
     class TestConfig:
         str: t.Optional[str]
@@ -334,3 +351,356 @@ def test_literal():
     assert (
         str(err.value) == "literal: Expected one of ('foo', 'bar'), got 'baz'"
     )
+
+
+def test_literal_unhashable():
+    class TestConfig:
+        literal: t.Literal["foo", "bar"]
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(TestConfig, {"literal": ["foo"]})
+
+    assert err.value.path == ["literal"]
+
+
+def test_nested_error_path():
+    with pytest.raises(cfg.ConfigError) as err:
+        parse("""
+mysql:
+    host: localhost
+    port: foo
+    username: root
+    password: password
+    database: test
+""")
+
+    assert err.value.path == ["mysql"]
+
+    class Server:
+        port: int
+
+    class TestConfig:
+        servers: t.List[Server]
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.parse(
+            TestConfig,
+            """
+servers:
+    - port: 80
+    - port: foo
+""",
+        )
+
+    assert err.value.path == ["servers", 1, "port"]
+    assert str(err.value) == "servers[1].port: Expected int, got 'foo'"
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.parse(TestConfig, "servers: [{}]")
+
+    assert str(err.value) == "servers[0].port: missing"
+
+
+def test_error_repr():
+    class Server:
+        port: int
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Server, {"port": "a"})
+
+    assert repr(err.value) == "ConfigError(['port'], \"Expected int, got 'a'\")"
+    assert err.value.args == ("Expected int, got 'a'",)
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Server, 1)
+
+    assert str(err.value) == "Expected dict or dataclass, got <class 'int'>"
+
+
+def test_path():
+    path = cfg.Path.decode("servers[1].port")
+
+    assert path == ["servers", 1, "port"]
+    assert path == ("servers", 1, "port")
+    assert path == cfg.Path(["servers", 1, "port"])
+    assert str(path) == "servers[1].port"
+    assert len(path) == 3
+    assert cfg.Path.decode("servers[1].port") is path
+
+    index = {path: "found"}
+
+    assert index[cfg.Path(("servers", 1, "port"))] == "found"
+    assert str(path + "host") == "servers[1].port.host"
+
+    with pytest.raises(AttributeError):
+        path.data = ()
+
+
+def test_get():
+    class Route:
+        upstream: str
+
+    class Service:
+        replicas: int
+
+    class TestConfig:
+        routes: t.List[Route]
+        services: t.Dict[str, Service]
+
+    config = cfg.parse(
+        TestConfig,
+        """
+routes:
+    - upstream: foo
+    - upstream: bar
+services:
+    api:
+        replicas: 3
+""",
+    )
+
+    assert cfg.get(config, "routes[1].upstream") == "bar"
+    assert cfg.get(config, "services.api.replicas") == 3
+    assert cfg.compile_path("routes[0]")(config) is config.routes[0]
+    assert cfg.compile_path("routes[0]") is cfg.compile_path("routes[0]")
+    assert cfg.get(config, "routes[2].upstream", None) is None
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.get(config, "services.web.replicas")
+
+    assert str(err.value) == "services.web: not found"
+
+
+def test_compile_path_dict(mocker):
+    class Service:
+        replicas: int
+
+    class TestConfig:
+        services: t.Dict[str, Service]
+
+    config = cfg.into(TestConfig, {"services": {"api": {"replicas": 3}}})
+    accessor = cfg.compile_path(cfg.Path.decode("services.api.replicas"))
+    walk = mocker.spy(cfg.Accessor, "walk")
+
+    assert accessor(config) == 3
+    assert accessor(config) == 3
+    assert walk.call_count == 1
+    assert len(accessor.getters) == 3
+
+    config = cfg.into(TestConfig, {"services": {"api": {"replicas": 4}}})
+
+    assert accessor(config) == 4
+    assert walk.call_count == 1
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel(executor):
+    parallel = cfg.Parallel(threshold=10, workers=2, executor=executor)
+
+    ret = cfg.into(RoutesConfig, ROUTES, parallel=parallel)
+
+    assert [route.port for route in ret.routes] == list(range(100))
+    assert list(ret.tenants) == [f"t{i}" for i in range(100)]
+    assert ret.tenants["t42"].port == 42
+
+    data: t.Dict[str, t.Any] = {
+        "routes": [*ROUTES["routes"], {"host": "bad"}],
+        "tenants": {},
+    }
+    data["routes"][50] = {"host": 50, "port": 50}
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(RoutesConfig, data, parallel=parallel)
+
+    assert str(err.value) == "routes[50].host: Expected str, got 50"
+
+
+def test_not_a_class():
+    class TestConfig:
+        mysql: MySQLHost | int
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(TestConfig, {"mysql": "foo"})
+
+    assert str(err.value) == "mysql: expected one of the union types"
+
+
+@pytest.mark.parametrize(
+    "parallel",
+    [
+        None,
+        cfg.Parallel(workers=2, chunk_size=3, executor="thread"),
+        cfg.Parallel(workers=2, chunk_size=3, executor="process"),
+    ],
+)
+def test_into_many(parallel):
+    items = [{"host": f"host-{i}", "port": i} for i in range(10)]
+    items[4] = {"host": "bad"}
+
+    results = list(cfg.into_many(Upstream, iter(items), parallel=parallel))
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.ok for result in results] == [i != 4 for i in range(10)]
+    assert results[9].unwrap().host == "host-9"
+    assert str(results[4].error) == "port: missing"
+
+    with pytest.raises(cfg.ConfigError):
+        results[4].unwrap()
+
+
+def test_primitive_list():
+    class TestConfig:
+        list: t.List[int]
+
+    data = {"list": [1, 2, 3]}
+    ret = cfg.into(TestConfig, data)
+
+    assert ret.list == [1, 2, 3]
+    assert ret.list is not data["list"]
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(TestConfig, {"list": [1, 2, "3"]})
+
+    assert str(err.value) == "list[2]: Expected int, got '3'"
+
+
+def test_annotated_unhashable():
+    Doc = t.Annotated[int, {"doc": "x"}]
+    Key = t.Annotated[str, {"doc": "k"}]
+
+    class TestConfig:
+        items: t.List[Doc]
+        mapping: t.Dict[Key, Doc]
+        lazy: t.Annotated[t.Dict[Key, Doc], cfg.Lazy()]
+
+    data = {"items": [1, 2], "mapping": {"a": 1}, "lazy": {"b": 2}}
+    ret = cfg.into(TestConfig, data)
+
+    assert ret.items == [1, 2]
+    assert ret.lazy["b"] == 2
+    assert cfg.to_data(ret) == data
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(TestConfig, {**data, "items": ["a"]})
+
+    assert err.value.path == ["items", 0]
+
+
+def test_packed():
+    class TestConfig:
+        weights: t.Annotated[array.array, cfg.Packed("d")]
+        buckets: t.Annotated[t.List[int], cfg.Packed("B")]
+        plain: t.Annotated[t.List[int], "unrelated"]
+
+    ret = cfg.parse(
+        TestConfig,
+        """
+weights: [0.5, 1.5]
+buckets: [1, 2, 255]
+plain: [1]
+""",
+    )
+
+    assert ret.weights == array.array("d", [0.5, 1.5])
+    assert ret.buckets == array.array("B", [1, 2, 255])
+    assert ret.plain == [1]
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.parse(TestConfig, "weights: [1]\nbuckets: []\nplain: []")
+
+    assert str(err.value) == "weights[0]: Expected float, got 1"
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.parse(TestConfig, "weights: []\nbuckets: [256]\nplain: []")
+
+    assert err.value.path == ["buckets"]
+
+    with pytest.raises(ValueError):
+        cfg.Packed("x")
+
+
+def test_slotted():
+    @cfg.slotted
+    class Base:
+        name: str
+        port: int = 80
+
+    @cfg.slotted
+    class Server(Base):
+        tags: t.List[str] = []
+
+    class TestConfig:
+        servers: t.List[Server]
+
+    ret = cfg.parse(
+        TestConfig,
+        """
+servers:
+    - name: foo
+    - name: bar
+      port: 8080
+      tags: [a]
+""",
+    )
+
+    foo, bar = ret.servers
+
+    assert isinstance(foo, Server)
+    assert isinstance(foo, Base)
+    assert not hasattr(foo, "__dict__")
+    assert (foo.name, foo.port, foo.tags) == ("foo", 80, [])
+    assert (bar.name, bar.port, bar.tags) == ("bar", 8080, ["a"])
+    assert Server.__qualname__ == "test_slotted.<locals>.Server"
+
+    direct = Server("baz", 1, [])  # type: ignore[call-arg]
+
+    assert direct.port == 1
+
+    with pytest.raises(AttributeError):
+        foo.other = 1  # type: ignore[attr-defined]
+
+    class Plain:
+        name: str
+
+    with pytest.raises(TypeError):
+
+        @cfg.slotted
+        class Bad(Plain):
+            port: int
+
+
+def test_slotted_init(monkeypatch):
+    @cfg.slotted
+    class Route:
+        path: str
+        timeout: float = 1.0
+        user: str = env.lazy.str("ROUTE_USER", "nobody")
+
+    monkeypatch.setenv("ROUTE_USER", "app")
+    route = Route("/x")  # type: ignore[call-arg]
+
+    assert (route.path, route.timeout, route.user) == ("/x", 1.0, "app")
+    assert Route("/y", 2.0, "me").timeout == 2.0  # type: ignore[call-arg]
+
+    @cfg.slotted
+    class Server:
+        debug: bool = False
+        name: str
+
+    # fields with defaults before required ones are keyword-only
+    server = Server(name="a")  # type: ignore[call-arg]
+
+    assert (server.debug, server.name) == (False, "a")
+    assert cfg.into(Server, {"name": "b", "debug": True}).debug is True
+
+    with pytest.raises(TypeError):
+        Server(True, "a")  # type: ignore[call-arg]
+
+    with pytest.raises(TypeError):
+
+        @cfg.slotted
+        class Custom:
+            name: str
+
+            def __init__(self, name: str) -> None:
+                self.name = name
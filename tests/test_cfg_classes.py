@@ -0,0 +1,216 @@
+import dataclasses
+import gc
+import typing as t
+import weakref
+
+import pytest
+
+from configur8 import cfg
+
+
+@dataclasses.dataclass
+class Upstream:
+    host: str
+    port: int = 80
+    tags: t.List[str] = dataclasses.field(default_factory=list)
+    healthy: bool = dataclasses.field(default=True, init=False)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Limits:
+    requests: int
+    burst: int = 10
+
+
+class Point(t.NamedTuple):
+    x: int
+    y: int = 0
+
+
+class Labels(t.TypedDict, total=False):
+    team: str
+    tier: int
+
+
+class Owner(t.TypedDict):
+    name: str
+    labels: Labels
+
+
+class Config:
+    upstreams: t.List[Upstream]
+    limits: Limits
+    origin: Point
+    owner: Owner
+
+
+DATA = """
+upstreams:
+    - host: foo
+    - host: bar
+      port: 8080
+      tags: [a, b]
+limits:
+    requests: 100
+origin:
+    x: 1
+owner:
+    name: core
+    labels:
+        team: core
+"""
+
+
+def test_dataclass():
+    config = cfg.parse(Config, DATA)
+
+    foo, bar = config.upstreams
+
+    assert foo == Upstream("foo")
+    assert bar == Upstream("bar", 8080, ["a", "b"])
+    assert foo.tags is not Upstream("baz").tags
+    assert config.limits == Limits(100, 10)
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Upstream, {"host": "foo", "port": "80"})
+
+    assert str(err.value) == "port: Expected int, got '80'"
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Limits, {})
+
+    assert str(err.value) == "requests: missing"
+
+
+def test_named_tuple():
+    config = cfg.parse(Config, DATA)
+
+    assert config.origin == Point(1, 0)
+    assert isinstance(config.origin, Point)
+
+
+def test_typed_dict():
+    config = cfg.parse(Config, DATA)
+
+    assert config.owner == {"name": "core", "labels": {"team": "core"}}
+    assert type(config.owner) is dict
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Owner, {"labels": {}})
+
+    assert str(err.value) == "name: missing"
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Owner, {"name": "core", "labels": {"tier": "1"}})
+
+    assert str(err.value) == "labels.tier: Expected int, got '1'"
+
+
+def test_frozen():
+    config = cfg.parse(Config, DATA, frozen=True)
+
+    assert isinstance(config.upstreams[0], Upstream)
+    assert hash(config.upstreams[0]) == hash(config.upstreams[0])
+    assert type(config.limits) is Limits
+    assert type(config.origin) is Point
+    assert config.owner["labels"] == {"team": "core"}
+    assert hash(config.owner)
+
+    with pytest.raises(AttributeError):
+        config.upstreams[0].port = 1
+
+    updated = cfg.replace(config, {"limits.burst": 20, "origin.y": 2})
+
+    assert updated.limits == Limits(100, 20)
+    assert updated.origin == Point(1, 2)
+    assert updated.upstreams is config.upstreams
+
+    assert cfg.replace(Point(1, 2), {"x": 3}) == Point(3, 2)
+
+
+def test_classes_not_kept():
+    def use() -> weakref.ref:
+        class Local:
+            name: str
+            tags: t.List[str] = []
+
+        config = cfg.into(Local, {"name": "a"}, frozen=True)
+        cfg.to_data(config)
+        cfg.to_data(cfg.into(Local, {"name": "a"}))
+        cfg.fingerprint(Local)
+
+        return weakref.ref(Local)
+
+    ref = use()
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_literals_not_kept():
+    def use() -> t.Tuple[weakref.ref, int]:
+        # a copy, as typing caches the aliases it creates
+        kind = t.cast(t.Any, t.Literal["a", "b"]).copy_with(("a", "b"))
+        Local: t.Any = type("Local", (), {"__annotations__": {"kind": kind}})
+
+        assert cfg.into(Local, {"kind": "b"}).kind == "b"
+
+        with pytest.raises(cfg.ConfigError):
+            cfg.into(Local, {"kind": "c"})
+
+        return weakref.ref(kind), id(kind)
+
+    ref, key = use()
+    # once for the class, once for the schema it leaves behind
+    gc.collect()
+    gc.collect()
+
+    assert ref() is None
+    assert key not in cfg.LITERALS
+
+
+def test_frozen_post_init():
+    @dataclasses.dataclass
+    class Scaled:
+        a: int
+        b: int = dataclasses.field(init=False, default=0)
+        c: int = dataclasses.field(init=False)
+
+        def __post_init__(self) -> None:
+            self.b = 2 * self.a
+            self.c = self.b + 1
+
+    config = cfg.into(Scaled, {"a": 2}, frozen=True)
+
+    assert (config.a, config.b, config.c) == (2, 4, 5)
+    assert config == cfg.into(Scaled, {"a": 2}, frozen=True)
+
+    with pytest.raises(AttributeError):
+        config.b = 1
+
+    updated = cfg.replace(config, {"a": 3})
+
+    assert (updated.a, updated.b, updated.c) == (3, 6, 7)
+
+
+def test_typed_dict_qualifiers():
+    class Options(t.TypedDict):
+        a: t.Required[int]
+        b: t.NotRequired[str]
+        c: t.NotRequired[t.Annotated[t.List[int], cfg.Packed("i")]]
+
+    assert cfg.into(Options, {"a": 1}) == {"a": 1}
+    assert cfg.into(Options, {"a": 1, "b": "x"}) == {"a": 1, "b": "x"}
+    packed: t.Any = cfg.into(Options, {"a": 1, "c": [1]})["c"]
+
+    assert packed.typecode == "i"
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Options, {"b": "x"})
+
+    assert err.value.path == ["a"]
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Options, {"a": 1, "b": 2})
+
+    assert err.value.path == ["b"]
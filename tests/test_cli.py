@@ -0,0 +1,85 @@
+import typing as t
+
+import pytest
+
+from configur8.__main__ import expand, main
+
+
+class Upstream:
+    host: str
+    port: int = 80
+
+
+class Config:
+    name: str
+    upstreams: t.List[Upstream]
+
+
+@pytest.fixture
+def files(tmp_path):
+    services = tmp_path / "services"
+    services.mkdir()
+
+    (services / "a.yaml").write_text("name: a\nupstreams: [{host: a}]\n")
+    (services / "b.json").write_text('{"name": "b", "upstreams": []}')
+    (services / "c.yaml").write_text(
+        "name: c\nupstreams:\n  - host: c\n    port: http\n"
+    )
+    (services / "d.yaml").write_text("name: [d\n")
+
+    return services
+
+
+def test_validate(files, capsys):
+    assert main(
+        ["validate", f"{__name__}:Config", str(files / "[ab].*"), "-j", "1"]
+    ) == 0
+
+    out, err = capsys.readouterr()
+    lines = out.splitlines()
+
+    assert lines[0].startswith(f"{files / 'a.yaml'}: ok (")
+    assert lines[1].startswith(f"{files / 'b.json'}: ok (")
+    assert err == "2 of 2 files valid\n"
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_validate_errors(files, capsys, jobs):
+    missing = str(files / "missing.yaml")
+
+    assert main(
+        [
+            "validate",
+            f"{__name__}:Config",
+            str(files / "*"),
+            missing,
+            "--jobs",
+            jobs,
+        ]
+    ) == 1
+
+    out, err = capsys.readouterr()
+    errors = err.splitlines()
+
+    assert len(out.splitlines()) == 2
+    assert errors[0].startswith(
+        f"{files / 'c.yaml'}: upstreams[0].port: Expected int, got 'http' ("
+    )
+    assert errors[1].startswith(f"{files / 'd.yaml'}: ")
+    assert errors[2].startswith(f"{missing}: No such file or directory (")
+    assert errors[3] == "2 of 5 files valid"
+
+
+def test_expand(files):
+    assert expand([str(files / "*.yaml"), "other.yaml"]) == [
+        str(files / "a.yaml"),
+        str(files / "c.yaml"),
+        str(files / "d.yaml"),
+        "other.yaml",
+    ]
+    assert expand([str(files / "*.toml")]) == [str(files / "*.toml")]
+
+
+def test_validate_bad_reference(files):
+    with pytest.raises(AttributeError):
+        main(["validate", f"{__name__}:Missing", str(files / "a.yaml")])
@@ -0,0 +1,104 @@
+import array
+import io
+import json
+import typing as t
+
+import pytest
+
+from configur8 import cfg, path, url
+
+
+class Upstream:
+    host: str
+    port: int = 80
+
+
+class Socket:
+    socket: str
+
+
+class Route:
+    path: str
+    upstream: Upstream | Socket
+    weights: t.Annotated[array.array, cfg.Packed("d")]
+    headers: t.Dict[str, str]
+
+
+class Config:
+    name: str
+    debug: bool
+    routes: t.List[Route]
+    fallback: t.Optional[Upstream] = None
+
+
+DATA = {
+    "name": "app",
+    "debug": False,
+    "routes": [
+        {
+            "path": "/foo",
+            "upstream": {"host": "localhost", "port": 8080},
+            "weights": [0.5, 1.5],
+            "headers": {"x-team": "core"},
+        },
+        {
+            "path": "/bar",
+            "upstream": {"socket": "/var/run/bar.sock"},
+            "weights": [],
+            "headers": {},
+        },
+    ],
+    "fallback": None,
+}
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_to_data(frozen):
+    config = cfg.into(Config, DATA, frozen=frozen)
+
+    assert cfg.to_data(config) == DATA
+    assert list(cfg.to_data(config)) == ["name", "debug", "routes", "fallback"]
+
+
+def test_round_trip():
+    config = cfg.into(Config, DATA)
+
+    for format in ("yaml", "json"):
+        dumped = cfg.dump(config, format=format)
+
+        assert isinstance(dumped, str)
+        assert cfg.to_data(cfg.parse(Config, dumped, format=format)) == DATA
+
+    assert json.loads(t.cast(str, cfg.dump(config, format="json"))) == DATA
+
+
+def test_stream():
+    config = cfg.into(Config, DATA)
+    stream = io.StringIO()
+
+    assert cfg.dump(config, stream=stream) is None
+    assert stream.getvalue() == cfg.dump(config)
+    assert stream.getvalue().startswith("name: app\ndebug: false\n")
+
+
+def test_url_path():
+    class Service:
+        url: url.Url
+        key: path.Path
+
+    service = Service()
+    service.url = url.parse("https://localhost:9090/foo")
+    service.key = path.parse("/var/run/secrets/key")
+
+    assert cfg.to_data(service) == {
+        "url": "https://localhost:9090/foo",
+        "key": "/var/run/secrets/key",
+    }
+
+
+def test_unknown():
+    with pytest.raises(TypeError):
+        cfg.to_data(object())
+
+    with pytest.raises(ValueError):
+        cfg.dump(cfg.into(Config, DATA), format="toml")  # type: ignore[arg-type]
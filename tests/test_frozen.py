@@ -0,0 +1,256 @@
+import copy
+import gc
+import pickle
+import typing as t
+
+import pytest
+
+from configur8 import cfg
+from configur8.frozen import FrozenDict
+
+
+class Upstream:
+    host: str
+    port: int = 80
+
+
+class Route:
+    path: str
+    upstreams: t.List[Upstream]
+
+
+class Config:
+    name: str
+    routes: t.List[Route]
+    tags: t.Dict[str, str]
+    fallback: t.Optional[Upstream] = None
+
+
+DATA = """
+name: app
+routes:
+    - path: /foo
+      upstreams:
+          - host: foo-1
+          - host: foo-2
+    - path: /bar
+      upstreams:
+          - host: bar-1
+tags:
+    team: core
+"""
+
+
+def load() -> Config:
+    return cfg.parse(Config, DATA, frozen=True)
+
+
+def test_frozen_dict():
+    data: FrozenDict[str, int] = FrozenDict({"a": 1})
+
+    assert data["a"] == 1
+    assert data == {"a": 1}
+    assert hash(data) == hash(FrozenDict({"a": 1}))
+    assert copy.deepcopy(data) is data
+    assert pickle.loads(pickle.dumps(data)) == data
+
+    with pytest.raises(TypeError):
+        data["b"] = 2
+
+    with pytest.raises(TypeError):
+        t.cast(t.Any, data).update(b=2)
+
+
+def test_frozen():
+    config = load()
+
+    assert isinstance(config, Config)
+    # frozen lists are returned as tuples and dicts as `FrozenDict`
+    routes = t.cast(t.Any, config.routes)
+    assert isinstance(routes, tuple)
+    assert isinstance(routes[0], Route)
+    assert isinstance(t.cast(t.Any, routes[0].upstreams), tuple)
+    assert isinstance(t.cast(t.Any, config.tags), FrozenDict)
+    assert config.routes[0].upstreams[1].port == 80
+
+    with pytest.raises(AttributeError):
+        config.name = "other"
+
+    with pytest.raises(AttributeError):
+        del config.routes[0].path
+
+
+def test_frozen_hash():
+    config = load()
+    other = load()
+
+    assert config == other
+    assert hash(config) == hash(other)
+    assert {config: True}[other] is True
+    assert config != cfg.parse(
+        Config,
+        DATA.replace("app", "other"),
+        frozen=True,
+    )
+
+
+def test_frozen_copy():
+    config = load()
+
+    assert copy.copy(config) is config
+    assert copy.deepcopy(config) is config
+
+    restored = pickle.loads(pickle.dumps(config))
+
+    assert restored == config
+    assert type(restored) is type(config)
+
+
+def test_replace():
+    config = load()
+
+    updated = cfg.replace(
+        config,
+        {
+            "name": "new",
+            "routes[0].upstreams[1].port": 8080,
+            "tags.env": "prod",
+        },
+    )
+
+    assert updated.name == "new"
+    assert updated.routes[0].upstreams[1].port == 8080
+    assert updated.tags == {"team": "core", "env": "prod"}
+
+    # unchanged parts are shared
+    assert updated.routes[1] is config.routes[1]
+    assert updated.routes[0].upstreams[0] is config.routes[0].upstreams[0]
+    assert updated.routes[0].path is config.routes[0].path
+
+    # the original is untouched
+    assert config.name == "app"
+    assert config.routes[0].upstreams[1].port == 80
+
+
+def test_replace_optional():
+    config = cfg.replace(load(), {"fallback": {"host": "fallback"}})
+
+    assert config.fallback is not None
+    assert config.fallback.port == 80
+
+    config = cfg.replace(config, {"fallback.port": 81})
+
+    assert config.fallback is not None
+    assert config.fallback.port == 81
+
+
+def test_replace_errors():
+    config = load()
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.replace(config, {"routes[0].upstreams[0].port": "foo"})
+
+    assert str(err.value) == (
+        "routes[0].upstreams[0].port: Expected int, got 'foo'"
+    )
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.replace(config, {"routes[5].path": "/baz"})
+
+    assert str(err.value) == "routes[5]: not found"
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.replace(config, {"missing": 1})
+
+    assert str(err.value) == "missing: not found"
+
+    with pytest.raises(ValueError):
+        cfg.replace(config, {"routes[0]": {}, "routes[0].path": "/"})
+
+    with pytest.raises(TypeError):
+        cfg.replace(cfg.parse(Config, DATA), {"name": "new"})
+
+
+ALIASED = """
+name: app
+routes:
+    - path: /foo
+      upstreams: &upstreams
+          - &upstream
+            host: shared
+          - *upstream
+          - *upstream
+    - path: /bar
+      upstreams: *upstreams
+    - path: /baz
+      upstreams: *upstreams
+tags:
+    team: core
+fallback: *upstream
+"""
+
+
+def test_aliases_shared(mocker):
+    into_frame = mocker.spy(cfg, "into_frame")
+    config = cfg.parse(Config, ALIASED, frozen=True)
+    first, second, third = config.routes
+
+    # results are kept from the second time an alias is seen
+    assert into_frame.call_count == 1 + 3 + 2
+    assert second.upstreams is third.upstreams
+    assert first.upstreams[1] is first.upstreams[2] is config.fallback
+    assert first.upstreams == second.upstreams
+    assert config.fallback.port == 80
+
+
+def test_aliases_not_shared():
+    config = cfg.parse(Config, ALIASED)
+
+    assert config.routes[1].upstreams is not config.routes[2].upstreams
+    assert config.routes[0].upstreams[2] is not config.fallback
+    assert config.fallback is not None
+
+    config.fallback.port = 8080
+
+    assert config.routes[0].upstreams[0].port == 80
+
+
+def test_aliases_different_types():
+    class Tags:
+        team: str
+
+    class Both:
+        tags: t.Dict[str, str]
+        team: Tags
+        again: t.Dict[str, str]
+
+    config = cfg.parse(
+        Both,
+        "tags: &tags {team: core}\nteam: *tags\nagain: *tags",
+        frozen=True,
+    )
+
+    assert config.tags == config.again == {"team": "core"}
+    assert config.team.team == "core"
+
+
+def test_frozen_parallel():
+    parallel = cfg.Parallel(threshold=1, workers=2, executor="process")
+    config = cfg.parse(Config, DATA, frozen=True, parallel=parallel)
+
+    assert config == load()
+
+
+def test_preload(tmp_path):
+    source = tmp_path / "config.yaml"
+    source.write_text(DATA)
+
+    try:
+        config = cfg.preload(Config, str(source))
+
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert config == load()
+    assert isinstance(config.tags, FrozenDict)
@@ -0,0 +1,152 @@
+import copy
+import ipaddress
+import pickle
+import typing as t
+
+import pytest
+
+from configur8 import cfg
+from configur8.frozen import FrozenDict
+
+
+class Flag:
+    enabled: bool
+    rollout: float = 1.0
+
+
+class Config:
+    flags: t.Annotated[t.Mapping[str, Flag], cfg.Lazy()]
+    hosts: t.Annotated[t.List[str], cfg.Lazy()]
+    name: str = "app"
+
+
+DATA = {
+    "flags": {
+        "search": {"enabled": True},
+        "beta": {"enabled": False, "rollout": 0.5},
+        "broken": {"enabled": "yes"},
+    },
+    "hosts": ["a", "b", 3],
+}
+
+
+def test_lazy(mocker):
+    into_frame = mocker.spy(cfg, "into_frame")
+    config = cfg.into(Config, DATA)
+
+    assert into_frame.call_count == 1
+    assert isinstance(config.flags, cfg.LazyMapping)
+    assert len(config.flags) == 3
+    assert "beta" in config.flags
+    assert list(config.flags) == ["search", "beta", "broken"]
+
+    beta = config.flags["beta"]
+
+    assert beta.rollout == 0.5
+    assert config.flags["beta"] is beta
+    assert into_frame.call_count == 2
+
+    assert config.hosts[1] == "b"
+    assert config.hosts[-2] == "b"
+    assert config.hosts[:2] == ["a", "b"]
+    assert len(config.hosts) == 3
+
+
+def test_lazy_errors():
+    config = cfg.into(Config, DATA)
+
+    with pytest.raises(cfg.ConfigError) as err:
+        config.flags["broken"]
+
+    assert err.value.path == ["flags", "broken", "enabled"]
+
+    with pytest.raises(cfg.ConfigError) as err:
+        config.hosts[2]
+
+    assert str(err.value) == "hosts[2]: Expected str, got 3"
+
+    with pytest.raises(KeyError):
+        config.flags["missing"]
+
+    with pytest.raises(IndexError):
+        config.hosts[3]
+
+
+def test_lazy_structure():
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Config, {**DATA, "flags": ["search"]})
+
+    assert str(err.value) == "flags: Expected dict, got ['search']"
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Config, {**DATA, "hosts": "a"})
+
+    assert err.value.path == ["hosts"]
+
+
+def test_lazy_keys():
+    class Hosts:
+        hosts: t.Annotated[
+            t.Dict[ipaddress.IPv4Address, int],
+            cfg.Lazy(),
+        ]
+
+    config = cfg.into(Hosts, {"hosts": {"10.0.0.1": 1}})
+
+    assert config.hosts[ipaddress.IPv4Address("10.0.0.1")] == 1
+
+    with pytest.raises(cfg.ConfigError) as err:
+        cfg.into(Hosts, {"hosts": {"10.0.0.1": 1, "nope": "x"}})
+
+    assert err.value.path == ["hosts", "nope"]
+
+
+def test_lazy_unsupported():
+    class Bad:
+        value: t.Annotated[t.Set[str], cfg.Lazy()]
+
+    with pytest.raises(TypeError):
+        cfg.into(Bad, {"value": []})
+
+
+def test_lazy_frozen():
+    data = {**DATA, "flags": {"search": {"enabled": True}}, "hosts": ["a"]}
+    config = cfg.into(Config, data, frozen=True)
+
+    assert config.flags == FrozenDict(
+        {"search": cfg.into(Flag, {"enabled": True}, frozen=True)}
+    )
+    assert list(config.hosts) == ["a"]
+    assert hash(config) == hash(cfg.into(Config, data, frozen=True))
+    assert copy.deepcopy(config) is config
+
+    with pytest.raises(TypeError):
+        config.flags["search"] = None  # type: ignore[index]
+
+    restored = pickle.loads(pickle.dumps(config))
+
+    assert restored.flags["search"].enabled is True
+    assert restored == config
+
+
+def test_lazy_to_data():
+    data = {**DATA, "flags": {"beta": {"enabled": False}}, "hosts": ["a"]}
+
+    assert cfg.to_data(cfg.into(Config, data)) == {
+        "flags": {"beta": {"enabled": False, "rollout": 1.0}},
+        "hosts": ["a"],
+        "name": "app",
+    }
+
+
+def test_lazy_replace():
+    data = {**DATA, "flags": {"beta": {"enabled": False}}, "hosts": ["a"]}
+    config = cfg.into(Config, data, frozen=True)
+    updated = cfg.replace(
+        config,
+        {"flags.beta.rollout": 0.25, "hosts[0]": "b"},
+    )
+
+    assert updated.flags["beta"].rollout == 0.25
+    assert list(updated.hosts) == ["b"]
+    assert config.flags["beta"].rollout == 1.0
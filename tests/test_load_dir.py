@@ -0,0 +1,117 @@
+import os
+import typing as t
+
+import pytest
+
+from configur8 import cfg
+
+
+class Database:
+    host: str
+    port: int = 5432
+
+
+class Config:
+    name: str
+    database: Database
+    features: t.List[str] = []
+    owners: t.Dict[str, str] = {}
+
+
+@pytest.fixture
+def conf_d(tmp_path):
+    (tmp_path / "00-base.yaml").write_text(
+        "name: app\n"
+        "database:\n"
+        "  host: localhost\n"
+        "features: [a]\n"
+        "owners:\n"
+        "  db: data\n"
+    )
+    (tmp_path / "10-database.yml").write_text("database:\n  port: 6432\n")
+    (tmp_path / "20-features.yaml").write_text("features: [b, c]\n")
+    (tmp_path / "30-owners.yaml").write_text("owners:\n  web: frontend\n")
+    (tmp_path / ".hidden.yaml").write_text("name: hidden\n")
+    (tmp_path / "README.md").write_text("not a fragment\n")
+    (tmp_path / "empty.yaml").write_text("")
+
+    return tmp_path
+
+
+def test_load_dir(conf_d):
+    config = cfg.load_dir(Config, str(conf_d))
+
+    assert config.name == "app"
+    assert config.database.host == "localhost"
+    assert config.database.port == 6432
+    assert config.features == ["b", "c"]
+    assert config.owners == {"db": "data", "web": "frontend"}
+
+
+def test_order(conf_d):
+    (conf_d / "99-override.yaml").write_text("name: override\n")
+
+    assert cfg.load_dir(Config, str(conf_d)).name == "override"
+
+
+def test_json(tmp_path):
+    (tmp_path / "a.json").write_text('{"name": "app"}')
+    (tmp_path / "b.json").write_text('{"database": {"host": "db"}}')
+    (tmp_path / "c.yaml").write_text("name: ignored\n")
+
+    config = cfg.load_dir(Config, str(tmp_path), format="json")
+
+    assert config.name == "app"
+    assert config.database.host == "db"
+
+
+def test_cache(conf_d, mocker):
+    cfg.load_dir(Config, str(conf_d))
+    read = mocker.spy(cfg, "read_fragment")
+
+    cfg.load_dir(Config, str(conf_d), frozen=True)
+
+    assert read.call_count == 0
+
+    path = conf_d / "10-database.yml"
+    path.write_text("database:\n  port: 7432\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    config = cfg.load_dir(Config, str(conf_d))
+
+    assert read.call_count == 1
+    assert config.database.port == 7432
+
+
+def test_cached_data_unchanged(conf_d):
+    first = cfg.load_dir(Config, str(conf_d))
+    first.owners["extra"] = "x"
+
+    assert "extra" not in cfg.load_dir(Config, str(conf_d)).owners
+
+
+def test_invalid(conf_d):
+    (conf_d / "50-port.yaml").write_text("database:\n  port: nope\n")
+
+    with pytest.raises(cfg.ConfigError) as exc:
+        cfg.load_dir(Config, str(conf_d))
+
+    assert exc.value.path == ["database", "port"]
+
+
+def test_not_a_mapping(conf_d):
+    (conf_d / "50-list.yaml").write_text("- a\n")
+
+    with pytest.raises(cfg.ConfigError) as exc:
+        cfg.load_dir(Config, str(conf_d))
+
+    assert "50-list.yaml" in str(exc.value)
+
+
+def test_merge():
+    base = {"a": {"b": 1, "c": [1]}, "d": 1}
+    other = {"a": {"c": [2]}, "e": 2}
+
+    assert cfg.merge(base, other) == {"a": {"b": 1, "c": [2]}, "d": 1, "e": 2}
+    assert base == {"a": {"b": 1, "c": [1]}, "d": 1}
@@ -0,0 +1,123 @@
+import os
+import typing as t
+
+import pytest
+
+from configur8 import cfg
+
+
+class Database:
+    host: str
+    port: int = 5432
+
+
+class Config:
+    name: str
+    debug: bool = False
+    workers: int
+    ratio: t.Optional[float] = None
+    database: Database
+    tags: t.List[str] = []
+
+
+FILES = {
+    "name": "app\n",
+    "debug": "true",
+    "workers": "4\n",
+    "ratio": "0.5",
+    "database": "host: db\nport: 6432\n",
+    "tags": "[a, b]",
+    "unrelated-key": "ignored",
+}
+
+
+def publish(path, files: t.Dict[str, str], version: str) -> None:
+    """
+    Update ``path`` the way the kubelet updates a mounted volume.
+    """
+    directory = path / f"..{version}"
+    directory.mkdir()
+
+    for name, contents in files.items():
+        (directory / name).write_text(contents)
+
+    tmp = path / "..data_tmp"
+    os.symlink(directory.name, tmp)
+    os.replace(tmp, path / "..data")
+
+    for name in files:
+        if not (path / name).is_symlink():
+            os.symlink(os.path.join("..data", name), path / name)
+
+
+@pytest.fixture
+def volume(tmp_path):
+    publish(tmp_path, FILES, "2024_01_01")
+
+    return tmp_path
+
+
+def test_load_volume(volume):
+    config = cfg.load_volume(Config, str(volume))
+
+    assert config.name == "app"
+    assert config.debug is True
+    assert config.workers == 4
+    assert config.ratio == 0.5
+    assert config.database.port == 6432
+    assert config.tags == ["a", "b"]
+
+
+def test_plain_directory(tmp_path):
+    (tmp_path / "name").write_text("app")
+    (tmp_path / "workers").write_text("2")
+    (tmp_path / "database").write_text("host: db")
+
+    config = cfg.load_volume(Config, str(tmp_path), frozen=True)
+
+    assert config.workers == 2
+    assert list(config.tags) == []
+
+
+def test_swap(volume, mocker):
+    cfg.load_volume(Config, str(volume))
+    scan = mocker.spy(cfg, "scan_volume")
+
+    assert cfg.load_volume(Config, str(volume)).workers == 4
+    assert scan.call_count == 0
+
+    publish(volume, {**FILES, "workers": "8"}, "2024_01_02")
+
+    assert cfg.load_volume(Config, str(volume)).workers == 8
+    assert scan.call_count == 1
+
+
+def test_plain_directory_changes(tmp_path):
+    (tmp_path / "name").write_text("app")
+    (tmp_path / "workers").write_text("2")
+    (tmp_path / "database").write_text("host: db")
+
+    assert cfg.load_volume(Config, str(tmp_path)).workers == 2
+
+    (tmp_path / "workers").write_text("16")
+
+    assert cfg.load_volume(Config, str(tmp_path)).workers == 16
+
+
+def test_hyphenated_names(tmp_path):
+    class Hyphens:
+        log_level: str
+
+    (tmp_path / "log-level").write_text("debug")
+
+    assert cfg.load_volume(Hyphens, str(tmp_path)).log_level == "debug"
+
+
+def test_invalid(volume):
+    publish(volume, {**FILES, "workers": "many"}, "2024_01_02")
+
+    with pytest.raises(cfg.ConfigError) as exc:
+        cfg.load_volume(Config, str(volume))
+
+    assert exc.value.path == ["workers"]
+    assert "not a valid integer" in str(exc.value)
@@ -0,0 +1,151 @@
+import typing as t
+
+import pytest
+
+from configur8 import cfg, env, metrics
+
+
+class Config:
+    name: str
+    port: int = 80
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    metrics.reset()
+
+    yield
+
+    metrics.reset()
+
+
+def value(name: str, **labels: str) -> t.Dict[str, t.Any]:
+    for sample in metrics.snapshot()[name]["samples"]:
+        if sample["labels"] == labels:
+            return t.cast(t.Dict[str, t.Any], sample)
+
+    raise AssertionError(f"No {name} sample with labels {labels!r}")
+
+
+def test_operations(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("name: app\n")
+
+    assert cfg.load(Config, str(path)).name == "app"
+
+    with pytest.raises(cfg.ConfigError):
+        cfg.into(Config, {"name": "app", "port": "http"})
+
+    ops = "configur8_operations"
+
+    assert value(ops, operation="load", result="ok")["value"] == 1
+    assert value(ops, operation="load", result="error")["value"] == 0
+    assert value(ops, operation="validate", result="ok")["value"] == 1
+    assert value(ops, operation="validate", result="error")["value"] == 1
+
+    durations = value(
+        "configur8_operation_duration_seconds",
+        operation="validate",
+    )
+
+    assert durations["count"] == 2
+    assert durations["sum"] > 0
+    assert durations["buckets"]["+Inf"] == 2
+
+
+def test_env_lookups(monkeypatch):
+    monkeypatch.setenv("NAME", "app")
+    monkeypatch.delenv("MISSING", raising=False)
+
+    assert env.str("NAME") == "app"
+    assert env.str("MISSING", "default") == "default"
+
+    with pytest.raises(env.MissingFromEnv):
+        env.str("MISSING")
+
+    lookups = "configur8_env_lookups"
+
+    assert value(lookups, result="found")["value"] == 1
+    assert value(lookups, result="missing")["value"] == 2
+
+
+def test_cache_requests(tmp_path):
+    (tmp_path / ".env").write_text("NAME=app\n")
+
+    with env.use_dotenv(str(tmp_path / ".env")):
+        pass
+
+    with env.use_dotenv(str(tmp_path / ".env")):
+        assert env.str("NAME") == "app"
+
+    requests = "configur8_cache_requests"
+
+    assert value(requests, cache="dotenv", result="hit")["value"] >= 1
+    assert value(requests, cache="dotenv", result="miss")["value"] <= 1
+
+
+def test_render():
+    cfg.into(Config, {"name": "app"})
+
+    text = metrics.render()
+
+    assert "# TYPE configur8_operations counter\n" in text
+    assert "# HELP configur8_operations Config operations" in text
+    assert (
+        'configur8_operations_total{operation="validate",result="ok"} 1\n'
+        in text
+    )
+    assert (
+        "configur8_operation_duration_seconds_bucket"
+        '{operation="validate",le="+Inf"} 1\n'
+    ) in text
+    assert (
+        'configur8_operation_duration_seconds_count{operation="validate"} 1\n'
+        in text
+    )
+    assert text.endswith("# EOF\n")
+
+
+def test_registry():
+    registry = metrics.Registry()
+    counter = registry.register(
+        metrics.Counter("requests", "Requests.", ("path",))
+    )
+    histogram = registry.register(
+        metrics.Histogram("latency", "Latency.", buckets=(0.1, 1.0))
+    )
+
+    counter.inc('/a"b\\c\n')
+    counter.labels("/").inc(2)
+    histogram.labels().observe(0.5)
+    histogram.labels().observe(2.0)
+
+    assert registry.render().splitlines() == [
+        "# TYPE requests counter",
+        "# HELP requests Requests.",
+        'requests_total{path="/"} 2',
+        'requests_total{path="/a\\"b\\\\c\\n"} 1',
+        "# TYPE latency histogram",
+        "# HELP latency Latency.",
+        'latency_bucket{le="0.1"} 0',
+        'latency_bucket{le="1.0"} 1',
+        'latency_bucket{le="+Inf"} 2',
+        "latency_count 2",
+        "latency_sum 2.5",
+        "# EOF",
+    ]
+
+    with pytest.raises(ValueError):
+        registry.register(metrics.Counter("requests", "Again."))
+
+    with pytest.raises(ValueError):
+        counter.labels()
+
+    registry.reset()
+
+    assert registry.snapshot()["requests"]["samples"][0]["value"] == 0
+
+
+def test_metric_abstract():
+    with pytest.raises(TypeError):
+        metrics.Metric("metric", "Metric.")  # type: ignore[abstract]
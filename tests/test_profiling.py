@@ -0,0 +1,82 @@
+import typing as t
+
+from configur8 import cfg
+
+
+class Upstream:
+    host: str
+    port: int
+
+
+class Socket:
+    socket: str
+
+
+class Route:
+    path: str
+    upstream: Socket | Upstream
+
+
+class Config:
+    routes: t.List[Route]
+
+
+DATA = """
+routes:
+    - path: /foo
+      upstream:
+          host: localhost
+          port: 80
+    - path: /bar
+      upstream:
+          socket: /var/run/bar.sock
+"""
+
+
+def test_profile():
+    with cfg.profile() as profile:
+        cfg.parse(Config, DATA)
+
+    assert set(profile.phases) == {"decode", "validate"}
+
+    assert profile.classes["Config"].count == 1
+    assert profile.classes["Route"].count == 2
+    assert profile.classes["Upstream"].count == 1
+    assert profile.classes["Config"].total >= profile.classes["Route"].total
+    assert profile.classes["Config"].own <= profile.classes["Config"].total
+
+    assert profile.paths[""].count == 1
+    assert profile.paths["routes[*]"].count == 2
+    assert profile.paths["routes[*].upstream"].count == 3
+
+    (union,) = profile.unions.values()
+
+    assert union.attempts == 3
+    assert union.failures == 1
+    assert union.misses == 0
+
+
+def test_profile_report():
+    with cfg.profile() as profile:
+        cfg.parse(Config, DATA)
+
+    data = profile.to_dict()
+
+    assert data["classes"][0]["name"] == "Config"
+    assert [row["name"] for row in data["paths"]][0] == ""
+
+    report = profile.report(limit=1)
+
+    assert "routes[*]" not in report
+    assert "Config" in report
+    assert "decode" in report
+
+
+def test_profile_inactive():
+    with cfg.profile() as profile:
+        pass
+
+    cfg.parse(Config, DATA)
+
+    assert profile.classes == {}
+    assert profile.phases == {}
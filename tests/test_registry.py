@@ -0,0 +1,232 @@
+import datetime
+import decimal
+import enum
+import ipaddress
+import typing as t
+
+import pytest
+
+from configur8 import cfg, path, registry, url
+
+
+class Config:
+    price: decimal.Decimal
+    starts: datetime.datetime
+    day: datetime.date
+    at: datetime.time
+    timeout: datetime.timedelta
+    address: ipaddress.IPv4Address
+    network: ipaddress.IPv6Network
+    endpoint: url.Url
+    key: path.Path
+    retry: t.Optional[datetime.timedelta] = None
+
+
+DATA = """
+price: "10.10"
+starts: 2024-01-02T03:04:05
+day: 2024-01-02
+at: "12:30:00"
+timeout: 1m30s
+address: 10.0.0.1
+network: "2001:db8::/32"
+endpoint: https://example.com/api
+key: /var/run/secrets/key
+"""
+
+
+def test_builtin_types():
+    config = cfg.parse(Config, DATA)
+
+    assert config.price == decimal.Decimal("10.10")
+    assert config.starts == datetime.datetime(2024, 1, 2, 3, 4, 5)
+    assert config.day == datetime.date(2024, 1, 2)
+    assert config.at == datetime.time(12, 30)
+    assert config.timeout == datetime.timedelta(seconds=90)
+    assert config.address == ipaddress.IPv4Address("10.0.0.1")
+    assert config.network == ipaddress.IPv6Network("2001:db8::/32")
+    assert isinstance(config.endpoint, url.Url)
+    assert config.endpoint.host == "example.com"
+    assert config.key == "/var/run/secrets/key"
+    assert config.retry is None
+
+
+def test_round_trip():
+    config = cfg.parse(Config, DATA)
+    data = cfg.to_data(config)
+
+    assert data["price"] == "10.10"
+    assert data["starts"] == "2024-01-02T03:04:05"
+    assert data["timeout"] == 90.0
+    assert data["address"] == "10.0.0.1"
+
+    dumped = cfg.dump(config)
+
+    assert dumped is not None
+    assert cfg.to_data(cfg.parse(Config, dumped)) == data
+    assert cfg.to_data(cfg.into(Config, data, frozen=True)) == data
+
+
+@pytest.mark.parametrize(
+    "field,value",
+    [
+        ("price", "ten"),
+        ("price", True),
+        ("starts", "yesterday"),
+        ("day", "2024-01-02T03:04:05"),
+        ("timeout", "soon"),
+        ("address", "10.0.0.256"),
+        ("endpoint", 42),
+    ],
+)
+def test_invalid(field, value):
+    data = cfg.decode(DATA)
+    data[field] = value
+
+    with pytest.raises(cfg.ConfigError) as exc:
+        cfg.into(Config, data)
+
+    assert exc.value.path == [field]
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (30, 30),
+        (1.5, 1.5),
+        ("45", 45),
+        ("2h", 7200),
+        ("1d1h1m1s", 90061),
+        ("250ms", 0.25),
+    ],
+)
+def test_timedelta(value, expected):
+    assert registry.parse_timedelta(value).total_seconds() == expected
+
+
+class Money:
+    def __init__(self, cents: int) -> None:
+        self.cents = cents
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Money) and other.cents == self.cents
+
+    @classmethod
+    def parse(cls, value: t.Any) -> "Money":
+        return cls(round(float(value) * 100))
+
+    def __str__(self) -> str:
+        return f"{self.cents / 100:.2f}"
+
+
+class Euros(Money):
+    pass
+
+
+class Wallet:
+    balance: Money
+    savings: t.List[Euros]
+
+
+@pytest.fixture
+def money():
+    cfg.register_type(Money, Money.parse, encode=str)
+
+    yield
+
+    del registry.HANDLERS[Money]
+    registry.RESOLVED.clear()
+    cfg.ENCODERS.clear()
+
+
+def test_register_type(money):
+    wallet = cfg.into(Wallet, {"balance": "12.50", "savings": [1, "2.5"]})
+
+    assert wallet.balance == Money(1250)
+    assert [x.cents for x in wallet.savings] == [100, 250]
+    assert cfg.to_data(wallet) == {
+        "balance": "12.50",
+        "savings": ["1.00", "2.50"],
+    }
+
+
+def test_register_type_error(money):
+    with pytest.raises(cfg.ConfigError) as exc:
+        cfg.into(Wallet, {"balance": "lots", "savings": []})
+
+    assert exc.value.path == ["balance"]
+    assert "Expected Money" in str(exc.value)
+
+
+def test_mro_cached(money):
+    assert registry.lookup(Euros) is registry.HANDLERS[Money]
+    assert registry.RESOLVED[Euros] is registry.HANDLERS[Money]
+    assert registry.lookup(Wallet) is None
+    assert Wallet in registry.RESOLVED
+
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Level(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+class Perm(enum.Flag):
+    READ = 1
+    WRITE = 2
+
+
+class Palette:
+    primary: Color
+    others: t.List[Color] = []
+    level: Level = Level.LOW
+    perm: t.Optional[Perm] = None
+
+
+def test_enum():
+    palette = cfg.into(
+        Palette,
+        {"primary": "red", "others": ["GREEN", "green"], "level": 2},
+    )
+
+    assert palette.primary is Color.RED
+    assert palette.others == [Color.GREEN, Color.GREEN]
+    assert palette.level is Level.HIGH
+    assert cfg.to_data(palette) == {
+        "primary": "red",
+        "others": ["green", "green"],
+        "level": 2,
+        "perm": None,
+    }
+
+
+def test_enum_name():
+    assert cfg.into(Palette, {"primary": "RED", "level": "HIGH"}).level == 2
+
+
+def test_enum_flag():
+    palette = cfg.into(Palette, {"primary": "red", "perm": 3})
+
+    assert palette.perm == Perm.READ | Perm.WRITE
+
+
+@pytest.mark.parametrize("value", ["purple", 1, ["red"]])
+def test_enum_invalid(value):
+    with pytest.raises(cfg.ConfigError) as exc:
+        cfg.into(Palette, {"primary": value})
+
+    assert exc.value.path == ["primary"]
+    assert "Expected Color" in str(exc.value)
+
+
+def test_frozen_hash():
+    config = cfg.parse(Config, DATA, frozen=True)
+
+    assert hash(config) == hash(cfg.parse(Config, DATA, frozen=True))
+    assert hash(config.endpoint) == hash("https://example.com/api")
+    assert hash(config.key) == hash("/var/run/secrets/key")